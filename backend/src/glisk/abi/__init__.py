@@ -5,15 +5,20 @@ ABIs are stored as JSON files in this directory and loaded dynamically at runtim
 """
 
 import json
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_contract_abi(contract_name: str = "GliskNFT") -> list[dict]:
     """Load contract ABI from package resources.
 
     ABIs are stored in backend/src/glisk/abi/ directory and are synced from
     Foundry build output using the sync-abi.sh script in the repository root.
 
+    The parsed ABI is cached per contract name, so callers share one list and
+    must not mutate it.
+
     Args:
         contract_name: Name of the contract (default: "GliskNFT")
 
@@ -13,6 +13,8 @@ from web3 import Web3
 
 from glisk.core.config import Settings
 from glisk.services.blockchain.alchemy_signature import validate_alchemy_signature
+from glisk.services.ipfs.pinata_client import PinataClient
+from glisk.services.x_oauth import XOAuthService
 from glisk.uow import UnitOfWork
 
 
@@ -106,7 +108,7 @@ def get_uow_factory(request: Request) -> Callable[[], UnitOfWork]:
     Example:
         >>> @router.post("/endpoint")
         >>> async def endpoint(uow_factory=Depends(get_uow_factory)):
-        ...     async with await uow_factory() as uow:
+        ...     async with uow_factory() as uow:
         ...         await uow.authors.get_by_wallet(wallet)
     """
     return request.app.state.uow_factory
@@ -130,3 +132,33 @@ def get_w3(request: Request) -> Web3 | None:
         ...         result = contract.functions.someMethod().call()
     """
     return request.app.state.w3
+
+
+def get_pinata(request: Request) -> PinataClient:
+    """Get the application-scoped Pinata client from app state.
+
+    Args:
+        request: FastAPI Request object (contains app.state)
+
+    Returns:
+        PinataClient created in the app lifespan (shared connection pool,
+        upload semaphore and retry policy; closed on shutdown)
+
+    Example:
+        >>> @router.post("/endpoint")
+        >>> async def endpoint(pinata: PinataClient = Depends(get_pinata)):
+        ...     cid = await pinata.upload_metadata(metadata, token_id)
+    """
+    return request.app.state.pinata
+
+
+def get_x_oauth_service(request: Request) -> XOAuthService:
+    """Get the application-scoped X OAuth service from app state.
+
+    Args:
+        request: FastAPI Request object (contains app.state)
+
+    Returns:
+        XOAuthService created in the app lifespan (shared HTTP connection pool)
+    """
+    return request.app.state.x_oauth
@@ -18,6 +18,7 @@ from web3 import Web3
 
 from glisk.api.dependencies import get_uow_factory, get_w3
 from glisk.services.wallet_signature import verify_wallet_signature
+from glisk.workers.image_generation_worker import invalidate_author_prompt
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api/authors", tags=["authors"])
@@ -233,7 +234,7 @@ async def update_author_prompt(
     """
     try:
         # Step 1: Verify wallet signature (proves wallet ownership)
-        is_valid_signature = verify_wallet_signature(
+        is_valid_signature = await verify_wallet_signature(
             wallet_address=request.wallet_address,
             message=request.message,
             signature=request.signature,
@@ -260,7 +261,7 @@ async def update_author_prompt(
         )
 
         # Step 2: Update or create author with prompt (UoW handles transaction)
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             try:
                 # Upsert author prompt (creates new or updates existing)
                 author = await uow.authors.upsert_author_prompt(
@@ -277,11 +278,6 @@ async def update_author_prompt(
                     prompt_length=len(request.prompt_text),
                 )
 
-                return UpdatePromptResponse(
-                    success=True,
-                    has_prompt=True,
-                )
-
             except ValueError as e:
                 # Validation error from Author model (prompt length, wallet format, etc.)
                 logger.warning(
@@ -294,6 +290,14 @@ async def update_author_prompt(
                     detail=str(e),
                 )
 
+        # Committed - make the image worker use the new prompt for the next mint
+        invalidate_author_prompt(author.id)
+
+        return UpdatePromptResponse(
+            success=True,
+            has_prompt=True,
+        )
+
     except HTTPException:
         # Re-raise HTTPExceptions (already have correct status codes)
         raise
@@ -356,7 +360,7 @@ async def get_author_leaderboard(
         logger.debug("leaderboard_request")
 
         # Query leaderboard data
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             # Get top 50 authors by token count
             leaderboard_data = await uow.authors.get_author_leaderboard()
 
@@ -454,7 +458,7 @@ async def get_author_status(
             return AuthorStatusResponse(has_prompt=False)
 
         # Query author by wallet (case-insensitive)
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             author = await uow.authors.get_by_wallet(checksummed_address)
 
             if author is None:
@@ -573,7 +577,7 @@ async def get_author_tokens(
             return TokensResponse(tokens=[], total=0, offset=offset, limit=limit)
 
         # Step 2: Query author and tokens
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             # Get author by wallet address
             author = await uow.authors.get_by_wallet(checksummed_address)
 
@@ -175,7 +175,7 @@ async def link_farcaster_account(
             )
 
         # Step 2: Verify wallet signature (proves wallet ownership)
-        is_valid_wallet_signature = verify_wallet_signature(
+        is_valid_wallet_signature = await verify_wallet_signature(
             wallet_address=checksummed_address,
             message=request.wallet_message,
             signature=request.wallet_signature,
@@ -231,7 +231,7 @@ async def link_farcaster_account(
         )
 
         # Step 4: Link Farcaster handle to author profile
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             try:
                 author = await uow.authors.upsert_farcaster_handle(
                     wallet_address=checksummed_address,
@@ -264,7 +264,7 @@ async def receive_alchemy_webhook(
         # Store event and create token (atomic transaction)
         try:
             logger.info("webhook.checking_duplicate", tx_hash=event_data["tx_hash"])
-            async with await uow_factory() as uow:
+            async with uow_factory() as uow:
                 # Check for duplicates
                 event_exists = await uow.mint_events.exists(
                     tx_hash=event_data["tx_hash"],
@@ -334,6 +334,9 @@ async def receive_alchemy_webhook(
                     await uow.tokens.add(token)
                     created_token_ids.append(token_id)
 
+                # Wake the image generation worker once this transaction commits
+                await uow.tokens.notify_mint_detected()
+
                 logger.info(
                     "webhook.tokens_added",
                     count=len(created_token_ids),
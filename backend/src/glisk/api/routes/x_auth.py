@@ -9,16 +9,18 @@ Endpoints:
 - GET /api/authors/x/callback - Handle OAuth redirect, exchange code for username
 """
 
+import asyncio
+
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel, Field
 from web3 import Web3
 
-from glisk.api.dependencies import get_uow_factory, get_w3
+from glisk.api.dependencies import get_uow_factory, get_w3, get_x_oauth_service
 from glisk.core.config import Settings
 from glisk.services.wallet_signature import verify_wallet_signature
-from glisk.services.x_oauth import XOAuthService, get_oauth_state, oauth_state_storage
+from glisk.services.x_oauth import OAUTH_STATE_TTL_SECONDS, XOAuthService, get_oauth_state
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api/authors/x", tags=["x-oauth"])
@@ -70,9 +72,9 @@ class XAuthStartResponse(BaseModel):
 @router.post("/auth/start", response_model=XAuthStartResponse, status_code=status.HTTP_200_OK)
 async def start_x_oauth(
     request: XAuthStartRequest,
-    settings: Settings = Depends(get_settings),
     uow_factory=Depends(get_uow_factory),
     w3: Web3 | None = Depends(get_w3),
+    oauth_service: XOAuthService = Depends(get_x_oauth_service),
 ) -> XAuthStartResponse:
     """Initiate X (Twitter) OAuth flow with wallet signature verification.
 
@@ -88,8 +90,9 @@ async def start_x_oauth(
 
     Args:
         request: OAuth start request with wallet address, message, and signature
-        settings: Application settings (injected dependency)
         uow_factory: UnitOfWork factory (injected dependency)
+        w3: Web3 instance for ERC-1271 verification (injected dependency)
+        oauth_service: Shared X OAuth service (injected dependency)
 
     Returns:
         XAuthStartResponse with authorization URL for X
@@ -128,7 +131,7 @@ async def start_x_oauth(
             )
 
         # Step 2: Verify wallet signature (proves wallet ownership)
-        is_valid_signature = verify_wallet_signature(
+        is_valid_signature = await verify_wallet_signature(
             wallet_address=checksummed_address,
             message=request.message,
             signature=request.signature,
@@ -152,13 +155,7 @@ async def start_x_oauth(
             wallet_address=checksummed_address,
         )
 
-        # Step 3: Initialize OAuth service and generate authorization URL
-        oauth_service = XOAuthService(
-            client_id=settings.x_client_id,
-            client_secret=settings.x_client_secret,
-            redirect_uri=settings.x_redirect_uri,
-        )
-
+        # Step 3: Generate authorization URL
         authorization_url = oauth_service.build_authorization_url(
             wallet_address=checksummed_address
         )
@@ -198,6 +195,7 @@ async def x_oauth_callback(
     ),
     settings: Settings = Depends(get_settings),
     uow_factory=Depends(get_uow_factory),
+    oauth_service: XOAuthService = Depends(get_x_oauth_service),
 ) -> RedirectResponse:
     """Handle OAuth callback from X after user authorization.
 
@@ -209,7 +207,7 @@ async def x_oauth_callback(
     - State parameter validation (CSRF protection)
     - 5-minute TTL for OAuth state
     - Access token discarded immediately after use
-    - In-memory state cleanup after processing
+    - OAuth state is single-use (consumed by get_oauth_state)
 
     Args:
         code: Authorization code from X (valid 30 seconds)
@@ -218,6 +216,7 @@ async def x_oauth_callback(
         error_description: Human-readable error description
         settings: Application settings (injected dependency)
         uow_factory: UnitOfWork factory (injected dependency)
+        oauth_service: Shared X OAuth service (injected dependency)
 
     Returns:
         RedirectResponse to frontend success or error page
@@ -255,13 +254,15 @@ async def x_oauth_callback(
         )
 
     try:
-        # Step 3: Validate state parameter (CSRF protection)
+        # Step 3: Validate and consume state parameter (CSRF protection, single use)
         oauth_state = get_oauth_state(state)
 
         if not oauth_state:
+            # Unknown, already used, or expired (TTL: OAUTH_STATE_TTL_SECONDS)
             logger.error(
                 "x_oauth_state_invalid",
                 state_preview=state[:8] + "...",
+                ttl_seconds=OAUTH_STATE_TTL_SECONDS,
             )
             return RedirectResponse(
                 url=f"{frontend_base_url}/profile?tab=author&x_linked=false&error=state_mismatch",
@@ -274,22 +275,23 @@ async def x_oauth_callback(
             state_preview=state[:8] + "...",
         )
 
-        # Step 4: Initialize OAuth service and exchange code for token
-        oauth_service = XOAuthService(
-            client_id=settings.x_client_id,
-            client_secret=settings.x_client_secret,
-            redirect_uri=settings.x_redirect_uri,
-        )
-
-        try:
-            # Exchange authorization code for access token
+        # Step 4+5: Exchange code for username on X while looking up the author.
+        # The two X round-trips are sequential (username needs the token), but the
+        # DB lookup overlaps with them instead of starting only after both finish.
+        # No session is held while waiting on X; the write gets its own short UoW.
+        async def fetch_x_username() -> str:
             access_token = await oauth_service.exchange_code_for_token(
                 code=code,
                 code_verifier=oauth_state.code_verifier,
             )
+            return await oauth_service.fetch_username(access_token)
 
-            # Fetch username from X API
-            username = await oauth_service.fetch_username(access_token)
+        username_task = asyncio.create_task(fetch_x_username())
+        try:
+            async with uow_factory() as uow:
+                existing_author = await uow.authors.get_by_wallet(oauth_state.wallet_address)
+
+            username = await username_task
 
             logger.info(
                 "x_username_fetched",
@@ -304,53 +306,45 @@ async def x_oauth_callback(
                 wallet_address=oauth_state.wallet_address,
                 error=str(e),
             )
-            # Cleanup state before redirecting to error
-            del oauth_state_storage[state]
             return RedirectResponse(
                 url=f"{frontend_base_url}/profile?tab=author&x_linked=false&error=token_exchange_failed",
                 status_code=status.HTTP_302_FOUND,
             )
 
-        # Step 5: Update author with X handle
-        async with await uow_factory() as uow:
-            try:
-                author = await uow.authors.upsert_x_handle(
-                    wallet_address=oauth_state.wallet_address,
-                    twitter_handle=username,
-                )
+        finally:
+            # No-op once finished; stops the X calls if the DB lookup failed
+            username_task.cancel()
 
-                logger.info(
-                    "x_account_linked",
+        # Update author with X handle
+        try:
+            async with uow_factory() as uow:
+                author = await uow.authors.set_x_handle(
+                    existing_author,
                     wallet_address=oauth_state.wallet_address,
                     twitter_handle=username,
-                    author_id=str(author.id),
-                )
-
-            except ValueError as e:
-                # Validation error from Author model
-                logger.error(
-                    "x_handle_validation_error",
-                    wallet_address=oauth_state.wallet_address,
-                    username=username,
-                    error=str(e),
-                )
-                # Cleanup state before redirecting to error
-                del oauth_state_storage[state]
-                return RedirectResponse(
-                    url=f"{frontend_base_url}/profile?tab=author&x_linked=false&error=validation_failed",
-                    status_code=status.HTTP_302_FOUND,
                 )
 
-        # Step 6: Cleanup OAuth state (one-time use)
-        del oauth_state_storage[state]
+            logger.info(
+                "x_account_linked",
+                wallet_address=oauth_state.wallet_address,
+                twitter_handle=username,
+                author_id=str(author.id),
+            )
 
-        logger.info(
-            "x_oauth_state_cleaned_up",
-            state_preview=state[:8] + "...",
-            remaining_states=len(oauth_state_storage),
-        )
+        except ValueError as e:
+            # Validation error from Author model
+            logger.error(
+                "x_handle_validation_error",
+                wallet_address=oauth_state.wallet_address,
+                username=username,
+                error=str(e),
+            )
+            return RedirectResponse(
+                url=f"{frontend_base_url}/profile?tab=author&x_linked=false&error=validation_failed",
+                status_code=status.HTTP_302_FOUND,
+            )
 
-        # Step 7: Redirect to frontend success page
+        # Step 6: Redirect to frontend success page
         return RedirectResponse(
             url=f"{frontend_base_url}/profile?tab=author&x_linked=true&username={username}",
             status_code=status.HTTP_302_FOUND,
@@ -364,10 +358,6 @@ async def x_oauth_callback(
             error_type=type(e).__name__,
             state_preview=state[:8] + "..." if state else "None",
         )
-        # Cleanup state if exists
-        if state and state in oauth_state_storage:
-            del oauth_state_storage[state]
-
         return RedirectResponse(
             url=f"{frontend_base_url}/profile?tab=author&x_linked=false&error=unexpected_error",
             status_code=status.HTTP_302_FOUND,
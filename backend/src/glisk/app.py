@@ -3,18 +3,26 @@
 # Import timezone enforcement (sets TZ=UTC)
 import asyncio
 from contextlib import asynccontextmanager
+from functools import partial
 
 import structlog
 from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
-from web3 import Web3
 
 from glisk.api.routes import authors, farcaster_auth, webhooks, x_auth
 from glisk.core import timezone  # noqa: F401
 from glisk.core.config import Settings, configure_logging
 from glisk.core.database import setup_db_session
+from glisk.services.blockchain.provider import create_web3, get_rpc_url
 from glisk.services.blockchain.token_recovery import TokenRecoveryService
+from glisk.services.ipfs.pinata_client import PinataClient
+from glisk.services.wallet_signature import check_keccak_backend
+from glisk.services.x_oauth import (
+    XOAuthService,
+    check_sha256,
+    run_oauth_state_sweeper,
+)
 from glisk.uow import create_uow_factory
 from glisk.workers.image_generation_worker import run_image_generation_worker
 from glisk.workers.ipfs_upload_worker import run_ipfs_upload_worker
@@ -114,6 +122,11 @@ async def lifespan(app: FastAPI):
     # Configure logging
     configure_logging(settings)
 
+    # Fail fast if the keccak backend (used by signature verification) is broken
+    logger.info("startup.keccak_backend", backend=check_keccak_backend())
+    # Same for hashlib sha256 (PKCE challenges)
+    check_sha256()
+
     # Setup database session factory
     session_factory = setup_db_session(settings.database_url, settings.db_pool_size)
 
@@ -121,15 +134,11 @@ async def lifespan(app: FastAPI):
     uow_factory = create_uow_factory(session_factory)
 
     # Initialize Web3 connection for blockchain interactions
-    network_url_mapping = {
-        "BASE_SEPOLIA": f"https://base-sepolia.g.alchemy.com/v2/{settings.alchemy_api_key}",
-        "BASE_MAINNET": f"https://base-mainnet.g.alchemy.com/v2/{settings.alchemy_api_key}",
-    }
+    alchemy_url = get_rpc_url(settings)
 
     w3 = None
-    if settings.network in network_url_mapping:
-        alchemy_url = network_url_mapping[settings.network]
-        w3 = Web3(Web3.HTTPProvider(alchemy_url))
+    if alchemy_url is not None:
+        w3 = create_web3(alchemy_url)
         if not w3.is_connected():
             logger.warning("startup.web3_connection_failed", url=alchemy_url)
             w3 = None
@@ -141,6 +150,27 @@ async def lifespan(app: FastAPI):
     app.state.uow_factory = uow_factory
     app.state.w3 = w3  # For ERC-1271 signature verification
 
+    # Application-scoped Pinata client: one keep-alive pool, upload semaphore and
+    # retry policy shared by the IPFS worker and any route (via get_pinata)
+    pinata = PinataClient(
+        jwt_token=settings.pinata_jwt,
+        gateway_domain=settings.pinata_gateway,
+        max_concurrent_uploads=settings.pinata_max_concurrent_uploads,
+        requests_per_minute=settings.pinata_requests_per_minute,
+    )
+    app.state.pinata = pinata
+
+    # Application-scoped X OAuth service (pooled keep-alive client to api.x.com)
+    x_oauth = XOAuthService(
+        client_id=settings.x_client_id,
+        client_secret=settings.x_client_secret,
+        redirect_uri=settings.x_redirect_uri,
+    )
+    app.state.x_oauth = x_oauth
+
+    # Purge expired OAuth states in the background (not on the request path)
+    oauth_sweeper_task = asyncio.create_task(run_oauth_state_sweeper())
+
     # Run token recovery before starting workers (004-recovery-1-nexttokenid)
     # This ensures database is consistent with on-chain state before workers start processing
     try:
@@ -153,7 +183,7 @@ async def lifespan(app: FastAPI):
             )
 
             # Run recovery
-            async with await uow_factory() as uow:
+            async with uow_factory() as uow:
                 result = await recovery_service.recover_missing_tokens(
                     uow=uow,
                     limit=settings.recovery_batch_size,
@@ -188,7 +218,11 @@ async def lifespan(app: FastAPI):
         run_image_generation_worker, session_factory, settings, "image_generation", shutdown_event
     )
     ipfs_worker_task = create_resilient_worker(
-        run_ipfs_upload_worker, session_factory, settings, "ipfs_upload", shutdown_event
+        partial(run_ipfs_upload_worker, pinata=pinata),
+        session_factory,
+        settings,
+        "ipfs_upload",
+        shutdown_event,
     )
     reveal_worker_task = create_resilient_worker(
         run_reveal_worker, session_factory, settings, "reveal", shutdown_event
@@ -206,15 +240,21 @@ async def lifespan(app: FastAPI):
     image_worker_task.cancel()
     ipfs_worker_task.cancel()
     reveal_worker_task.cancel()
+    oauth_sweeper_task.cancel()
 
     # Wait for cancellation to complete (ignore CancelledError)
     await asyncio.gather(
         image_worker_task,
         ipfs_worker_task,
         reveal_worker_task,
+        oauth_sweeper_task,
         return_exceptions=True,
     )
 
+    # Close HTTP connection pools (after workers stop using them)
+    await pinata.aclose()
+    await x_oauth.aclose()
+
     # Close database connection pool
     # Note: async_sessionmaker doesn't have close_all(), engine cleanup happens automatically
 
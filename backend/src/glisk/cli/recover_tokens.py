@@ -22,11 +22,11 @@ import sys
 from argparse import ArgumentParser, Namespace
 
 import structlog
-from web3 import Web3
 
 from glisk.core import timezone  # noqa: F401
 from glisk.core.config import Settings, configure_logging
 from glisk.core.database import setup_db_session
+from glisk.services.blockchain.provider import create_web3, get_rpc_url
 from glisk.services.blockchain.token_recovery import TokenRecoveryService
 from glisk.services.exceptions import RecoveryError
 from glisk.uow import create_uow_factory
@@ -89,18 +89,14 @@ async def async_main() -> int:
     )
 
     # Initialize Web3 connection
-    network_url_mapping = {
-        "BASE_SEPOLIA": f"https://base-sepolia.g.alchemy.com/v2/{settings.alchemy_api_key}",
-        "BASE_MAINNET": f"https://base-mainnet.g.alchemy.com/v2/{settings.alchemy_api_key}",
-    }
+    alchemy_url = get_rpc_url(settings)
 
-    if settings.network not in network_url_mapping:
+    if alchemy_url is None:
         logger.error("cli.unsupported_network", network=settings.network)
         print(f"Error: Unsupported network {settings.network}", file=sys.stderr)
         return 1
 
-    alchemy_url = network_url_mapping[settings.network]
-    w3 = Web3(Web3.HTTPProvider(alchemy_url))
+    w3 = create_web3(alchemy_url)
 
     if not w3.is_connected():
         logger.error("cli.connection_failed", alchemy_url=alchemy_url)
@@ -122,7 +118,7 @@ async def async_main() -> int:
 
     try:
         # Execute recovery
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             result = await recovery_service.recover_missing_tokens(
                 uow=uow,
                 limit=args.limit,
@@ -1,9 +1,17 @@
 """Application configuration using Pydantic BaseSettings."""
 
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
 import structlog
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from glisk.services.image_generation.prompt_validator import validate_prompt
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -42,6 +50,7 @@ class Settings(BaseSettings):
     replicate_model_version: str = Field(
         default="black-forest-labs/flux-schnell", alias="REPLICATE_MODEL_VERSION"
     )
+    replicate_max_concurrency: int = Field(default=8, alias="REPLICATE_MAX_CONCURRENCY")
     fallback_censored_prompt: str = Field(
         default=(
             "Cute kittens and flowers in a peaceful garden, "
@@ -62,6 +71,8 @@ class Settings(BaseSettings):
     # IPFS Upload (Pinata) - 003-003d-ipfs-reveal
     pinata_jwt: str = Field(default="", alias="PINATA_JWT")
     pinata_gateway: str = Field(default="gateway.pinata.cloud", alias="PINATA_GATEWAY")
+    pinata_max_concurrent_uploads: int = Field(default=3, alias="PINATA_MAX_CONCURRENT_UPLOADS")
+    pinata_requests_per_minute: int = Field(default=60, alias="PINATA_REQUESTS_PER_MINUTE")
 
     # Blockchain Keeper - 003-003d-ipfs-reveal
     keeper_private_key: str = Field(default="", alias="KEEPER_PRIVATE_KEY")
@@ -99,6 +110,15 @@ class Settings(BaseSettings):
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @field_validator("default_prompt", "fallback_censored_prompt")
+    @classmethod
+    def validate_static_prompts(cls, value: str) -> str:
+        """Validate configured prompts once at load time.
+
+        The image generation worker sends these without re-validating per token.
+        """
+        return validate_prompt(value)
+
     @model_validator(mode="after")
     def validate_required_config(self) -> "Settings":
         """Validate required configuration on startup.
@@ -145,14 +165,51 @@ class Settings(BaseSettings):
         return self
 
 
+# Background thread writing queued production log lines to stdout
+_log_listener: QueueListener | None = None
+
+
+def _queued_stdout_logger() -> logging.Logger:
+    """Return a stdlib logger whose output is written by a QueueListener thread.
+
+    The event loop only enqueues the rendered line; the blocking stdout write
+    happens off-loop. Replaces any listener from an earlier call.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = QueueListener(log_queue, stdout_handler)
+    _log_listener.start()
+    # Flush what is still queued on interpreter exit
+    atexit.register(_log_listener.stop)
+
+    output = logging.getLogger("glisk.log_output")
+    output.handlers[:] = [QueueHandler(log_queue)]
+    output.setLevel(logging.DEBUG)  # Level filtering already done by structlog
+    output.propagate = False
+    return output
+
+
 def configure_logging(settings: Settings) -> None:
     """Configure structlog based on application environment.
 
-    - Production: JSON output for log aggregation
+    - Production: JSON output for log aggregation, written to stdout by a
+      QueueListener thread (no blocking writes on the event loop)
     - Development: Console output for human readability
+
+    Events below LOG_LEVEL are dropped by the bound logger itself (no-op methods),
+    before any processor runs.
     """
+    level = logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
+    wrapper_class = structlog.make_filtering_bound_logger(level)
+
     if settings.app_env == "production":
         # JSON output for production (log aggregation)
+        output = _queued_stdout_logger()
         structlog.configure(
             processors=[
                 structlog.stdlib.add_log_level,
@@ -161,9 +218,10 @@ def configure_logging(settings: Settings) -> None:
                 structlog.processors.format_exc_info,
                 structlog.processors.JSONRenderer(),
             ],
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=wrapper_class,
             context_class=dict,
-            logger_factory=structlog.PrintLoggerFactory(),
+            # Rendered lines go to the queue; the listener thread does the I/O
+            logger_factory=lambda *args: output,
             cache_logger_on_first_use=True,
         )
     else:
@@ -174,7 +232,7 @@ def configure_logging(settings: Settings) -> None:
                 structlog.processors.TimeStamper(fmt="iso"),
                 structlog.dev.ConsoleRenderer(),
             ],
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=wrapper_class,
             context_class=dict,
             logger_factory=structlog.PrintLoggerFactory(),
             cache_logger_on_first_use=True,
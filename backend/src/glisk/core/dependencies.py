@@ -30,5 +30,5 @@ async def get_uow(request: Request) -> AsyncGenerator[UnitOfWork, None]:
             return token
     """
     uow_factory = request.app.state.uow_factory
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         yield uow
@@ -18,6 +18,7 @@ class AuthorRepository:
     Methods:
     - get_by_id: Retrieve author by UUID
     - get_by_wallet: Case-insensitive wallet address lookup
+    - get_by_wallets: Case-insensitive bulk wallet lookup (single IN query)
     - add: Persist new author
     - list_all: Paginated list of all authors
     - upsert_author_prompt: Create or update author's prompt text
@@ -63,6 +64,71 @@ class AuthorRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_wallets(self, wallet_addresses: set[str]) -> dict[str, Author]:
+        """Retrieve authors for many wallet addresses in one query (case-insensitive).
+
+        Args:
+            wallet_addresses: Ethereum wallet addresses (0x...)
+
+        Returns:
+            Mapping of lowercased wallet address to Author (missing wallets omitted)
+        """
+        if not wallet_addresses:
+            return {}
+
+        result = await self.session.execute(
+            select(Author).where(
+                func.lower(Author.wallet_address).in_([w.lower() for w in wallet_addresses])
+            )
+        )
+        return {author.wallet_address.lower(): author for author in result.scalars().all()}
+
+    async def get_prompts_by_ids(self, author_ids: set[UUID]) -> dict[UUID, tuple[str | None, str]]:
+        """Retrieve prompt text and wallet for many authors in one query.
+
+        Selects only the two columns the image generation worker needs (no ORM
+        entities are loaded).
+
+        Args:
+            author_ids: Author primary keys
+
+        Returns:
+            Mapping of author ID to (prompt_text, wallet_address) (missing IDs omitted)
+        """
+        if not author_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(Author.id, Author.prompt_text, Author.wallet_address).where(
+                Author.id.in_(author_ids)  # type: ignore[attr-defined]
+            )
+        )
+        return {row.id: (row.prompt_text, row.wallet_address) for row in result}
+
+    async def get_social_handles_by_ids(
+        self, author_ids: set[UUID]
+    ) -> dict[UUID, tuple[str | None, str | None]]:
+        """Retrieve X and Farcaster handles for many authors in one query.
+
+        Used by the IPFS upload worker to build metadata for a whole batch
+        without a per-token author lookup.
+
+        Args:
+            author_ids: Author primary keys
+
+        Returns:
+            Mapping of author ID to (twitter_handle, farcaster_handle) (missing IDs omitted)
+        """
+        if not author_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(Author.id, Author.twitter_handle, Author.farcaster_handle).where(
+                Author.id.in_(author_ids)  # type: ignore[attr-defined]
+            )
+        )
+        return {row.id: (row.twitter_handle, row.farcaster_handle) for row in result}
+
     async def add(self, author: Author) -> Author:
         """Persist new author to database.
 
@@ -158,9 +224,31 @@ class AuthorRepository:
         """
         # Check if author already exists (case-insensitive lookup)
         existing_author = await self.get_by_wallet(wallet_address)
+        return await self.set_x_handle(existing_author, wallet_address, twitter_handle)
 
+    async def set_x_handle(
+        self, existing_author: Author | None, wallet_address: str, twitter_handle: str
+    ) -> Author:
+        """Write X (Twitter) handle for an author already looked up by wallet.
+
+        Second half of upsert_x_handle, for callers that fetched the author
+        themselves (e.g. concurrently with the X API calls). The author may come
+        from an earlier, already closed session; it is re-attached to this one.
+
+        Args:
+            existing_author: Result of get_by_wallet(wallet_address) (None if no author)
+            wallet_address: Ethereum wallet address (used when creating a new author)
+            twitter_handle: Verified X username from OAuth
+
+        Returns:
+            Author entity (newly created or updated)
+
+        Raises:
+            ValueError: If validation fails (invalid wallet format, twitter handle format, etc.)
+        """
         if existing_author:
             # Update existing author's twitter handle
+            self.session.add(existing_author)  # Re-attach if loaded in another session
             existing_author.twitter_handle = twitter_handle  # Triggers Pydantic validation
             await self.session.flush()
             await self.session.refresh(existing_author)  # Ensure fresh data
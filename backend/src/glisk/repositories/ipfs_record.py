@@ -5,7 +5,7 @@ Provides data access methods for IPFSUploadRecord entities.
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from glisk.models.ipfs_record import IPFSUploadRecord
@@ -107,3 +107,16 @@ class IPFSUploadRecordRepository:
             retry_count=retry_count,
         )
         return await self.add(record)
+
+    async def create_many(self, records: list[dict]) -> None:
+        """Insert several IPFS upload records in one executemany INSERT.
+
+        Each dict holds the same keys as create() (token_id, record_type, cid,
+        status, retry_count); id and created_at use the model defaults. No
+        entities are returned or added to the session.
+
+        Args:
+            records: One parameter dict per record
+        """
+        if records:
+            await self.session.execute(insert(IPFSUploadRecord), records)
@@ -5,11 +5,15 @@ Provides data access methods for Token entities with worker coordination via FOR
 
 from uuid import UUID
 
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from glisk.models.token import Token, TokenStatus
 
+# Postgres NOTIFY channel that wakes the image generation worker
+MINT_DETECTED_CHANNEL = "mint_detected"
+TOKEN_UPLOADING_CHANNEL = "token_uploading"
+
 
 class TokenRepository:
     """Repository for Token entities.
@@ -63,6 +67,82 @@ class TokenRepository:
         await self.session.flush()
         return token
 
+    async def bulk_insert_missing(
+        self, rows: list[tuple[int, UUID, TokenStatus, str | None]]
+    ) -> set[int]:
+        """Insert recovered tokens in one server-side statement, skipping existing IDs.
+
+        Rows are shipped as four parallel arrays and expanded with unnest(), so
+        the statement has a fixed number of bind parameters regardless of gap
+        size. ON CONFLICT (token_id) DO NOTHING skips tokens created concurrently
+        (e.g. by the mint webhook) instead of failing the whole batch.
+
+        Query explanation:
+        - unnest(...): Expand arrays into (token_id, author_id, status, metadata_cid) rows
+        - gen_random_uuid() / now(): Fill id and created_at server-side
+        - ON CONFLICT (token_id) DO NOTHING: Skip tokens that already exist
+        - RETURNING token_id: Report which rows were actually inserted
+
+        Args:
+            rows: (token_id, author_id, status, metadata_cid) per missing token
+
+        Returns:
+            On-chain token IDs that were actually inserted
+        """
+        if not rows:
+            return set()
+
+        token_ids, author_ids, statuses, metadata_cids = zip(*rows, strict=True)
+
+        query_text = """
+            INSERT INTO tokens_s0
+                (id, token_id, author_id, status, metadata_cid, generation_attempts, created_at)
+            SELECT
+                gen_random_uuid(), v.token_id, v.author_id, v.status, v.metadata_cid, 0,
+                now() AT TIME ZONE 'utc'
+            FROM unnest(
+                CAST(:token_ids AS integer[]),
+                CAST(:author_ids AS uuid[]),
+                CAST(:statuses AS tokenstatus[]),
+                CAST(:metadata_cids AS varchar[])
+            ) AS v(token_id, author_id, status, metadata_cid)
+            ON CONFLICT (token_id) DO NOTHING
+            RETURNING token_id
+        """
+
+        result = await self.session.execute(
+            text(query_text),
+            {
+                "token_ids": list(token_ids),
+                "author_ids": list(author_ids),
+                # Enum is stored by member name (e.g. 'DETECTED')
+                "statuses": [status.name for status in statuses],
+                "metadata_cids": list(metadata_cids),
+            },
+        )
+        return {row[0] for row in result.fetchall()}
+
+    async def notify_mint_detected(self) -> None:
+        """Queue a NOTIFY on MINT_DETECTED_CHANNEL for new 'detected' tokens.
+
+        Postgres delivers it when the current transaction commits (and drops it
+        on rollback), so the image generation worker wakes only once the
+        tokens are visible.
+        """
+        await self.session.execute(
+            text("SELECT pg_notify(:channel, '')"), {"channel": MINT_DETECTED_CHANNEL}
+        )
+
+    async def notify_token_uploading(self) -> None:
+        """Queue a NOTIFY on TOKEN_UPLOADING_CHANNEL for tokens moved to 'uploading'.
+
+        Delivered on commit like notify_mint_detected, waking the IPFS upload
+        worker once the generated image URLs are visible.
+        """
+        await self.session.execute(
+            text("SELECT pg_notify(:channel, '')"), {"channel": TOKEN_UPLOADING_CHANNEL}
+        )
+
     async def get_pending_for_generation(self, limit: int = 10) -> list[Token]:
         """Retrieve tokens pending image generation with row-level locking.
 
@@ -92,6 +172,88 @@ class TokenRepository:
         )
         return list(result.scalars().all())
 
+    async def claim_batch_for_generation(self, limit: int = 10) -> list[Token]:
+        """Lock and move the oldest detected tokens to generating in one statement.
+
+        Single round trip replacing get_pending_for_generation() + a separate
+        status UPDATE:
+
+            WITH claimable AS (
+                SELECT id FROM tokens_s0 WHERE status = 'detected'
+                ORDER BY created_at LIMIT :limit FOR UPDATE SKIP LOCKED
+            )
+            UPDATE tokens_s0 SET status = 'generating'
+            WHERE id IN (SELECT id FROM claimable)
+            RETURNING *
+
+        Concurrent workers skip each other's locked rows, so claims never
+        overlap. Commit promptly - the locks are held until then.
+
+        Args:
+            limit: Maximum number of tokens to claim (default: 10)
+
+        Returns:
+            Claimed tokens (status already 'generating'), in no particular order
+        """
+        claimable = (
+            select(Token.id)
+            .where(Token.status == TokenStatus.DETECTED)  # type: ignore[arg-type]
+            .order_by(Token.created_at.asc())  # type: ignore[attr-defined]
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("claimable")
+        )
+        result = await self.session.execute(
+            update(Token)
+            .where(Token.id.in_(select(claimable.c.id)))  # type: ignore[attr-defined]
+            .values(status=TokenStatus.GENERATING)
+            .returning(Token)
+        )
+        return list(result.scalars().all())
+
+    async def bulk_update_generation_results(self, rows: list[dict]) -> None:
+        """Write buffered image generation outcomes in one executemany UPDATE.
+
+        Uses SQLAlchemy's bulk UPDATE by primary key: each row must contain
+        ``id`` plus the same set of columns to update (status, image_url,
+        generation_attempts, generation_error).
+
+        Args:
+            rows: One parameter dict per token
+        """
+        if rows:
+            await self.session.execute(update(Token), rows)
+
+    async def reset_generating(self, token_ids: list[UUID]) -> None:
+        """Put claimed tokens back to 'detected' when their outcome could not be written.
+
+        Only rows still in 'generating' are touched, so an outcome that did
+        get written is never overwritten.
+
+        Args:
+            token_ids: Primary keys of the claimed tokens
+        """
+        if token_ids:
+            await self.session.execute(
+                update(Token)
+                .where(Token.id.in_(token_ids))  # type: ignore[attr-defined]
+                .where(Token.status == TokenStatus.GENERATING)  # type: ignore[arg-type]
+                .values(status=TokenStatus.DETECTED)
+            )
+
+    async def bulk_update_upload_results(self, rows: list[dict]) -> None:
+        """Write a batch's IPFS upload outcomes in one executemany UPDATE.
+
+        Uses SQLAlchemy's bulk UPDATE by primary key: each row must contain
+        ``id`` plus the same set of columns to update (status, image_cid,
+        metadata_cid, generation_attempts, generation_error).
+
+        Args:
+            rows: One parameter dict per token
+        """
+        if rows:
+            await self.session.execute(update(Token), rows)
+
     async def update_image_url(self, token: Token, image_url: str) -> None:
         """Update token with generated image URL and mark as ready for upload.
 
@@ -109,7 +271,6 @@ class TokenRepository:
         token.status = TokenStatus.UPLOADING
         self.session.add(token)
         await self.session.flush()
-        await self.session.refresh(token)
 
     async def get_pending_for_upload(self, limit: int = 10) -> list[Token]:
         """Retrieve tokens pending IPFS upload with row-level locking.
@@ -257,7 +418,6 @@ class TokenRepository:
         token.generation_error = error_message[:1000]  # Truncate to 1000 chars
         self.session.add(token)
         await self.session.flush()
-        await self.session.refresh(token)
 
     async def increment_attempts(self, token: Token, error_message: str) -> None:
         """Increment retry counter and reset status for transient failure.
@@ -271,7 +431,6 @@ class TokenRepository:
         token.generation_error = error_message[:1000]  # Truncate to 1000 chars
         self.session.add(token)
         await self.session.flush()
-        await self.session.refresh(token)
 
     async def update_ipfs_cids(self, token: Token, image_cid: str, metadata_cid: str) -> None:
         """Update token with IPFS CIDs and mark as ready for reveal.
@@ -292,7 +451,6 @@ class TokenRepository:
         token.status = TokenStatus.READY
         self.session.add(token)
         await self.session.flush()
-        await self.session.refresh(token)
 
     async def mark_revealed(self, token: Token, tx_hash: str | None = None) -> None:
         """Mark token as revealed with optional transaction hash.
@@ -313,7 +471,6 @@ class TokenRepository:
         token.status = TokenStatus.REVEALED
         self.session.add(token)
         await self.session.flush()
-        await self.session.refresh(token)
 
     async def get_missing_token_ids(self, max_token_id: int, limit: int | None = None) -> list[int]:
         """Retrieve token IDs that exist on-chain but not in database.
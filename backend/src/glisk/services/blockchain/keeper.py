@@ -1,12 +1,13 @@
 """Keeper service for batch reveal operations on blockchain."""
 
-from typing import Tuple
+import asyncio
+from typing import Any, Tuple
 
 import structlog
 from eth_abi.abi import decode
 from eth_account import Account
-from web3 import Web3
-from web3.exceptions import TimeExhausted
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from web3.exceptions import TimeExhausted, TransactionNotFound
 
 from glisk.abi import get_contract_abi
 from glisk.services.exceptions import (
@@ -26,6 +27,9 @@ class KeeperService:
     # Custom error selectors from GliskNFT contract
     ERROR_ALREADY_REVEALED = "0xa3a57894"  # AlreadyRevealed(uint256)
 
+    # Receipt polling interval when no websocket endpoint is configured (~Base block time)
+    RECEIPT_POLL_INTERVAL_SECONDS = 2.0
+
     def __init__(
         self,
         w3: Web3,
@@ -34,6 +38,7 @@ class KeeperService:
         gas_buffer_percentage: float = 0.20,
         transaction_timeout: int = 180,
         max_gas_price_gwei: float | None = None,
+        ws_url: str | None = None,
     ):
         """
         Initialize keeper service.
@@ -47,6 +52,9 @@ class KeeperService:
             max_gas_price_gwei: Optional max gas price cap in Gwei. Transactions exceeding this
                 will be rejected with TransientError to wait for lower gas prices. If None,
                 no cap is applied (default: None)
+            ws_url: Optional websocket RPC endpoint. When set, confirmations are detected via
+                a newHeads subscription (one receipt lookup per block) instead of polling
+                (default: None)
         """
         self.w3 = w3
         self.contract_address = Web3.to_checksum_address(contract_address)
@@ -54,6 +62,10 @@ class KeeperService:
         self.gas_buffer = 1.0 + gas_buffer_percentage
         self.transaction_timeout = transaction_timeout
         self.max_gas_price_wei = int(max_gas_price_gwei * 10**9) if max_gas_price_gwei else None
+        self.ws_url = ws_url
+
+        # Chain ID is immutable for a deployed service - query once instead of per reveal
+        self.chain_id = self.w3.eth.chain_id
 
         # Load contract ABI from package resources
         self.contract_abi = get_contract_abi()
@@ -72,6 +84,7 @@ class KeeperService:
             gas_buffer=self.gas_buffer,
             timeout=transaction_timeout,
             max_gas_price_gwei=max_gas_price_gwei,
+            receipt_source="websocket" if ws_url else "polling",
         )
 
     def get_keeper_address(self) -> str:
@@ -239,6 +252,72 @@ class KeeperService:
 
             raise GasEstimationError(context) from e
 
+    async def wait_for_receipt(self, tx_hash: Any) -> Any:
+        """
+        Wait for a transaction receipt without busy-polling the RPC.
+
+        With a websocket endpoint, subscribes to newHeads and issues a single
+        eth_getTransactionReceipt per new block. Without one (or if the subscription
+        fails), polls once per block interval. Both paths check the receipt immediately
+        first, so already-mined transactions return without waiting.
+
+        Args:
+            tx_hash: Transaction hash returned by send_raw_transaction
+
+        Returns:
+            Transaction receipt
+
+        Raises:
+            TimeExhausted: Receipt not available within transaction_timeout seconds
+        """
+        try:
+            async with asyncio.timeout(self.transaction_timeout):
+                receipt = await asyncio.to_thread(self._get_receipt, tx_hash)
+                if receipt is not None:
+                    return receipt
+
+                if self.ws_url:
+                    try:
+                        return await self._wait_for_receipt_ws(tx_hash)
+                    except (asyncio.CancelledError, TimeoutError):
+                        raise
+                    except Exception as e:
+                        logger.warning(
+                            "keeper.receipt_subscription_failed",
+                            error=str(e),
+                            error_type=type(e).__name__,
+                            fallback="polling",
+                        )
+
+                while True:
+                    await asyncio.sleep(self.RECEIPT_POLL_INTERVAL_SECONDS)
+                    receipt = await asyncio.to_thread(self._get_receipt, tx_hash)
+                    if receipt is not None:
+                        return receipt
+        except TimeoutError as e:
+            raise TimeExhausted(
+                f"Transaction {tx_hash!r} is not in the chain after "
+                f"{self.transaction_timeout} seconds"
+            ) from e
+
+    def _get_receipt(self, tx_hash: Any) -> Any:
+        """Fetch receipt via HTTP provider, returning None while the tx is pending."""
+        try:
+            return self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _wait_for_receipt_ws(self, tx_hash: Any) -> Any:
+        """Check for the receipt once per new block using a newHeads subscription."""
+        async with AsyncWeb3(WebSocketProvider(self.ws_url)) as ws_w3:  # type: ignore[arg-type]
+            await ws_w3.eth.subscribe("newHeads")
+            async for _ in ws_w3.socket.process_subscriptions():
+                try:
+                    return await ws_w3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    continue
+        raise TransactionNotFound(f"Subscription closed before {tx_hash!r} was mined")
+
     async def reveal_batch(
         self,
         token_ids: list[int],
@@ -280,7 +359,7 @@ class KeeperService:
                     "gas": gas_limit,
                     "maxFeePerGas": max_fee_per_gas,
                     "maxPriorityFeePerGas": max_priority_fee_per_gas,
-                    "chainId": self.w3.eth.chain_id,
+                    "chainId": self.chain_id,
                 }  # type: ignore[arg-type]
             )
 
@@ -310,9 +389,7 @@ class KeeperService:
 
             # Wait for transaction receipt
             try:
-                receipt = self.w3.eth.wait_for_transaction_receipt(
-                    tx_hash, timeout=self.transaction_timeout
-                )
+                receipt = await self.wait_for_receipt(tx_hash)
             except TimeExhausted as e:
                 logger.warning(
                     "keeper.transaction_timeout",
@@ -0,0 +1,66 @@
+"""Web3 provider setup with a shared HTTP connection pool.
+
+All RPC traffic to Alchemy goes through Web3 instances created here, so the
+network -> URL mapping lives in one place and every instance reuses pooled
+keep-alive connections instead of paying a TCP+TLS handshake per call.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+from glisk.core.config import Settings
+
+# Alchemy RPC endpoints per supported network (API key appended)
+ALCHEMY_RPC_URLS = {
+    "BASE_SEPOLIA": "https://base-sepolia.g.alchemy.com/v2/",
+    "BASE_MAINNET": "https://base-mainnet.g.alchemy.com/v2/",
+}
+
+# Connection pool size per host - covers concurrent to_thread RPC dispatch
+RPC_POOL_SIZE = 32
+
+# Per-request RPC timeout in seconds
+RPC_TIMEOUT_SECONDS = 30
+
+
+def get_rpc_url(settings: Settings) -> str | None:
+    """Return the Alchemy HTTPS RPC URL for the configured network.
+
+    Args:
+        settings: Application settings (network, alchemy_api_key)
+
+    Returns:
+        RPC URL, or None if the network is not supported
+    """
+    base_url = ALCHEMY_RPC_URLS.get(settings.network)
+    if base_url is None:
+        return None
+    return f"{base_url}{settings.alchemy_api_key}"
+
+
+def create_web3(rpc_url: str, pool_size: int = RPC_POOL_SIZE) -> Web3:
+    """Create a Web3 instance backed by a pooled keep-alive requests.Session.
+
+    Retries are disabled at the adapter level; callers own their retry policy
+    (e.g. TokenRecoveryService.get_next_token_id).
+
+    Args:
+        rpc_url: HTTPS JSON-RPC endpoint
+        pool_size: Maximum pooled connections per host (default: 32)
+
+    Returns:
+        Web3 instance using the pooled session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return Web3(
+        Web3.HTTPProvider(
+            rpc_url,
+            session=session,
+            request_kwargs={"timeout": RPC_TIMEOUT_SECONDS},
+        )
+    )
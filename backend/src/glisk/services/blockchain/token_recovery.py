@@ -5,21 +5,32 @@ This module provides the TokenRecoveryService which:
 2. Identifies missing token IDs in database
 3. Creates Token records with status=DETECTED for missing tokens
 4. Looks up actual prompt author from contract for accurate attribution
+
+On-chain reads for missing tokens are batched through Multicall3 (deployed at the
+same address on Base mainnet and Base Sepolia), falling back to JSON-RPC batch
+requests where it is not deployed, so recovering N tokens costs a handful of
+HTTP round-trips instead of up to 3N.
 """
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
 
 import structlog
-from sqlalchemy.exc import IntegrityError
+from eth_abi import decode as abi_decode
 from web3 import Web3
+from web3.contract import Contract
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import BlockIdentifier
 
 from glisk.abi import get_contract_abi
 from glisk.core.config import Settings
 from glisk.models.author import Author
-from glisk.models.token import Token, TokenStatus
+from glisk.models.token import TokenStatus
 from glisk.services.exceptions import (
     BlockchainConnectionError,
     ContractNotFoundError,
@@ -28,6 +39,112 @@ from glisk.uow import UnitOfWork
 
 logger = structlog.get_logger()
 
+# Multicall3 is deployed at this address on all supported networks
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Minimal Multicall3 ABI - only aggregate3 is used
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
+
+# Max sub-calls per aggregate3 request (keeps eth_call under RPC gas/size limits)
+MULTICALL_CHUNK_SIZE = 500
+
+# Max aggregate3 requests in flight at once (avoids provider rate limits)
+MULTICALL_MAX_CONCURRENCY = 8
+
+# Missing tokens per recovery pipeline chunk (chain read + bulk insert)
+RECOVERY_CHUNK_SIZE = 500
+
+# Chunks fetched ahead of the database writer (bounds memory and RPC lead)
+RECOVERY_PIPELINE_DEPTH = 2
+
+# Scheme prefix of revealed tokenURIs (metadata CID follows)
+IPFS_URI_PREFIX = "ipfs://"
+
+# GliskNFT view functions read for each missing token, in result order
+_TOKEN_STATE_CALLS = ("tokenPromptAuthor", "isRevealed", "tokenURI")
+
+# ABI return types of the GliskNFT view functions read during recovery
+_RETURN_TYPES = {
+    "tokenPromptAuthor": "address",
+    "isRevealed": "bool",
+    "tokenURI": "string",
+}
+
+
+# 4-byte selectors of the GliskNFT view functions, computed once at import
+_SELECTORS = {
+    fn_name: bytes(Web3.keccak(text=f"{fn_name}(uint256)")[:4]) for fn_name in _RETURN_TYPES
+}
+
+
+def _encode_call(fn_name: str, token_id: int) -> bytes:
+    """Build calldata for a single-uint256 GliskNFT view function (selector + arg)."""
+    return _SELECTORS[fn_name] + token_id.to_bytes(32, "big")
+
+
+def _decode_result(fn_name: str, return_data: bytes) -> Any | None:
+    """Decode raw eth_call return data for a GliskNFT view function (None if empty)."""
+    if not return_data:
+        return None
+
+    # Static single-word results are sliced directly; only strings need the ABI decoder
+    return_type = _RETURN_TYPES[fn_name]
+    if return_type == "address":
+        return "0x" + bytes(return_data[12:32]).hex()
+    if return_type == "bool":
+        return return_data[31] == 1
+
+    (value,) = abi_decode([return_type], return_data)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _get_contracts(w3: Web3, contract_address: str) -> tuple[Contract, Contract]:
+    """Build GliskNFT and Multicall3 bindings, shared across service instances.
+
+    Contract objects are stateless wrappers around (w3, address, ABI), so one
+    binding per Web3 instance and address is enough.
+
+    Args:
+        w3: Web3 instance for RPC calls
+        contract_address: GliskNFT contract address (checksummed)
+
+    Returns:
+        (GliskNFT contract, Multicall3 contract)
+    """
+    contract = w3.eth.contract(address=contract_address, abi=get_contract_abi())
+    multicall = w3.eth.contract(
+        address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI
+    )
+    return contract, multicall
+
 
 @dataclass
 class RecoveryResult:
@@ -41,6 +158,15 @@ class RecoveryResult:
     errors: list[str]  # Any non-fatal errors encountered
 
 
+@dataclass
+class TokenChainState:
+    """On-chain state of a single token needed to recreate its database record."""
+
+    author_wallet: str  # tokenPromptAuthor(tokenId)
+    is_revealed: bool  # isRevealed(tokenId)
+    token_uri: str | None  # tokenURI(tokenId), None for unrevealed tokens
+
+
 class TokenRecoveryService:
     """Service for recovering missing tokens from blockchain state."""
 
@@ -61,11 +187,14 @@ class TokenRecoveryService:
         self.contract_address = Web3.to_checksum_address(contract_address)
         self.settings = settings
 
-        # Load contract ABI from package resources
+        # Load contract ABI from package resources (cached after first load)
         self.contract_abi = get_contract_abi()
 
-        # Initialize contract
-        self.contract = self.w3.eth.contract(address=self.contract_address, abi=self.contract_abi)
+        # Initialize contracts (bindings cached per w3 instance and address)
+        self.contract, self.multicall = _get_contracts(self.w3, self.contract_address)
+
+        # Cleared once Multicall3 turns out to be missing; reads then use JSON-RPC batches
+        self.multicall_available = True
 
         logger.info(
             "recovery_service.initialized",
@@ -73,9 +202,31 @@ class TokenRecoveryService:
             connected=self.w3.is_connected(),
         )
 
-    async def get_next_token_id(self) -> int:
+    async def get_block_number(self) -> int:
+        """Query the latest block number (snapshot block for a recovery run).
+
+        Returns:
+            Latest block number
+
+        Raises:
+            BlockchainConnectionError: If RPC call fails
+        """
+        try:
+            return await asyncio.to_thread(lambda: self.w3.eth.block_number)
+        except Exception as e:
+            logger.error(
+                "recovery.block_number_error",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise BlockchainConnectionError(f"Failed to query latest block number: {e}") from e
+
+    async def get_next_token_id(self, block_identifier: BlockIdentifier = "latest") -> int:
         """Query smart contract's nextTokenId counter with retry logic.
 
+        Args:
+            block_identifier: Block to read state at (default: latest)
+
         Returns:
             Next token ID that will be minted (exclusive upper bound)
 
@@ -91,8 +242,11 @@ class TokenRecoveryService:
 
         for attempt in range(max_retries):
             try:
-                # Call nextTokenId() view function
-                next_token_id = self.contract.functions.nextTokenId().call()
+                # Call nextTokenId() view function (off the event loop)
+                next_token_id = await asyncio.to_thread(
+                    self.contract.functions.nextTokenId().call,
+                    block_identifier=block_identifier,
+                )
                 logger.info(
                     "recovery.next_token_id_queried",
                     next_token_id=next_token_id,
@@ -139,6 +293,301 @@ class TokenRecoveryService:
         # Should never reach here due to raise in exception handlers
         raise BlockchainConnectionError("Unexpected error in get_next_token_id")
 
+    def _aggregate3_chunk(
+        self, chunk: list[tuple[str, int]], block_identifier: BlockIdentifier
+    ) -> list[Any | None]:
+        """Execute one chunk of GliskNFT view calls via Multicall3.aggregate3.
+
+        Sub-calls use allowFailure=True, so a single reverting token does not
+        fail the whole chunk.
+        """
+        aggregate_calls = [
+            (self.contract_address, True, _encode_call(fn_name, token_id))
+            for fn_name, token_id in chunk
+        ]
+        responses = self.multicall.functions.aggregate3(aggregate_calls).call(
+            block_identifier=block_identifier
+        )
+
+        return [
+            _decode_result(fn_name, return_data) if success else None
+            for (fn_name, _), (success, return_data) in zip(chunk, responses, strict=True)
+        ]
+
+    def _batch_request_chunk(
+        self, chunk: list[tuple[str, int]], block_identifier: BlockIdentifier
+    ) -> list[Any | None]:
+        """Execute one chunk of GliskNFT view calls as a single JSON-RPC batch.
+
+        Fallback for networks without Multicall3 (e.g. local Anvil): all eth_calls
+        in the chunk share one HTTP request; web3 matches responses by request id.
+        """
+        with self.w3.batch_requests() as batch:
+            for fn_name, token_id in chunk:
+                batch.add(
+                    self.w3.eth.call(
+                        {
+                            "to": self.contract_address,
+                            "data": _encode_call(fn_name, token_id),
+                        },
+                        block_identifier,
+                    )
+                )
+            responses = batch.execute()
+
+        return [
+            _decode_result(fn_name, return_data)
+            for (fn_name, _), return_data in zip(chunk, responses, strict=True)
+        ]
+
+    async def _read_view_calls(
+        self, calls: list[tuple[str, int]], block_identifier: BlockIdentifier
+    ) -> list[Any | None]:
+        """Execute GliskNFT view calls in batches.
+
+        Uses Multicall3 when available and falls back to JSON-RPC batching if
+        Multicall3 is not deployed. Calls are split into chunks of
+        MULTICALL_CHUNK_SIZE, dispatched concurrently (bounded by
+        MULTICALL_MAX_CONCURRENCY) in worker threads, so RPC latency overlaps and
+        the event loop is never blocked.
+
+        Args:
+            calls: (function_name, token_id) pairs
+            block_identifier: Block every call reads state at
+
+        Returns:
+            Decoded return value for each call in input order (None if the call failed)
+        """
+        chunks = [
+            calls[start : start + MULTICALL_CHUNK_SIZE]
+            for start in range(0, len(calls), MULTICALL_CHUNK_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(MULTICALL_MAX_CONCURRENCY)
+
+        async def run_chunks(
+            read_chunk: Callable[[list[tuple[str, int]], BlockIdentifier], list[Any | None]],
+        ) -> list[Any | None]:
+            async def run_chunk(chunk: list[tuple[str, int]]) -> list[Any | None]:
+                async with semaphore:
+                    return await asyncio.to_thread(read_chunk, chunk, block_identifier)
+
+            chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+            return [result for chunk in chunk_results for result in chunk]
+
+        if self.multicall_available:
+            try:
+                return await run_chunks(self._aggregate3_chunk)
+            except BadFunctionCallOutput as e:
+                # No code at the Multicall3 address - use JSON-RPC batching from now on
+                self.multicall_available = False
+                logger.warning(
+                    "recovery.multicall_unavailable",
+                    multicall_address=MULTICALL3_ADDRESS,
+                    error=str(e),
+                    fallback="json_rpc_batch",
+                )
+
+        return await run_chunks(self._batch_request_chunk)
+
+    async def fetch_token_states(
+        self, token_ids: list[int], block_identifier: BlockIdentifier = "latest"
+    ) -> dict[int, TokenChainState]:
+        """Read author, reveal status and metadata URI for tokens in batched calls.
+
+        tokenPromptAuthor, isRevealed and tokenURI are read for every token in a
+        single batched pass. tokenURI cannot replace isRevealed because GliskNFT
+        returns a placeholder URI (not an empty string) for unrevealed tokens.
+
+        Args:
+            token_ids: Token IDs to read
+            block_identifier: Block to read state at (default: latest)
+
+        Returns:
+            Mapping token_id -> TokenChainState. Tokens whose author or reveal
+            status could not be read are omitted.
+
+        Raises:
+            ContractNotFoundError: If the contract view functions cannot be called
+            BlockchainConnectionError: If the RPC call fails
+        """
+        try:
+            results = await self._read_view_calls(
+                [(fn_name, token_id) for token_id in token_ids for fn_name in _TOKEN_STATE_CALLS],
+                block_identifier,
+            )
+
+            states: dict[int, TokenChainState] = {}
+            for i, token_id in enumerate(token_ids):
+                author_wallet, is_revealed, token_uri = results[3 * i : 3 * i + 3]
+                if author_wallet is None or is_revealed is None:
+                    continue
+                states[token_id] = TokenChainState(
+                    author_wallet=author_wallet,
+                    is_revealed=is_revealed,
+                    # Unrevealed tokens return the shared placeholder URI - not metadata
+                    token_uri=token_uri if is_revealed else None,
+                )
+
+        except (BadFunctionCallOutput, ContractLogicError) as e:
+            logger.error(
+                "recovery.contract_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                contract_address=self.contract_address,
+            )
+            raise ContractNotFoundError(
+                f"Contract not found at {self.contract_address} or view function missing"
+            ) from e
+
+        except Exception as e:
+            logger.error(
+                "recovery.chain_state_rpc_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                token_count=len(token_ids),
+            )
+            raise BlockchainConnectionError(f"Failed to read token state from chain: {e}") from e
+
+        logger.info(
+            "recovery.chain_state_fetched",
+            token_count=len(token_ids),
+            fetched_count=len(states),
+            revealed_count=sum(state.is_revealed for state in states.values()),
+        )
+        return states
+
+    async def _persist_chunk(
+        self,
+        uow: UnitOfWork,
+        token_ids: list[int],
+        chain_states: dict[int, TokenChainState],
+        author_cache: dict[str, UUID],
+    ) -> tuple[int, int, list[str]]:
+        """Resolve authors and insert records for one chunk of missing tokens.
+
+        Args:
+            uow: Unit of Work for database transaction
+            token_ids: Missing token IDs in this chunk
+            chain_states: On-chain state for the chunk (from fetch_token_states)
+            author_cache: Checksummed wallet -> author ID, shared across chunks
+
+        Returns:
+            (recovered_count, skipped_duplicate_count, errors) for this chunk
+        """
+        # Resolve authors not seen in earlier chunks with one query
+        wallets = {
+            Web3.to_checksum_address(state.author_wallet) for state in chain_states.values()
+        } - author_cache.keys()
+        existing_authors = await uow.authors.get_by_wallets(wallets)
+        for wallet in wallets:
+            author = existing_authors.get(wallet.lower())
+            if author is not None:
+                author_cache[wallet] = author.id
+
+        errors: list[str] = []
+        to_insert: list[tuple[int, UUID, TokenStatus, str | None]] = []
+
+        for token_id in token_ids:
+            try:
+                chain_state = chain_states.get(token_id)
+                if chain_state is None:
+                    raise ValueError("on-chain state unavailable (multicall sub-call failed)")
+
+                author_wallet_checksummed = Web3.to_checksum_address(chain_state.author_wallet)
+
+                author_id = author_cache.get(author_wallet_checksummed)
+                if author_id is None:
+                    # Create new author automatically if not found
+                    # This ensures consistent behavior with webhook processing
+                    logger.debug(
+                        "recovery.author_not_found_creating_new",
+                        author_wallet=author_wallet_checksummed,
+                    )
+                    author = Author(
+                        wallet_address=author_wallet_checksummed,
+                        prompt_text=None,
+                    )
+                    author = await uow.authors.add(author)
+
+                    author_id = author.id
+                    author_cache[author_wallet_checksummed] = author_id
+
+                # Build token row with appropriate status
+                if chain_state.is_revealed:
+                    # Token already revealed - extract metadata URI
+                    token_uri = chain_state.token_uri or ""
+                    metadata_cid = (
+                        token_uri[len(IPFS_URI_PREFIX) :]
+                        if token_uri.startswith(IPFS_URI_PREFIX)
+                        else None
+                    )
+                    to_insert.append((token_id, author_id, TokenStatus.REVEALED, metadata_cid))
+
+                    logger.debug(
+                        "recovery.token_revealed",
+                        token_id=token_id,
+                        metadata_cid=metadata_cid,
+                    )
+                else:
+                    # Token not revealed - will go through pipeline
+                    to_insert.append((token_id, author_id, TokenStatus.DETECTED, None))
+
+            except Exception as e:
+                # Log error but continue with next token
+                error_msg = f"Failed to recover token {token_id}: {e}"
+                errors.append(error_msg)
+                logger.error(
+                    "recovery.token_error",
+                    token_id=token_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        # Insert all rows in one statement, skipping tokens the webhook created concurrently
+        inserted_ids = await uow.tokens.bulk_insert_missing(to_insert)
+        recovered_count = len(inserted_ids)
+        skipped_duplicate_count = len(to_insert) - recovered_count
+
+        # Per-token detail at debug; one aggregate line at info
+        created_ids: list[int] = []
+        duplicate_ids: list[int] = []
+        for token_id, author_id, status, _ in to_insert:
+            if token_id in inserted_ids:
+                created_ids.append(token_id)
+                logger.debug(
+                    "recovery.token_created",
+                    token_id=token_id,
+                    author_id=str(author_id),
+                    status=status.value,
+                )
+            else:
+                duplicate_ids.append(token_id)
+                logger.debug(
+                    "recovery.duplicate_skipped",
+                    token_id=token_id,
+                    reason="webhook_concurrent_creation",
+                )
+
+        # Wake the image generation worker for recovered detected tokens (on commit)
+        if any(
+            token_id in inserted_ids and status == TokenStatus.DETECTED
+            for token_id, _, status, _ in to_insert
+        ):
+            await uow.tokens.notify_mint_detected()
+
+        logger.info(
+            "recovery.batch_complete",
+            created=len(created_ids),
+            first_created=created_ids[0] if created_ids else None,
+            last_created=created_ids[-1] if created_ids else None,
+            duplicates_skipped=len(duplicate_ids),
+            first_duplicate=duplicate_ids[0] if duplicate_ids else None,
+            last_duplicate=duplicate_ids[-1] if duplicate_ids else None,
+            errors=len(errors),
+        )
+
+        return recovered_count, skipped_duplicate_count, errors
+
     async def recover_missing_tokens(
         self,
         uow: UnitOfWork,
@@ -150,11 +599,15 @@ class TokenRecoveryService:
         Process:
         1. Query contract.nextTokenId()
         2. Query database for missing token IDs
-        3. For each missing token, query tokenPromptAuthor from contract
+        3. Batch-read tokenPromptAuthor/isRevealed/tokenURI (Multicall3 or JSON-RPC batch)
         4. Lookup author by wallet (or create new author if not found)
-        5. Create Token records with status=DETECTED
+        5. Insert rows per chunk (ON CONFLICT DO NOTHING skips webhook-created rows)
         6. Commit transaction (or rollback if dry_run)
 
+        Steps 3-5 run per chunk of RECOVERY_CHUNK_SIZE tokens, pipelined so the
+        chain reads for the next chunk overlap the database writes for the
+        current one.
+
         Args:
             uow: Unit of Work for database transaction
             limit: Optional cap on number of tokens to recover
@@ -169,12 +622,15 @@ class TokenRecoveryService:
         """
         start_time = datetime.now(UTC)
 
-        # Step 1: Query contract for next token ID
-        next_token_id = await self.get_next_token_id()
+        # Step 1: Query contract for next token ID. Every read in this run is pinned
+        # to one block so state cannot drift mid-recovery (e.g. isRevealed flipping)
+        block_number = await self.get_block_number()
+        next_token_id = await self.get_next_token_id(block_identifier=block_number)
 
         logger.info(
             "recovery.started",
             max_token_id=next_token_id,
+            block_number=block_number,
             limit=limit,
             dry_run=dry_run,
         )
@@ -202,99 +658,43 @@ class TokenRecoveryService:
             last_missing=missing_ids[-1],
         )
 
-        # Step 3-5: For each missing token, lookup author and create record
+        # Step 3-5: Process gaps in chunks as a two-stage pipeline - chain reads for
+        # chunk K run while chunk K-1 is written (the UoW session stays sequential)
+        chunks = [
+            missing_ids[start : start + RECOVERY_CHUNK_SIZE]
+            for start in range(0, len(missing_ids), RECOVERY_CHUNK_SIZE)
+        ]
+        fetched: asyncio.Queue[tuple[list[int], dict[int, TokenChainState]] | None] = asyncio.Queue(
+            maxsize=RECOVERY_PIPELINE_DEPTH
+        )
+
+        async def fetch_chunks() -> None:
+            for chunk in chunks:
+                chain_states = await self.fetch_token_states(chunk, block_identifier=block_number)
+                await fetched.put((chunk, chain_states))
+            await fetched.put(None)
+
         recovered_count = 0
         skipped_duplicate_count = 0
         errors: list[str] = []
+        author_cache: dict[str, UUID] = {}  # checksummed wallet -> author ID
 
-        for token_id in missing_ids:
-            try:
-                # Query tokenPromptAuthor from contract
-                author_wallet = self.contract.functions.tokenPromptAuthor(token_id).call()
-                author_wallet_checksummed = Web3.to_checksum_address(author_wallet)
-
-                # Lookup author in database (case-insensitive via repository)
-                author = await uow.authors.get_by_wallet(author_wallet_checksummed)
-
-                if not author:
-                    # Create new author automatically if not found
-                    # This ensures consistent behavior with webhook processing
-                    logger.info(
-                        "recovery.author_not_found_creating_new",
-                        author_wallet=author_wallet_checksummed,
-                    )
-                    author = Author(
-                        wallet_address=author_wallet_checksummed,
-                        prompt_text=None,
-                    )
-                    author = await uow.authors.add(author)
-
-                # Check if token is already revealed on-chain
-                is_revealed = self.contract.functions.isRevealed(token_id).call()
-
-                # Create token record with appropriate status
-                if is_revealed:
-                    # Token already revealed - extract metadata URI
-                    token_uri = self.contract.functions.tokenURI(token_id).call()
-                    metadata_cid = (
-                        token_uri.replace("ipfs://", "")
-                        if token_uri.startswith("ipfs://")
-                        else None
-                    )
-
-                    token = Token(
-                        token_id=token_id,
-                        author_id=author.id,
-                        status=TokenStatus.REVEALED,
-                        metadata_cid=metadata_cid,
-                        generation_attempts=0,
-                    )
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(fetch_chunks())
 
-                    logger.info(
-                        "recovery.token_revealed",
-                        token_id=token_id,
-                        metadata_cid=metadata_cid,
+                while (item := await fetched.get()) is not None:
+                    chunk, chain_states = item
+                    chunk_recovered, chunk_skipped, chunk_errors = await self._persist_chunk(
+                        uow, chunk, chain_states, author_cache
                     )
-                else:
-                    # Token not revealed - will go through pipeline
-                    token = Token(
-                        token_id=token_id,
-                        author_id=author.id,
-                        status=TokenStatus.DETECTED,
-                        generation_attempts=0,
-                    )
-
-                await uow.tokens.add(token)
-                await uow.session.flush()  # Ensure token is persisted
-
-                recovered_count += 1
-                logger.info(
-                    "recovery.token_created",
-                    token_id=token_id,
-                    author_id=str(author.id),
-                    author_wallet=author_wallet_checksummed,
-                    status=token.status.value,
-                )
-
-            except IntegrityError:
-                # Token already exists (webhook created it concurrently)
-                skipped_duplicate_count += 1
-                logger.info(
-                    "recovery.duplicate_skipped",
-                    token_id=token_id,
-                    reason="webhook_concurrent_creation",
-                )
-
-            except Exception as e:
-                # Log error but continue with next token
-                error_msg = f"Failed to recover token {token_id}: {e}"
-                errors.append(error_msg)
-                logger.error(
-                    "recovery.token_error",
-                    token_id=token_id,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
+                    recovered_count += chunk_recovered
+                    skipped_duplicate_count += chunk_skipped
+                    errors.extend(chunk_errors)
+        except ExceptionGroup as eg:
+            # Surface the original error (e.g. BlockchainConnectionError) to callers,
+            # chained to the group so sibling failures stay in the traceback
+            raise eg.exceptions[0] from eg
 
         # Rollback if dry run, otherwise commit handled by UoW context manager
         if dry_run:
@@ -7,10 +7,22 @@ SIWF messages are signed by Farcaster wallets (custody or auth addresses) and
 must be cryptographically verified on the backend to prove ownership.
 """
 
+import re
+
 import structlog
+from eth_account import Account
+from eth_account.messages import encode_defunct
 
 logger = structlog.get_logger()
 
+# Domain is everything before the fixed EIP-4361 preamble on the first line
+_SIWE_DOMAIN_RE = re.compile(r"(.+) wants you to sign in")
+
+
+def _normalize_address(address: str) -> str:
+    """Normalize an Ethereum address for comparison (lowercase hex, no 0x prefix)."""
+    return address.strip().lower().removeprefix("0x")
+
 
 def verify_farcaster_signature(
     message: str,
@@ -60,16 +72,11 @@ def verify_farcaster_signature(
 
         # Verify using eth_account directly for Farcaster signatures
         # This avoids the complexity of siwe library parsing
-        import re
-
-        from eth_account import Account
-        from eth_account.messages import encode_defunct
-
         # Parse the SIWE message to extract the signer address and domain
         lines = message.strip().split("\n")
 
         # Extract domain from first line
-        domain_match = re.match(r"(.+) wants you to sign in", lines[0])
+        domain_match = _SIWE_DOMAIN_RE.match(lines[0])
         message_domain = domain_match.group(1) if domain_match else ""
 
         # Extract address from second line
@@ -98,37 +105,32 @@ def verify_farcaster_signature(
         )
 
         # Check if the recovered address matches the signer address in the message
-        from web3 import Web3
-
-        # Normalize addresses for comparison
-        normalized_signer = Web3.to_checksum_address(signer_address)
-        normalized_recovered = Web3.to_checksum_address(recovered_address)
-
-        if normalized_signer != normalized_recovered:
+        # Compare case-insensitively instead of checksumming each side (a Keccak-256
+        # per address); recover_message already returns the checksummed form
+        if _normalize_address(signer_address) != _normalize_address(recovered_address):
             logger.warning(
                 "farcaster_signature_mismatch",
-                signer_address=normalized_signer,
-                recovered_address=normalized_recovered,
+                signer_address=signer_address,
+                recovered_address=recovered_address,
             )
             return False
 
         logger.info(
             "farcaster_signature_verified",
-            address=normalized_signer,
+            address=recovered_address,
             domain=message_domain,
         )
 
         # Optional: Verify the signing address matches expected address
-        if expected_address:
-            normalized_expected = Web3.to_checksum_address(expected_address)
-
-            if normalized_signer != normalized_expected:
-                logger.warning(
-                    "farcaster_address_mismatch",
-                    message_address=normalized_signer,
-                    expected_address=normalized_expected,
-                )
-                return False
+        if expected_address and _normalize_address(expected_address) != _normalize_address(
+            recovered_address
+        ):
+            logger.warning(
+                "farcaster_address_mismatch",
+                message_address=recovered_address,
+                expected_address=expected_address,
+            )
+            return False
 
         return True
 
@@ -16,13 +16,17 @@ def validate_prompt(prompt: str) -> str:
     Raises:
         ValueError: If prompt is empty, None, or exceeds 1000 characters
     """
-    if not prompt:
-        raise ValueError("Prompt cannot be empty or None")
-
-    if not isinstance(prompt, str):
+    # Exact type check first (no MRO walk), then a single len() for both bounds
+    if type(prompt) is not str:
+        if prompt is None:
+            raise ValueError("Prompt cannot be empty or None")
         raise ValueError(f"Prompt must be a string, got {type(prompt).__name__}")
 
-    if len(prompt) > 1000:
-        raise ValueError(f"Prompt exceeds maximum length of 1000 characters (got {len(prompt)})")
+    length = len(prompt)
+    if length == 0:
+        raise ValueError("Prompt cannot be empty or None")
+
+    if length > 1000:
+        raise ValueError(f"Prompt exceeds maximum length of 1000 characters (got {length})")
 
     return prompt
@@ -1,12 +1,20 @@
 """Replicate API client for image generation with error classification."""
 
-import asyncio
-import os
-from typing import Any, Optional
+import importlib.util
+import re
+from functools import lru_cache
+from typing import Optional
 
+import httpx
 import replicate
 from replicate.exceptions import ReplicateError as ReplicateAPIError
 
+# Keep-alive pool for the shared Replicate client (worker concurrency stays well below)
+REPLICATE_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class ReplicateError(Exception):
     """Base class for categorized Replicate API errors."""
@@ -32,6 +40,26 @@ class PermanentError(ReplicateError):
     retryable = False
 
 
+# All classification patterns in one alternation (status codes and keywords)
+_CLASSIFIER_RE = re.compile(
+    r"(?P<timeout>timeout)"
+    r"|(?P<rate_limit>429|rate limit)"
+    r"|(?P<unavailable>503|service unavailable)"
+    r"|(?P<auth>401|403|unauthorized|forbidden|authentication|invalid api token)"
+    r"|(?P<content_policy>content policy|nsfw|safety|inappropriate)",
+    re.IGNORECASE,
+)
+
+# Pattern group -> (error class, message prefix), in classification priority order
+_CLASSIFIER_DISPATCH: dict[str, tuple[type[ReplicateError], str]] = {
+    "timeout": (TransientError, "Network timeout"),
+    "rate_limit": (TransientError, "Rate limit exceeded"),
+    "unavailable": (TransientError, "Service unavailable"),
+    "auth": (PermanentError, "Authentication failed"),
+    "content_policy": (ContentPolicyError, "Content policy violation"),
+}
+
+
 def classify_error(exception: Exception) -> ReplicateError:
     """Classify exception into retry category.
 
@@ -51,48 +79,41 @@ def classify_error(exception: Exception) -> ReplicateError:
         - Connection errors → TransientError
     """
     error_message = str(exception)
-    error_message_lower = error_message.lower()
-
-    # Check for timeout errors
-    if "timeout" in error_message_lower:
-        return TransientError(f"Network timeout: {error_message}")
-
-    # Check for rate limiting
-    if "429" in error_message or "rate limit" in error_message_lower:
-        return TransientError(f"Rate limit exceeded: {error_message}")
-
-    # Check for service unavailability
-    if "503" in error_message or "service unavailable" in error_message_lower:
-        return TransientError(f"Service unavailable: {error_message}")
-
-    # Check for authentication issues
-    if (
-        "401" in error_message
-        or "403" in error_message
-        or "unauthorized" in error_message_lower
-        or "forbidden" in error_message_lower
-        or "authentication" in error_message_lower
-        or "invalid api token" in error_message_lower
-    ):
-        return PermanentError(f"Authentication failed: {error_message}")
-
-    # Check for content policy violations
-    if (
-        "content policy" in error_message_lower
-        or "nsfw" in error_message_lower
-        or "safety" in error_message_lower
-        or "inappropriate" in error_message_lower
-    ):
-        return ContentPolicyError(f"Content policy violation: {error_message}")
+
+    # httpx timeouts often carry an empty message - classify by type
+    if isinstance(exception, httpx.TimeoutException):
+        return TransientError(f"Network timeout: {error_message or type(exception).__name__}")
+
+    # Single scan over the message; categories are then resolved in priority order
+    matched = {match.lastgroup for match in _CLASSIFIER_RE.finditer(error_message)}
+    for category, (error_cls, description) in _CLASSIFIER_DISPATCH.items():
+        if category in matched:
+            return error_cls(f"{description}: {error_message}")
 
     # Check for connection errors (network layer)
-    if isinstance(exception, (ConnectionError, OSError)):
+    if isinstance(exception, (ConnectionError, OSError, httpx.TransportError)):
         return TransientError(f"Connection error: {error_message}")
 
     # Default: treat as permanent error
     return PermanentError(f"Permanent error: {error_message}")
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_token: str) -> replicate.Client:
+    """Return a Replicate client for the given API token (cached per token).
+
+    The client builds its httpx.AsyncClient once and reuses it, so every
+    prediction (create + status polls) shares pooled keep-alive connections
+    (multiplexed over HTTP/2 when h2 is installed) instead of a new TLS
+    handshake per image. Only async_run is used, hence an async transport;
+    replicate wraps it in its own retrying transport.
+    """
+    return replicate.Client(
+        api_token=api_token,
+        transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=REPLICATE_LIMITS),
+    )
+
+
 async def generate_image(prompt: str, api_token: str, model_version: Optional[str] = None) -> str:
     """Generate image using Replicate API.
 
@@ -116,22 +137,8 @@ async def generate_image(prompt: str, api_token: str, model_version: Optional[st
     model = model_version or "black-forest-labs/flux-schnell"
 
     try:
-        # Set API token via environment (Replicate SDK reads from REPLICATE_API_TOKEN env var)
-        # Run in thread pool as SDK is synchronous
-        def _run_replicate() -> Any:
-            # Temporarily set environment variable for this thread
-            old_token = os.environ.get("REPLICATE_API_TOKEN")
-            os.environ["REPLICATE_API_TOKEN"] = api_token
-            try:
-                return replicate.run(model, input={"prompt": prompt})
-            finally:
-                # Restore old token or remove if it didn't exist
-                if old_token is not None:
-                    os.environ["REPLICATE_API_TOKEN"] = old_token
-                else:
-                    os.environ.pop("REPLICATE_API_TOKEN", None)
-
-        output = await asyncio.to_thread(_run_replicate)
+        # Native async call - suspends on network I/O instead of holding a pool thread
+        output = await _get_client(api_token).async_run(model, input={"prompt": prompt})
 
         # Extract URL from output (format varies by model)
         if isinstance(output, list) and len(output) > 0:
@@ -148,7 +155,7 @@ async def generate_image(prompt: str, api_token: str, model_version: Optional[st
         classified = classify_error(e)
         raise classified from e
 
-    except (ConnectionError, OSError, TimeoutError) as e:
+    except (ConnectionError, OSError, TimeoutError, httpx.TransportError) as e:
         # Network-level errors
         classified = classify_error(e)
         raise classified from e
@@ -1,6 +1,13 @@
 """Pinata IPFS client for uploading images and metadata."""
 
+import asyncio
+import hashlib
+import importlib.util
+import io
 import json
+import random
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -13,16 +20,89 @@ from glisk.services.exceptions import (
     TransientError,
 )
 
+# Read size for streaming image downloads
+IMAGE_CHUNK_BYTES = 64 << 10
+
+# Fail fast on unreachable hosts; give multi-MB upload bodies room on slow links
+PINATA_TIMEOUT = httpx.Timeout(connect=5.0, read=60.0, write=60.0, pool=5.0)
+
+# HTTP/2 multiplexes concurrent uploads over one connection; httpx needs the
+# optional h2 package for it (installed via httpx[http2]), else HTTP/1.1 is used
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retry policy for rate-limited (429) / unavailable (5xx) Pinata responses
+PINATA_MAX_RETRIES = 3
+PINATA_BASE_DELAY = 1.0
+PINATA_MAX_DELAY = 30.0
+PINATA_JITTER = 0.5
+PINATA_RETRYABLE_STATUS = frozenset({429, 500, 503})
+
+# Default cap on in-flight Pinata POSTs per client
+DEFAULT_MAX_CONCURRENT_UPLOADS = 3
+
+# Default Pinata request budget per client (Pinata's free-plan API limit)
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+# Image CID cache (by source URL and by content hash): retries and duplicate
+# images reuse the pin instead of uploading the same bytes again
+IMAGE_CID_CACHE_SIZE = 1024
+IMAGE_CID_CACHE_TTL_SECONDS = 3600
+
+
+class _RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    Starts full, so a burst of up to ``rate`` requests passes immediately;
+    after that callers wait for the bucket to refill at a steady rate.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._refill_per_second = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._refill_per_second,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
 
 class PinataClient:
-    """IPFS upload client using Pinata pinning service."""
+    """IPFS upload client using Pinata pinning service.
+
+    Holds one long-lived httpx.AsyncClient so uploads reuse keep-alive
+    connections. Close it with aclose() or use the client as an async
+    context manager.
+    """
 
-    def __init__(self, jwt_token: str, gateway_domain: str = "gateway.pinata.cloud"):
+    def __init__(
+        self,
+        jwt_token: str,
+        gateway_domain: str = "gateway.pinata.cloud",
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    ):
         """Initialize Pinata client.
 
         Args:
             jwt_token: Pinata API JWT token (from PINATA_JWT env var)
             gateway_domain: Gateway domain for URL generation (default: public gateway)
+            max_concurrent_uploads: Maximum in-flight Pinata uploads for this client
+                (from PINATA_MAX_CONCURRENT_UPLOADS env var, default: 3)
+            requests_per_minute: Pinata API request budget for this client, retries
+                included (from PINATA_REQUESTS_PER_MINUTE env var, default: 60)
         """
         self.jwt_token = jwt_token
         self.gateway_domain = gateway_domain
@@ -32,9 +112,120 @@ class PinataClient:
             "Content-Type": "application/json",
         }
 
+        # Shared connection pool for Pinata API calls and image downloads.
+        # Auth headers are passed per Pinata request so they are never sent
+        # to third-party image hosts (e.g. Replicate CDN).
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=PINATA_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+        )
+
+        # Admission control: bursts queue here instead of tripping Pinata's 429s
+        self._upload_semaphore = asyncio.Semaphore(max_concurrent_uploads)
+
+        # Rate control: the semaphore caps in-flight requests, the bucket
+        # smooths how fast they start, so sustained bursts stay under the limit
+        self._rate_limiter = _RateLimiter(requests_per_minute)
+
+        # Image CIDs keyed by "url:<image_url>" / "sha256:<hex>":
+        # key -> (expires_at monotonic, cid), LRU order
+        self._image_cids: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # One lock per image URL being uploaded, so concurrent uploads of the
+        # same URL wait for the first one and reuse its CID
+        self._image_locks: dict[str, asyncio.Lock] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "PinataClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _post_with_retry(self, url: str, **kwargs: Any) -> httpx.Response:
+        """POST to Pinata, retrying 429/500/503 and network errors with backoff.
+
+        Delay is capped exponential backoff with jitter; a numeric Retry-After
+        header on 429 takes precedence. The final response (or network error)
+        is returned/raised unchanged so callers keep their error classification.
+        Non-retryable statuses (400/401/403) are returned immediately.
+
+        The whole retry sequence runs under the client's upload semaphore, so
+        backoff sleeps also hold back new uploads while Pinata is throttling.
+        Every attempt also takes a token from the client's rate limiter.
+
+        Args:
+            url: Pinata API path (relative to base_url)
+            **kwargs: Passed through to httpx.AsyncClient.post
+
+        Returns:
+            Last HTTP response received
+        """
+        async with self._upload_semaphore:
+            attempt = 0
+            while True:
+                # File bodies are consumed by each attempt - rewind before resending
+                files = kwargs.get("files") or {}
+                file_specs = files.values() if isinstance(files, dict) else (f for _, f in files)
+                for file_spec in file_specs:
+                    if hasattr(file_spec[1], "seek"):
+                        file_spec[1].seek(0)
+
+                retry_after = None
+                await self._rate_limiter.acquire()
+                try:
+                    response = await self._client.post(url, **kwargs)
+                except httpx.TransportError:
+                    if attempt == PINATA_MAX_RETRIES:
+                        raise
+                else:
+                    if (
+                        response.status_code not in PINATA_RETRYABLE_STATUS
+                        or attempt == PINATA_MAX_RETRIES
+                    ):
+                        return response
+                    if response.status_code == 429:
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+                if retry_after is not None:
+                    delay = min(PINATA_MAX_DELAY, retry_after)
+                else:
+                    delay = min(PINATA_MAX_DELAY, PINATA_BASE_DELAY * 2**attempt)
+                    delay *= 1 + random.random() * PINATA_JITTER
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _cached_image_cid(self, key: str) -> str | None:
+        """Return a cached, unexpired image CID for ``key`` (None on miss)."""
+        cached = self._image_cids.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del self._image_cids[key]
+            return None
+        self._image_cids.move_to_end(key)
+        return cached[1]
+
+    def _cache_image_cid(self, cid: str, *keys: str) -> None:
+        """Remember ``cid`` under each key, evicting the least recently used."""
+        expires_at = time.monotonic() + IMAGE_CID_CACHE_TTL_SECONDS
+        for key in keys:
+            self._image_cids[key] = (expires_at, cid)
+            self._image_cids.move_to_end(key)
+        while len(self._image_cids) > IMAGE_CID_CACHE_SIZE:
+            self._image_cids.popitem(last=False)
+
     async def upload_image(self, image_url: str, token_id: int) -> str:
         """Download image from URL and upload to IPFS via Pinata.
 
+        CIDs are cached for IMAGE_CID_CACHE_TTL_SECONDS by source URL and by
+        content hash, so a retried token or an identical image skips the
+        upload. Concurrent calls for the same URL are coalesced.
+
         Args:
             image_url: HTTP/HTTPS URL of image to upload (e.g., Replicate CDN URL)
             token_id: Token ID for semantic filename (e.g., s0-token-123.png)
@@ -46,65 +237,83 @@ class PinataClient:
             TransientError: Network timeout, rate limit (429), service unavailable (503)
             PermanentError: Invalid API key (401), forbidden (403), bad request (400)
         """
+        url_key = f"url:{image_url}"
+        cid = self._cached_image_cid(url_key)
+        if cid is not None:
+            return cid
+
+        lock = self._image_locks.setdefault(image_url, asyncio.Lock())
         try:
-            # Download image from URL
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                image_response = await client.get(image_url)
-                image_response.raise_for_status()
-                image_data = image_response.content
+            async with lock:
+                # A concurrent call for the same URL may have finished meanwhile
+                cid = self._cached_image_cid(url_key)
+                if cid is None:
+                    cid = await self._upload_image(image_url, token_id, url_key)
+                return cid
+        finally:
+            if not lock.locked() and self._image_locks.get(image_url) is lock:
+                del self._image_locks[image_url]
+
+    async def _upload_image(self, image_url: str, token_id: int, url_key: str) -> str:
+        """Download and pin one image, skipping the upload on a content-hash hit.
 
-            # Upload to Pinata with semantic filename
+        Args:
+            image_url: HTTP/HTTPS URL of image to upload
+            token_id: Token ID for semantic filename
+            url_key: Cache key of image_url
+
+        Returns:
+            IPFS CID of the image
+        """
+        try:
             filename = f"s0-token-{token_id}.png"
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                files = {"file": (filename, image_data, "image/png")}
-                headers_copy = self.headers.copy()
-                # Remove Content-Type for multipart upload
-                del headers_copy["Content-Type"]
-
-                # Prepare metadata for Pinata dashboard organization
-                pinata_metadata = {
-                    "name": filename,
-                    "keyvalues": {"season": "0", "token_id": str(token_id)},
-                }
+            headers_copy = self.headers.copy()
+            # Remove Content-Type for multipart upload
+            del headers_copy["Content-Type"]
 
-                response = await client.post(
-                    f"{self.base_url}/pinning/pinFileToIPFS",
+            # Prepare metadata for Pinata dashboard organization
+            pinata_metadata = {
+                "name": filename,
+                "keyvalues": {"season": "0", "token_id": str(token_id)},
+            }
+
+            # Stream image download into one in-memory buffer (hashed as it
+            # arrives) that is uploaded as-is. httpx multipart needs a sized, sync
+            # readable file - BytesIO is sized via seek/tell without touching disk -
+            # so the body cannot be piped from the download directly.
+            with io.BytesIO() as image_file:
+                digest = hashlib.sha256()
+                async with self._client.stream("GET", image_url) as image_response:
+                    image_response.raise_for_status()
+                    async for chunk in image_response.aiter_bytes(IMAGE_CHUNK_BYTES):
+                        image_file.write(chunk)
+                        digest.update(chunk)
+                image_file.seek(0)
+
+                # Same bytes already pinned (under another URL): reuse the CID
+                hash_key = f"sha256:{digest.hexdigest()}"
+                cid = self._cached_image_cid(hash_key)
+                if cid is not None:
+                    self._cache_image_cid(cid, url_key)
+                    return cid
+
+                # Upload to Pinata with semantic filename
+                response = await self._post_with_retry(
+                    "/pinning/pinFileToIPFS",
                     headers=headers_copy,
-                    files=files,
+                    files={"file": (filename, image_file, "image/png")},
                     data={
                         "pinataOptions": '{"cidVersion": 1}',
                         "pinataMetadata": json.dumps(pinata_metadata),
                     },
                 )
 
-                # Error classification
-                if response.status_code == 429:
-                    raise IPFSRateLimitError(f"Rate limit exceeded: {response.text}")
-                elif response.status_code in (500, 503):
-                    raise TransientError(
-                        f"Service unavailable ({response.status_code}): {response.text}"
-                    )
-                elif response.status_code == 401:
-                    raise IPFSAuthError(
-                        "Unauthorized: Invalid API key. "
-                        "Check PINATA_JWT configuration in .env file. "
-                        "Verify JWT token is active at https://app.pinata.cloud/developers/api-keys"
-                    )
-                elif response.status_code == 403:
-                    raise IPFSAuthError(
-                        "Forbidden: Access denied. "
-                        "Check PINATA_JWT permissions (requires pinFileToIPFS access). "
-                        "Verify account status and quota limits at https://app.pinata.cloud/billing"
-                    )
-                elif response.status_code == 400:
-                    raise IPFSValidationError(f"Bad request: {response.text}")
-
-                response.raise_for_status()
-                result = response.json()
-                return result["IpfsHash"]
+            cid = _parse_pin_response(response, "pinFileToIPFS")
+            self._cache_image_cid(cid, url_key, hash_key)
+            return cid
 
         except httpx.TimeoutException as e:
-            raise IPFSNetworkError(f"Request timeout after 30s: {str(e)}")
+            raise IPFSNetworkError(f"Request timeout ({type(e).__name__}): {str(e)}")
         except httpx.HTTPError as e:
             if isinstance(e, httpx.HTTPStatusError):
                 # Already handled above
@@ -130,57 +339,119 @@ class PinataClient:
             PermanentError: Invalid API key (401), forbidden (403), bad request (400)
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                metadata_filename = f"s0-token-{token_id}-metadata.json"
-                payload = {
-                    "pinataContent": metadata,
-                    "pinataOptions": {"cidVersion": 1},
-                    "pinataMetadata": {
-                        "name": metadata_filename,
-                        "keyvalues": {"season": "0", "token_id": str(token_id)},
-                    },
-                }
+            metadata_filename = f"s0-token-{token_id}-metadata.json"
+            payload = {
+                "pinataContent": metadata,
+                "pinataOptions": {"cidVersion": 1},
+                "pinataMetadata": {
+                    "name": metadata_filename,
+                    "keyvalues": {"season": "0", "token_id": str(token_id)},
+                },
+            }
 
-                response = await client.post(
-                    f"{self.base_url}/pinning/pinJSONToIPFS",
-                    headers=self.headers,
-                    json=payload,
-                )
+            # Serialized once up front; retries resend the same bytes
+            response = await self._post_with_retry(
+                "/pinning/pinJSONToIPFS",
+                headers=self.headers,
+                content=_dumps(payload),
+            )
 
-                # Error classification (same as upload_image)
-                if response.status_code == 429:
-                    raise IPFSRateLimitError(f"Rate limit exceeded: {response.text}")
-                elif response.status_code in (500, 503):
-                    raise TransientError(
-                        f"Service unavailable ({response.status_code}): {response.text}"
-                    )
-                elif response.status_code == 401:
-                    raise IPFSAuthError(
-                        "Unauthorized: Invalid API key. "
-                        "Check PINATA_JWT configuration in .env file. "
-                        "Verify JWT token is active at https://app.pinata.cloud/developers/api-keys"
-                    )
-                elif response.status_code == 403:
-                    raise IPFSAuthError(
-                        "Forbidden: Access denied. "
-                        "Check PINATA_JWT permissions (requires pinJSONToIPFS access). "
-                        "Verify account status and quota limits at https://app.pinata.cloud/billing"
-                    )
-                elif response.status_code == 400:
-                    raise IPFSValidationError(f"Bad request: {response.text}")
-
-                response.raise_for_status()
-                result = response.json()
-                return result["IpfsHash"]
+            return _parse_pin_response(response, "pinJSONToIPFS")
 
         except httpx.TimeoutException as e:
-            raise IPFSNetworkError(f"Request timeout after 30s: {str(e)}")
+            raise IPFSNetworkError(f"Request timeout ({type(e).__name__}): {str(e)}")
         except httpx.HTTPError as e:
             if isinstance(e, httpx.HTTPStatusError):
                 # Already handled above
                 raise
             raise IPFSNetworkError(f"Network error: {str(e)}")
 
+    async def upload_image_batch(self, items: list[tuple[int, bytes]]) -> dict[int, str]:
+        """Upload many token images as one IPFS directory in a single request.
+
+        Files keep their semantic names inside the directory, so each token's
+        image is addressable as <dirCID>/s0-token-<id>.png.
+
+        Args:
+            items: (token_id, PNG bytes) pairs
+
+        Returns:
+            Mapping of token_id to IPFS path "<dirCID>/s0-token-<id>.png"
+
+        Raises:
+            TransientError: Network timeout, rate limit (429), service unavailable (503)
+            PermanentError: Invalid API key (401), forbidden (403), bad request (400)
+        """
+        files = {token_id: (f"s0-token-{token_id}.png", data) for token_id, data in items}
+        return await self._upload_directory(files, "image/png", "s0-images")
+
+    async def upload_metadata_batch(
+        self, items: list[tuple[int, dict[str, Any]]]
+    ) -> dict[int, str]:
+        """Upload many metadata JSON documents as one IPFS directory.
+
+        Args:
+            items: (token_id, ERC721 metadata dict) pairs
+
+        Returns:
+            Mapping of token_id to IPFS path "<dirCID>/s0-token-<id>-metadata.json"
+
+        Raises:
+            TransientError: Network timeout, rate limit (429), service unavailable (503)
+            PermanentError: Invalid API key (401), forbidden (403), bad request (400)
+        """
+        files = {
+            token_id: (f"s0-token-{token_id}-metadata.json", _dumps(metadata))
+            for token_id, metadata in items
+        }
+        return await self._upload_directory(files, "application/json", "s0-metadata")
+
+    async def _upload_directory(
+        self,
+        files: dict[int, tuple[str, bytes]],
+        content_type: str,
+        name: str,
+    ) -> dict[int, str]:
+        """Pin files wrapped in one directory via a single pinFileToIPFS call.
+
+        Args:
+            files: token_id -> (filename, content)
+            content_type: MIME type for every file part
+            name: Pinata dashboard name for the directory pin
+
+        Returns:
+            Mapping of token_id to "<dirCID>/<filename>"
+        """
+        if not files:
+            return {}
+
+        headers_copy = self.headers.copy()
+        del headers_copy["Content-Type"]
+
+        try:
+            response = await self._post_with_retry(
+                "/pinning/pinFileToIPFS",
+                headers=headers_copy,
+                files=[
+                    ("file", (filename, content, content_type))
+                    for filename, content in files.values()
+                ],
+                data={
+                    "pinataOptions": '{"cidVersion": 1, "wrapWithDirectory": true}',
+                    "pinataMetadata": json.dumps({"name": name, "keyvalues": {"season": "0"}}),
+                },
+            )
+            dir_cid = _parse_pin_response(response, "pinFileToIPFS")
+
+        except httpx.TimeoutException as e:
+            raise IPFSNetworkError(f"Request timeout ({type(e).__name__}): {str(e)}")
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                raise
+            raise IPFSNetworkError(f"Network error: {str(e)}")
+
+        return {token_id: f"{dir_cid}/{filename}" for token_id, (filename, _) in files.items()}
+
     def get_gateway_url(self, cid: str) -> str:
         """Convert CID to gateway URL for browser access.
 
@@ -191,3 +462,56 @@ class PinataClient:
             Gateway URL (e.g., "https://gateway.pinata.cloud/ipfs/<CID>")
         """
         return f"https://{self.gateway_domain}/ipfs/{cid}"
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize JSON compactly straight to request-body bytes."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds (HTTP-date form is ignored)."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _parse_pin_response(response: httpx.Response, endpoint: str) -> str:
+    """Classify a Pinata pin response and return the pinned CID.
+
+    Args:
+        response: Final response from a Pinata pinning endpoint
+        endpoint: Endpoint name used in the permission hint (e.g., "pinFileToIPFS")
+
+    Returns:
+        IPFS CID (IpfsHash) from the response body
+
+    Raises:
+        TransientError: Rate limit (429), service unavailable (500/503)
+        PermanentError: Invalid API key (401), forbidden (403), bad request (400)
+    """
+    if response.status_code == 429:
+        raise IPFSRateLimitError(f"Rate limit exceeded: {response.text}")
+    elif response.status_code in (500, 503):
+        raise TransientError(f"Service unavailable ({response.status_code}): {response.text}")
+    elif response.status_code == 401:
+        raise IPFSAuthError(
+            "Unauthorized: Invalid API key. "
+            "Check PINATA_JWT configuration in .env file. "
+            "Verify JWT token is active at https://app.pinata.cloud/developers/api-keys"
+        )
+    elif response.status_code == 403:
+        raise IPFSAuthError(
+            "Forbidden: Access denied. "
+            f"Check PINATA_JWT permissions (requires {endpoint} access). "
+            "Verify account status and quota limits at https://app.pinata.cloud/billing"
+        )
+    elif response.status_code == 400:
+        raise IPFSValidationError(f"Bad request: {response.text}")
+
+    response.raise_for_status()
+    result = response.json()
+    return result["IpfsHash"]
@@ -8,34 +8,109 @@ Used for authenticating wallet owners when updating their author profiles
 without requiring on-chain transactions.
 """
 
+import asyncio
+import binascii
+import re
+from functools import lru_cache
+
 import structlog
 from eth_account import Account
 from eth_account.messages import _hash_eip191_message, encode_defunct
+from eth_hash.auto import keccak
+from eth_hash.utils import auto_choose_backend
 from eth_utils.address import to_checksum_address
 from web3 import Web3
 
 logger = structlog.get_logger()
 
+# keccak256(b"") - known-answer check for the active keccak backend
+KECCAK256_EMPTY = bytes.fromhex("c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470")
+
+# Well-formed 0x-prefixed address (any checksum casing)
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
 # ERC-1271 magic value for valid signatures
 ERC1271_MAGIC_VALUE = bytes.fromhex("1626ba7e")
 
-# Minimal ABI for ERC-1271 isValidSignature function
-ERC1271_ABI = [
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_hash", "type": "bytes32"},
-            {"name": "_signature", "type": "bytes"},
-        ],
-        "name": "isValidSignature",
-        "outputs": [{"name": "magicValue", "type": "bytes4"}],
-        "type": "function",
-    }
-]
-
-
-def verify_wallet_signature(
-    wallet_address: str, message: str, signature: str, w3: Web3 | None = None
+# isValidSignature(bytes32,bytes) selector - equal to the magic value by design
+ERC1271_SELECTOR = ERC1271_MAGIC_VALUE
+
+# ABI head for isValidSignature args: offset of the dynamic `bytes` tail (after 2 words)
+_ERC1271_SIGNATURE_OFFSET = (64).to_bytes(32, "big")
+
+
+def check_keccak_backend() -> str:
+    """Verify the eth-hash keccak backend and return its name.
+
+    eth-hash selects a native backend (pycryptodome via web3's
+    eth-hash[pycryptodome] extra, or pysha3), overridable with ETH_HASH_BACKEND.
+    Called once at startup so a broken or missing backend fails fast instead of
+    on the first signature verification.
+
+    Returns:
+        Backend module name (e.g., "eth_hash.backends.pycryptodome")
+
+    Raises:
+        RuntimeError: If keccak256 does not produce the known answer
+    """
+    backend = auto_choose_backend()
+    if keccak(b"") != KECCAK256_EMPTY:
+        raise RuntimeError(f"keccak backend {type(backend).__module__} failed self-check")
+    return type(backend).__module__
+
+
+@lru_cache(maxsize=16384)
+def _checksum_address(wallet_address: str) -> str:
+    """EIP-55 checksum an address, memoized (each conversion runs a keccak)."""
+    return to_checksum_address(wallet_address)
+
+
+# Upper bound on remembered deployed smart wallets (cleared when exceeded)
+DEPLOYED_WALLET_CACHE_SIZE = 4096
+
+# (w3, checksummed address) pairs known to have contract code. Only positive
+# results are cached: deployed code is immutable, while undeployed smart
+# wallets may be deployed lazily at any time.
+_deployed_wallets: set[tuple[Web3, str]] = set()
+
+
+def _is_contract_deployed(w3: Web3, checksummed_address: str) -> bool:
+    """Return True if the address has contract code, caching positive results.
+
+    Keyed by Web3 instance so wallets on different networks never share entries.
+    """
+    key = (w3, checksummed_address)
+    if key in _deployed_wallets:
+        return True
+
+    if len(w3.eth.get_code(checksummed_address)) == 0:
+        return False
+
+    if len(_deployed_wallets) >= DEPLOYED_WALLET_CACHE_SIZE:
+        _deployed_wallets.clear()
+    _deployed_wallets.add(key)
+    return True
+
+
+def _encode_is_valid_signature(message_hash: bytes, signature: bytes) -> bytes:
+    """Hand-encode isValidSignature(bytes32,bytes) calldata (no ABI codec pass)."""
+    padding = b"\x00" * (-len(signature) % 32)
+    return (
+        ERC1271_SELECTOR
+        + message_hash
+        + _ERC1271_SIGNATURE_OFFSET
+        + len(signature).to_bytes(32, "big")
+        + signature
+        + padding
+    )
+
+
+async def verify_wallet_signature(
+    wallet_address: str,
+    message: str,
+    signature: str,
+    w3: Web3 | None = None,
+    message_hash_bytes: bytes | None = None,
 ) -> bool:
     """Verify EIP-191 (EOA) or ERC-1271 (Smart Wallet) signature.
 
@@ -57,35 +132,50 @@ def verify_wallet_signature(
                   - Smart Wallet: Variable-length ERC-1271 signature data
         w3: Web3 instance for ERC-1271 on-chain verification (required for smart wallets).
            If None, only EIP-191 signatures will be supported.
+        message_hash_bytes: Optional precomputed EIP-191 hash of message
+           (keccak256("\\x19Ethereum Signed Message:\\n{len}" + message)).
+           Callers verifying several signatures over one message can pass it
+           to skip rehashing; computed on demand when omitted.
 
     Returns:
         bool: True if the signature was created by the claimed wallet address,
-             False if the signature is invalid or was created by a different wallet.
+             False if the signature is invalid, was created by a different wallet,
+             or wallet_address is not a well-formed 0x-prefixed address.
 
     Raises:
-        ValueError: If signature format is invalid, recovery fails, or
+        ValueError: If signature is empty or malformed, recovery fails, or
                    w3 is required but not provided for ERC-1271 signatures.
 
     Example:
         >>> # EOA wallet (MetaMask)
-        >>> verify_wallet_signature("0x742d35Cc...", message, ecdsa_sig)
+        >>> await verify_wallet_signature("0x742d35Cc...", message, ecdsa_sig)
         True
 
         >>> # Smart wallet (Base Account) - requires Web3
         >>> from web3 import Web3
         >>> w3 = Web3(Web3.HTTPProvider("https://..."))
-        >>> verify_wallet_signature("0x742d35Cc...", message, erc1271_sig, w3=w3)
+        >>> await verify_wallet_signature("0x742d35Cc...", message, erc1271_sig, w3=w3)
         True
 
     Security Notes:
         - Uses checksummed address comparison (EIP-55)
         - ERC-1271 makes on-chain call to contract.isValidSignature()
+          (blocking Web3 RPC calls run in a worker thread, off the event loop)
         - Does not validate message content or timestamp - caller must validate
         - Does not prevent signature replay - caller should implement nonce/timestamp checks
     """
+    # Cheap rejections before any hashing or RPC work
+    if not isinstance(wallet_address, str) or not _ADDRESS_RE.fullmatch(wallet_address):
+        logger.warning("wallet_signature_invalid_address", wallet_address=wallet_address)
+        return False
+    signature_hex = signature[2:] if signature.startswith("0x") else signature
+    if not signature_hex:
+        raise ValueError("Invalid signature: empty")
+
     # Convert signature to bytes for length detection
+    # (a2b_hex is strict: no whitespace, errors are binascii.Error - a ValueError)
     try:
-        signature_bytes = bytes.fromhex(signature.removeprefix("0x"))
+        signature_bytes = binascii.a2b_hex(signature_hex)
     except ValueError as e:
         logger.error(
             "wallet_signature_hex_decode_error",
@@ -112,13 +202,15 @@ def verify_wallet_signature(
 
     try:
         # Encode message using EIP-191 personal message format
-        # This prepends "\x19Ethereum Signed Message:\n{len(message)}" to the message
-        message_hash = encode_defunct(text=message)
-        checksummed_input = to_checksum_address(wallet_address)
+        # This prepends "\x19Ethereum Signed Message:\n{len(message)}" to the message;
+        # the keccak256 digest is hashed once and shared by both branches
+        if message_hash_bytes is None:
+            message_hash_bytes = _hash_eip191_message(encode_defunct(text=message))
+        checksummed_input = _checksum_address(wallet_address)
 
         if is_eoa_signature:
             # EIP-191: ECDSA signature recovery (EOA wallets like MetaMask)
-            recovered_address = Account.recover_message(message_hash, signature=signature)
+            recovered_address = Account._recover_hash(message_hash_bytes, signature=signature_bytes)
 
             # Compare checksummed addresses
             is_valid = recovered_address == checksummed_input
@@ -155,8 +247,7 @@ def verify_wallet_signature(
 
             # Check if contract is deployed (smart wallets are deployed lazily)
             try:
-                contract_code = w3.eth.get_code(checksummed_input)
-                if len(contract_code) == 0:
+                if not await asyncio.to_thread(_is_contract_deployed, w3, checksummed_input):
                     logger.warning(
                         "erc1271_contract_not_deployed",
                         wallet_address=checksummed_input,
@@ -178,25 +269,17 @@ def verify_wallet_signature(
                 )
                 raise ValueError(f"Failed to check if smart wallet is deployed: {str(e)}")
 
-            # Create contract instance for isValidSignature call
-            contract = w3.eth.contract(address=checksummed_input, abi=ERC1271_ABI)
-
-            # Get the bytes32 hash for ERC-1271
-            # Must use full EIP-191 prefixed hash (same as wallet signed)
-            # Format: keccak256("\x19Ethereum Signed Message:\n{len}" + message)
-            message_hash_bytes = _hash_eip191_message(message_hash)
-
-            # Call isValidSignature(bytes32 hash, bytes signature)
+            # ERC-1271 takes the same full EIP-191 prefixed hash the wallet signed
+            # Call isValidSignature(bytes32 hash, bytes signature) via raw eth_call
+            call_data = _encode_is_valid_signature(message_hash_bytes, signature_bytes)
             try:
-                magic_value = contract.functions.isValidSignature(
-                    message_hash_bytes, signature_bytes
-                ).call()
-
-                # Convert result to bytes if it's hex string
-                if isinstance(magic_value, str):
-                    magic_value = bytes.fromhex(magic_value.removeprefix("0x"))
-                elif isinstance(magic_value, int):
-                    magic_value = magic_value.to_bytes(4, byteorder="big")
+                result = await asyncio.to_thread(
+                    w3.eth.call,
+                    {"to": checksummed_input, "data": call_data},
+                )
+
+                # bytes4 return value is left-aligned in the first ABI word
+                magic_value = bytes(result[:4])
 
                 is_valid = magic_value == ERC1271_MAGIC_VALUE
 
@@ -17,8 +17,10 @@ References:
 - PKCE RFC 7636: https://datatracker.ietf.org/doc/html/rfc7636
 """
 
+import asyncio
 import base64
 import hashlib
+import importlib.util
 import secrets
 import time
 from dataclasses import dataclass
@@ -38,31 +40,67 @@ X_USER_INFO_URL = "https://api.x.com/2/users/me"
 # OAuth state TTL (5 minutes in seconds)
 OAUTH_STATE_TTL_SECONDS = 300
 
+# Hard cap on pending OAuth states (oldest evicted first when full)
+MAX_OAUTH_STATES = 10_000
+
+# Interval for the background sweeper that purges expired OAuth states
+OAUTH_STATE_SWEEP_INTERVAL_SECONDS = 60
+
+# Shared X API client settings (keep-alive pool reused across OAuth callbacks)
+X_API_TIMEOUT_SECONDS = 30.0
+X_API_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# sha256(b"") known answer, for the startup hashlib self-check
+SHA256_EMPTY = bytes.fromhex("e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855")
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def check_sha256() -> None:
+    """Verify hashlib's SHA-256 (used for PKCE challenges) against a known answer.
+
+    Raises:
+        RuntimeError: If sha256 does not produce the known answer
+    """
+    if hashlib.sha256(b"").digest() != SHA256_EMPTY:
+        raise RuntimeError("hashlib sha256 failed self-check")
+
+
+def _b64url_nopad(data: bytes) -> bytes:
+    """Base64-URL encode without "=" padding (RFC 7636 / RFC 4648 section 5)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 @dataclass
 class OAuthState:
     """Temporary OAuth state for PKCE flow (5-minute TTL).
 
     Attributes:
-        state: Random CSRF token (serves as dict key for lookup)
-        code_verifier: PKCE code verifier (43-128 chars, used to verify token exchange)
+        state: Random CSRF token as ASCII bytes (serves as dict key for lookup)
+        code_verifier: PKCE code verifier as ASCII bytes (43-128 chars, used to verify
+            token exchange)
         wallet_address: Author's wallet address (for updating after OAuth completes)
-        created_at: Unix timestamp when state was created
-        expires_at: Unix timestamp when state expires (created_at + 300 seconds)
+        created_at: time.monotonic() value when state was created (TTL math only,
+            immune to wall-clock jumps; not a wall-clock time)
+        expires_at: time.monotonic() deadline (created_at + 300 seconds)
     """
 
-    state: str
-    code_verifier: str
+    state: bytes
+    code_verifier: bytes
     wallet_address: str
     created_at: float
     expires_at: float
 
 
 # Module-level in-memory storage for OAuth state (no Redis for MVP)
-# Key: state parameter (random CSRF token)
+# Key: state parameter (random CSRF token) as ASCII bytes - smaller than str and
+#      only decoded at the URL/log boundary
 # Value: OAuthState dataclass with PKCE verifier and wallet address
 # Lifetime: 5 minutes (auto-cleanup on access or manual cleanup)
-oauth_state_storage: dict[str, OAuthState] = {}
+# Ordering: dicts keep insertion order and every state gets the same TTL, so
+# the oldest (first-expiring) entries are always at the front.
+oauth_state_storage: dict[bytes, OAuthState] = {}
 
 
 class XOAuthService:
@@ -73,6 +111,9 @@ class XOAuthService:
     temporary state storage, exchanges authorization codes for tokens, and fetches
     usernames from the X API.
 
+    One instance is created per application (see the app lifespan) so its
+    HTTP connection pool is shared across requests.
+
     Example:
         >>> service = XOAuthService(client_id="abc123", redirect_uri="http://localhost:8000/callback")
         >>> auth_url = service.build_authorization_url("0x742d35Cc...")
@@ -81,19 +122,51 @@ class XOAuthService:
         >>> # Update author record with username
     """
 
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize X OAuth service.
 
         Args:
             client_id: X application client ID from Developer Portal
             client_secret: X application client secret from Developer Portal
             redirect_uri: OAuth callback URI (must match X app configuration exactly)
+            http_client: Optional shared AsyncClient; by default the service creates
+                its own pooled client (close it with aclose())
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
 
-    def generate_pkce_pair(self) -> tuple[str, str]:
+        # Static authorization URL parameters, encoded once; only state and
+        # code_challenge (base64-url, already URL-safe) vary per request
+        self._auth_url_prefix = f"{X_AUTHORIZATION_URL}?" + urlencode(
+            {
+                "response_type": "code",
+                "client_id": client_id,
+                "redirect_uri": redirect_uri,
+                "scope": "tweet.read users.read",  # Required scopes for /2/users/me endpoint
+                "code_challenge_method": "S256",  # SHA256 hashing
+            }
+        )
+
+        # Long-lived client so token exchange and username fetch reuse one
+        # TLS connection to api.x.com instead of a handshake per call
+        self._client = http_client or httpx.AsyncClient(
+            timeout=X_API_TIMEOUT_SECONDS,
+            limits=X_API_LIMITS,
+            http2=HTTP2_AVAILABLE,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    def generate_pkce_pair(self) -> tuple[bytes, bytes]:
         """Generate PKCE code verifier and code challenge pair.
 
         PKCE (Proof Key for Code Exchange) prevents authorization code interception
@@ -105,7 +178,7 @@ class XOAuthService:
         - code_challenge: Base64-URL encoded SHA256 hash of code_verifier
 
         Returns:
-            tuple[str, str]: (code_verifier, code_challenge)
+            tuple[bytes, bytes]: (code_verifier, code_challenge) as ASCII bytes
                 - code_verifier: Random string to store temporarily (43 chars)
                 - code_challenge: SHA256 hash for authorization URL (43 chars)
 
@@ -118,27 +191,15 @@ class XOAuthService:
         """
         # Generate cryptographically random code verifier (32 bytes → 43 chars base64)
         # Use secrets module for cryptographically strong randomness
-        code_verifier = (
-            base64.urlsafe_b64encode(secrets.token_bytes(32)).decode("utf-8").rstrip("=")
-        )
+        code_verifier = _b64url_nopad(secrets.token_bytes(32))
 
-        # Generate code challenge (SHA256 hash of verifier)
+        # Generate code challenge (SHA256 hash of verifier's ASCII bytes)
         # Base64-URL encode with padding removed (per RFC 7636)
-        code_challenge = (
-            base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode("utf-8")).digest())
-            .decode("utf-8")
-            .rstrip("=")
-        )
-
-        logger.debug(
-            "pkce_pair_generated",
-            verifier_length=len(code_verifier),
-            challenge_length=len(code_challenge),
-        )
+        code_challenge = _b64url_nopad(hashlib.sha256(code_verifier).digest())
 
         return code_verifier, code_challenge
 
-    def generate_state(self) -> str:
+    def generate_state(self) -> bytes:
         """Generate random state parameter for CSRF protection.
 
         The state parameter is a cryptographically random string that prevents
@@ -147,7 +208,7 @@ class XOAuthService:
         request from this application.
 
         Returns:
-            str: Random state string (43 characters, base64-url encoded)
+            bytes: Random state as ASCII bytes (43 characters, base64-url encoded)
 
         Example:
             >>> state = service.generate_state()
@@ -155,11 +216,7 @@ class XOAuthService:
             43
         """
         # Generate 32 bytes of cryptographically random data → 43 chars base64
-        state = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode("utf-8").rstrip("=")
-
-        logger.debug("oauth_state_generated", state_length=len(state))
-
-        return state
+        return _b64url_nopad(secrets.token_bytes(32))
 
     def build_authorization_url(self, wallet_address: str) -> str:
         """Build X authorization URL with PKCE parameters and store state.
@@ -176,15 +233,17 @@ class XOAuthService:
 
         Side Effects:
             - Stores OAuthState in oauth_state_storage with 5-minute TTL
-            - Cleans up expired OAuth states before creating new one
+            - Evicts the oldest states if MAX_OAUTH_STATES is reached
 
         Example:
             >>> url = service.build_authorization_url("0x742d35Cc...")
             >>> print(url)
             https://x.com/i/oauth2/authorize?response_type=code&client_id=...
         """
-        # Cleanup expired states before creating new one
-        cleanup_expired_oauth_states()
+        # Expired states are purged by run_oauth_state_sweeper (off the request path)
+        # Enforce capacity: evict oldest pending states under a flood of starts
+        while len(oauth_state_storage) >= MAX_OAUTH_STATES:
+            del oauth_state_storage[next(iter(oauth_state_storage))]
 
         # Generate PKCE parameters
         code_verifier, code_challenge = self.generate_pkce_pair()
@@ -193,7 +252,7 @@ class XOAuthService:
         state = self.generate_state()
 
         # Store OAuth state in memory with 5-minute TTL
-        now = time.time()
+        now = time.monotonic()
         oauth_state = OAuthState(
             state=state,
             code_verifier=code_verifier,
@@ -207,31 +266,15 @@ class XOAuthService:
             "x_oauth_flow_started",
             wallet_address=wallet_address,
             state_count=len(oauth_state_storage),
-            state_preview=state[:8] + "...",
-        )
-
-        # Build authorization URL with all parameters
-        params = {
-            "response_type": "code",
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "scope": "tweet.read users.read",  # Required scopes for /2/users/me endpoint
-            "state": state,
-            "code_challenge": code_challenge,
-            "code_challenge_method": "S256",  # SHA256 hashing
-        }
-
-        authorization_url = f"{X_AUTHORIZATION_URL}?{urlencode(params)}"
-
-        logger.debug(
-            "authorization_url_built",
-            url_preview=authorization_url[:100] + "...",
-            params_count=len(params),
+            state_preview=state[:8].decode("ascii") + "...",
         )
 
-        return authorization_url
+        # Append the per-request parameters to the pre-encoded prefix (no
+        # urlencode/quote_plus: both values are base64-url ASCII)
+        query = b"".join((b"&state=", state, b"&code_challenge=", code_challenge))
+        return self._auth_url_prefix + query.decode("ascii")
 
-    async def exchange_code_for_token(self, code: str, code_verifier: str) -> str:
+    async def exchange_code_for_token(self, code: str, code_verifier: bytes) -> str:
         """Exchange authorization code for access token using PKCE.
 
         This method calls X's token endpoint to exchange the authorization code
@@ -240,7 +283,7 @@ class XOAuthService:
 
         Args:
             code: Authorization code from X OAuth callback (valid 30 seconds)
-            code_verifier: Original PKCE code verifier (must match challenge)
+            code_verifier: Original PKCE code verifier as stored in OAuthState
 
         Returns:
             str: Bearer access token for X API calls (valid 2 hours)
@@ -261,48 +304,47 @@ class XOAuthService:
             "grant_type": "authorization_code",
             "client_id": self.client_id,
             "redirect_uri": self.redirect_uri,
-            "code_verifier": code_verifier,
+            "code_verifier": code_verifier.decode("ascii"),
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    X_TOKEN_URL,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    auth=(self.client_id, self.client_secret),  # Basic Auth required by X API
-                )
+            response = await self._client.post(
+                X_TOKEN_URL,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                auth=(self.client_id, self.client_secret),  # Basic Auth required by X API
+            )
 
-                # Check for HTTP errors
-                if response.status_code != 200:
-                    error_detail = response.text[:200]
-                    logger.error(
-                        "x_token_exchange_failed",
-                        status_code=response.status_code,
-                        error=error_detail,
-                    )
-                    raise ValueError(
-                        f"X token exchange failed with status "
-                        f"{response.status_code}: {error_detail}"
-                    )
-
-                # Parse token response
-                token_data = response.json()
-                access_token = token_data.get("access_token")
-
-                if not access_token:
-                    logger.error(
-                        "x_token_exchange_missing_token", response_keys=list(token_data.keys())
-                    )
-                    raise ValueError("X token response missing access_token field")
-
-                logger.info(
-                    "x_token_exchange_success",
-                    token_type=token_data.get("token_type"),
-                    expires_in=token_data.get("expires_in"),
+            # Check for HTTP errors
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                # Error body is only read on failure
+                error_detail = response.text[:200]
+                logger.error(
+                    "x_token_exchange_failed",
+                    status_code=response.status_code,
+                    error=error_detail,
                 )
+                raise ValueError(
+                    f"X token exchange failed with status {response.status_code}: {error_detail}"
+                ) from e
+
+            # Parse token response
+            token_data = response.json()
+            access_token = token_data.get("access_token")
+
+            if not access_token:
+                logger.error("x_token_exchange_missing_token", response_keys=tuple(token_data))
+                raise ValueError("X token response missing access_token field")
+
+            logger.info(
+                "x_token_exchange_success",
+                token_type=token_data.get("token_type"),
+                expires_in=token_data.get("expires_in"),
+            )
 
-                return access_token
+            return access_token
 
         except httpx.TimeoutException as e:
             logger.error("x_token_exchange_timeout", error=str(e))
@@ -337,38 +379,37 @@ class XOAuthService:
         logger.debug("x_username_fetch_started")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    X_USER_INFO_URL,
-                    headers={"Authorization": f"Bearer {access_token}"},
+            response = await self._client.get(
+                X_USER_INFO_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+
+            # Check for HTTP errors
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                # Error body is only read on failure
+                error_detail = response.text[:200]
+                logger.error(
+                    "x_username_fetch_failed",
+                    status_code=response.status_code,
+                    error=error_detail,
                 )
+                raise ValueError(
+                    f"X user info fetch failed with status {response.status_code}: {error_detail}"
+                ) from e
+
+            # Parse user info response
+            user_data = response.json()
+            username = user_data.get("data", {}).get("username")
+
+            if not username:
+                logger.error("x_username_fetch_missing_field", response_keys=tuple(user_data))
+                raise ValueError("X user info response missing username field")
 
-                # Check for HTTP errors
-                if response.status_code != 200:
-                    error_detail = response.text[:200]
-                    logger.error(
-                        "x_username_fetch_failed",
-                        status_code=response.status_code,
-                        error=error_detail,
-                    )
-                    raise ValueError(
-                        f"X user info fetch failed with status "
-                        f"{response.status_code}: {error_detail}"
-                    )
-
-                # Parse user info response
-                user_data = response.json()
-                username = user_data.get("data", {}).get("username")
-
-                if not username:
-                    logger.error(
-                        "x_username_fetch_missing_field", response_keys=list(user_data.keys())
-                    )
-                    raise ValueError("X user info response missing username field")
-
-                logger.info("x_username_fetch_success", username=username)
-
-                return username
+            logger.info("x_username_fetch_success", username=username)
+
+            return username
 
         except httpx.TimeoutException as e:
             logger.error("x_username_fetch_timeout", error=str(e))
@@ -384,8 +425,9 @@ def cleanup_expired_oauth_states() -> int:
     """Remove expired OAuth state entries from in-memory storage.
 
     This utility function removes all OAuth states that have exceeded their
-    5-minute TTL. Called automatically before creating new states and can be
-    called manually for periodic cleanup.
+    5-minute TTL. Called periodically by run_oauth_state_sweeper and can be
+    called manually. Cost is proportional to the number of
+    expired entries, not the storage size.
 
     Returns:
         int: Number of expired states removed
@@ -395,10 +437,15 @@ def cleanup_expired_oauth_states() -> int:
         >>> print(f"Cleaned up {expired_count} expired states")
         Cleaned up 3 expired states
     """
-    now = time.time()
+    now = time.monotonic()
 
-    # Find all expired state keys
-    expired_keys = [state for state, data in oauth_state_storage.items() if now > data.expires_at]
+    # Expired states form a prefix of the insertion-ordered storage, so stop
+    # at the first live one instead of scanning every entry
+    expired_keys = []
+    for state, data in oauth_state_storage.items():
+        if now <= data.expires_at:
+            break
+        expired_keys.append(state)
 
     # Remove expired entries
     for key in expired_keys:
@@ -414,11 +461,31 @@ def cleanup_expired_oauth_states() -> int:
     return len(expired_keys)
 
 
+async def run_oauth_state_sweeper(
+    interval_seconds: float = OAUTH_STATE_SWEEP_INTERVAL_SECONDS,
+) -> None:
+    """Purge expired OAuth states periodically until cancelled.
+
+    Started as a background task in the app lifespan so expiry cleanup never
+    runs inside build_authorization_url.
+
+    Args:
+        interval_seconds: Delay between sweeps (default: 60)
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        cleanup_expired_oauth_states()
+
+
 def get_oauth_state(state: str) -> Optional[OAuthState]:
-    """Retrieve and validate OAuth state from in-memory storage.
+    """Consume and validate OAuth state from in-memory storage.
+
+    Removes the OAuth state for the state parameter and returns it if it hasn't
+    expired. States are single-use: a second lookup for the same state always
+    fails, so a leaked state cannot be replayed. Missing and expired states are
+    both reported as None; the caller logs the failure with request context.
 
-    This helper function retrieves OAuth state by the state parameter and
-    validates that it hasn't expired. Returns None if state not found or expired.
+    The expiry check stays here because the sweeper only runs once a minute.
 
     Args:
         state: State parameter from OAuth callback
@@ -426,10 +493,6 @@ def get_oauth_state(state: str) -> Optional[OAuthState]:
     Returns:
         Optional[OAuthState]: OAuth state if found and valid, None otherwise
 
-    Side Effects:
-        - Logs security events for missing or expired states
-        - Does NOT remove expired states (caller should handle cleanup)
-
     Example:
         >>> oauth_state = get_oauth_state(state_from_callback)
         >>> if oauth_state:
@@ -437,23 +500,13 @@ def get_oauth_state(state: str) -> Optional[OAuthState]:
         ... else:
         ...     print("State not found or expired")
     """
-    # Check if state exists
-    oauth_state = oauth_state_storage.get(state)
-
-    if not oauth_state:
-        logger.warning("x_oauth_state_not_found", state_preview=state[:8] + "...")
+    # Stored keys are ASCII bytes, so a non-ASCII state can never match
+    try:
+        oauth_state = oauth_state_storage.pop(state.encode("ascii"), None)
+    except UnicodeEncodeError:
         return None
 
-    # Check if state has expired
-    now = time.time()
-    if now > oauth_state.expires_at:
-        age_seconds = int(now - oauth_state.created_at)
-        logger.warning(
-            "x_oauth_state_expired",
-            state_preview=state[:8] + "...",
-            age_seconds=age_seconds,
-            ttl_seconds=OAUTH_STATE_TTL_SECONDS,
-        )
+    if oauth_state is None or time.monotonic() > oauth_state.expires_at:
         return None
 
     return oauth_state
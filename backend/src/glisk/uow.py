@@ -3,6 +3,8 @@
 Provides transaction management with automatic commit/rollback and access to all repositories.
 """
 
+from collections.abc import Callable
+
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -24,7 +26,7 @@ class UnitOfWork:
     Use as async context manager for automatic commit/rollback.
 
     Example:
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             author = await uow.authors.get_by_wallet(wallet)
             token = await uow.tokens.get_by_id(token_id)
             token.mark_generating()
@@ -32,6 +34,17 @@ class UnitOfWork:
             # Automatically rolls back on exception
     """
 
+    __slots__ = (
+        "session",
+        "_authors",
+        "_tokens",
+        "_mint_events",
+        "_image_jobs",
+        "_ipfs_records",
+        "_reveal_txs",
+        "_system_state",
+    )
+
     def __init__(self, session: AsyncSession):
         """Initialize UnitOfWork with database session.
 
@@ -39,15 +52,57 @@ class UnitOfWork:
             session: SQLAlchemy async session for database operations
         """
         self.session = session
-
-        # Instantiate all repositories with the session
-        self.authors = AuthorRepository(session)
-        self.tokens = TokenRepository(session)
-        self.mint_events = MintEventRepository(session)
-        self.image_jobs = ImageGenerationJobRepository(session)
-        self.ipfs_records = IPFSUploadRecordRepository(session)
-        self.reveal_txs = RevealTransactionRepository(session)
-        self.system_state = SystemStateRepository(session)
+        self._authors: AuthorRepository | None = None
+        self._tokens: TokenRepository | None = None
+        self._mint_events: MintEventRepository | None = None
+        self._image_jobs: ImageGenerationJobRepository | None = None
+        self._ipfs_records: IPFSUploadRecordRepository | None = None
+        self._reveal_txs: RevealTransactionRepository | None = None
+        self._system_state: SystemStateRepository | None = None
+
+    # Repositories are built on first access - most transactions touch only one or two
+
+    @property
+    def authors(self) -> AuthorRepository:
+        if self._authors is None:
+            self._authors = AuthorRepository(self.session)
+        return self._authors
+
+    @property
+    def tokens(self) -> TokenRepository:
+        if self._tokens is None:
+            self._tokens = TokenRepository(self.session)
+        return self._tokens
+
+    @property
+    def mint_events(self) -> MintEventRepository:
+        if self._mint_events is None:
+            self._mint_events = MintEventRepository(self.session)
+        return self._mint_events
+
+    @property
+    def image_jobs(self) -> ImageGenerationJobRepository:
+        if self._image_jobs is None:
+            self._image_jobs = ImageGenerationJobRepository(self.session)
+        return self._image_jobs
+
+    @property
+    def ipfs_records(self) -> IPFSUploadRecordRepository:
+        if self._ipfs_records is None:
+            self._ipfs_records = IPFSUploadRecordRepository(self.session)
+        return self._ipfs_records
+
+    @property
+    def reveal_txs(self) -> RevealTransactionRepository:
+        if self._reveal_txs is None:
+            self._reveal_txs = RevealTransactionRepository(self.session)
+        return self._reveal_txs
+
+    @property
+    def system_state(self) -> SystemStateRepository:
+        if self._system_state is None:
+            self._system_state = SystemStateRepository(self.session)
+        return self._system_state
 
     async def __aenter__(self):
         """Enter async context manager.
@@ -72,7 +127,7 @@ class UnitOfWork:
             if exc_type is None:
                 # No exception - commit changes
                 await self.session.commit()
-                logger.info("transaction.committed")
+                logger.debug("transaction.committed")
             else:
                 # Exception occurred - rollback changes
                 await self.session.rollback()
@@ -86,26 +141,28 @@ class UnitOfWork:
         return False
 
 
-def create_uow_factory(session_factory: async_sessionmaker[AsyncSession]):
+def create_uow_factory(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Callable[[], UnitOfWork]:
     """Create a factory function that produces UnitOfWork instances.
 
     Args:
         session_factory: SQLAlchemy async session factory
 
     Returns:
-        Callable that creates UnitOfWork instances from new sessions
+        Synchronous callable that creates UnitOfWork instances from new sessions
+        (nothing to await - use the result directly in ``async with``)
 
     Example:
         session_factory = setup_db_session(db_url, pool_size=200)
         uow_factory = create_uow_factory(session_factory)
 
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             await uow.authors.add(author)
     """
 
-    async def _create_uow():
+    def _create_uow() -> UnitOfWork:
         """Create a new UnitOfWork instance with a new session."""
-        session = session_factory()
-        return UnitOfWork(session)
+        return UnitOfWork(session_factory())
 
     return _create_uow
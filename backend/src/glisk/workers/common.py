@@ -0,0 +1,85 @@
+"""Helpers shared by the background workers.
+
+Polling limits, backoff with jitter, LISTEN/NOTIFY wake-ups and error text
+truncation used by both image_generation_worker.py and ipfs_upload_worker.py.
+"""
+
+import asyncio
+import random
+
+import psycopg
+import structlog
+from sqlalchemy.engine import make_url
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound for the idle wait between polls (doubles per empty batch)
+MAX_POLL_INTERVAL_SECONDS = 60
+
+# Random extra fraction added to every wait (spreads out idle/erroring workers)
+BACKOFF_JITTER = 0.5
+
+# Delay before reconnecting the LISTEN connection after a failure
+LISTEN_RECONNECT_SECONDS = 5
+
+# Cap for error text in logs and stored error columns (provider errors may
+# embed whole response bodies)
+ERROR_MESSAGE_MAX_LENGTH = 512
+
+
+def short_error(error: BaseException, cap: int = ERROR_MESSAGE_MAX_LENGTH) -> str:
+    """Render an exception message, truncated to ``cap`` characters.
+
+    Args:
+        error: Exception to describe
+        cap: Maximum length of the returned text (default: 512)
+
+    Returns:
+        str(error), or its first ``cap`` characters followed by an ellipsis
+    """
+    message = str(error)
+    if len(message) <= cap:
+        return message
+    return message[:cap] + "…"
+
+
+def backoff_delay(base: float, exponent: int, max_delay: float) -> float:
+    """Exponential backoff with jitter: min(base * 2**exponent, max) * (1 + U(0, jitter))."""
+    # Cap the exponent so long idle streaks cannot overflow the float math
+    delay = min(max_delay, base * 2 ** min(exponent, 32))
+    return delay * (1 + random.random() * BACKOFF_JITTER)
+
+
+async def listen_for_notifications(database_url: str, channel: str, wake: asyncio.Event) -> None:
+    """Set ``wake`` on every NOTIFY on ``channel`` until cancelled.
+
+    Uses a dedicated autocommit psycopg connection (LISTEN must not sit in a
+    pooled transaction). Reconnects after failures; the worker keeps polling
+    on its timeout in the meantime.
+
+    Args:
+        database_url: SQLAlchemy database URL (postgresql+psycopg://...)
+        channel: Notification channel (e.g. MINT_DETECTED_CHANNEL)
+        wake: Event the worker loop waits on between batches
+    """
+    url = make_url(database_url).set(drivername="postgresql")
+    conninfo = url.render_as_string(hide_password=False)
+
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {channel}")
+                # Tokens may have been inserted while not listening
+                wake.set()
+                async for _ in conn.notifies():
+                    wake.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "worker.listen_failed",
+                channel=channel,
+                error_type=type(e).__name__,
+                error_message=short_error(e),
+            )
+            await asyncio.sleep(LISTEN_RECONNECT_SECONDS)
@@ -3,62 +3,53 @@
 Polls for tokens with status='detected', generates images via Replicate API,
 and updates token status to 'uploading' with image URL.
 
-## Why This Worker Does NOT Use Unit of Work (UoW) Pattern
+## Database Access
 
-This worker intentionally bypasses the UoW pattern and uses direct session management.
+The worker never holds a connection while Replicate is called. Per batch it
+uses exactly two short-lived sessions from the shared engine pool (checked
+at startup by check_session_pool):
 
-**Justification:**
+1. **Claim session**: Tokens are selected with FOR UPDATE SKIP LOCKED and
+   flipped to 'generating' in one UPDATE ... RETURNING; their authors are
+   preloaded in one SELECT; one commit releases locks and connection.
 
-The UoW pattern assumes: one context = one transaction = automatic commit/rollback at exit.
+2. **Writer session(s)**: write_generation_results flushes outcomes as they
+   finish, in small executemany UPDATEs by primary key (one commit per flush).
 
-This worker requires: one context = multiple decision points with conditional commits.
+A batch of N tokens costs 1 + ceil(N / RESULT_FLUSH_SIZE) commits at most,
+instead of 3-5 per token. No per-token session exists.
 
-**Specific requirements that conflict with UoW:**
+**Outcomes** (buffered in memory as GenerationResult, never committed one by one):
+- Success: image_url set → uploading
+- TransientError: increment attempts → back to detected (retry next poll)
+- ContentPolicyError: retry with fallback prompt → uploading or detected
+- PermanentError / prompt validation error: increment attempts → detected
 
-1. **Retry logic requires partial commits**: When a transient error occurs, we must:
-   - Rollback the current transaction
-   - Increment the attempt counter
-   - Commit that increment (so it persists across retries)
-   - Sleep for backoff period
-   - Return without re-raising the exception
+Each token succeeds/fails independently: one token's failure only changes
+that token's row.
 
-   UoW would auto-commit on exit, which doesn't match these semantics.
-
-2. **Multiple error paths with different transaction outcomes**:
-   - TransientError: rollback → increment attempts → commit → continue
-   - ContentPolicyError: rollback → retry with fallback → commit → continue
-   - PermanentError: rollback → mark failed → commit → continue
-
-   Each path needs explicit transaction control.
-
-3. **Batch processing isolation**: Each token in a batch must succeed/fail independently.
-   One token's failure should NOT rollback other tokens' changes.
-
-**Pattern used instead:**
-
-- Each token gets its own database session (created in process_batch)
-- Explicit session.commit() and session.rollback() calls at decision points
-- TokenRepository used for data access, but without UoW wrapper
-
-**Alternative considered and rejected:**
-
-A "WorkerUoW" variant that doesn't auto-commit could work, but adds complexity
-without clear benefit. Direct session management is more explicit and readable
-for this multi-path transaction scenario.
+**Why not Unit of Work:** UoW is one context = one transaction with commit on
+exit. Here the claim and the writes are separate transactions around a long
+lockless stretch, so TokenRepository is used with explicit sessions instead.
 """
 
 import asyncio
+import contextlib
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Callable
+from uuid import UUID
 
 import structlog
-from sqlalchemy import update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from glisk.core.config import Settings
 from glisk.models.token import Token, TokenStatus
 from glisk.repositories.author import AuthorRepository
-from glisk.repositories.token import TokenRepository
+from glisk.repositories.token import MINT_DETECTED_CHANNEL, TokenRepository
 from glisk.services.image_generation.prompt_validator import validate_prompt
 from glisk.services.image_generation.replicate_client import (
     ContentPolicyError,
@@ -66,291 +57,490 @@ from glisk.services.image_generation.replicate_client import (
     TransientError,
     generate_image,
 )
+from glisk.workers.common import (
+    MAX_POLL_INTERVAL_SECONDS,
+    backoff_delay,
+    listen_for_notifications,
+    short_error,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Backoff after unexpected loop errors (doubles per consecutive error)
+ERROR_BACKOFF_BASE_SECONDS = 5
+ERROR_BACKOFF_MAX_SECONDS = 60
+
+# Pool connections a worker may hold at once (claim session + writer session)
+WORKER_DB_CONNECTIONS = 2
+
+# Outcome write-back: flush after this many results or this long after the first
+RESULT_FLUSH_SIZE = 8
+RESULT_FLUSH_WINDOW_SECONDS = 0.05
+
+# Author prompt cache (mint bursts are usually many tokens from one author).
+# Entries are dropped on prompt updates in this process; the TTL bounds
+# staleness for edits made through another process.
+AUTHOR_CACHE_SIZE = 512
+AUTHOR_CACHE_TTL_SECONDS = 30
+
+# After the fallback prompt itself fails, skip further fallback calls this long
+FALLBACK_FAILURE_WINDOW_SECONDS = 60
+
+# Monotonic time until which the fallback prompt is considered failing
+_fallback_failure_until = 0.0
+
+# author_id -> (expires_at monotonic, prompt_text, wallet_address), LRU order
+_author_cache: OrderedDict[UUID, tuple[float, str | None, str]] = OrderedDict()
+
+
+async def load_author_prompts(
+    author_repo: AuthorRepository, author_ids: set[UUID]
+) -> dict[UUID, tuple[str | None, str]]:
+    """Resolve (prompt_text, wallet_address) for a batch's authors.
+
+    Cached authors (30-second TTL) are served from memory; the rest are loaded
+    with a single SELECT ... WHERE id IN (...). Only authors with a prompt are
+    cached, so a prompt set after the first mint is picked up on the next
+    batch; edits via POST /api/authors/prompt evict the entry immediately.
+
+    Args:
+        author_repo: AuthorRepository bound to the batch's lock session
+        author_ids: Distinct author IDs of the locked tokens
+
+    Returns:
+        Mapping of author ID to (prompt_text, wallet_address) (missing authors omitted)
+    """
+    now = time.monotonic()
+    prompts: dict[UUID, tuple[str | None, str]] = {}
+    missing: set[UUID] = set()
+
+    for author_id in author_ids:
+        cached = _author_cache.get(author_id)
+        if cached is not None and cached[0] > now:
+            _author_cache.move_to_end(author_id)
+            prompts[author_id] = (cached[1], cached[2])
+        else:
+            missing.add(author_id)
+
+    if missing:
+        loaded = await author_repo.get_prompts_by_ids(missing)
+        for author_id, (prompt_text, wallet_address) in loaded.items():
+            if not prompt_text:
+                # Would pin the default prompt after the author sets one
+                continue
+            _author_cache[author_id] = (now + AUTHOR_CACHE_TTL_SECONDS, prompt_text, wallet_address)
+            _author_cache.move_to_end(author_id)
+        prompts.update(loaded)
+        while len(_author_cache) > AUTHOR_CACHE_SIZE:
+            _author_cache.popitem(last=False)
+
+    return prompts
+
+
+def invalidate_author_prompt(author_id: UUID) -> None:
+    """Drop an author's cached prompt (call after their prompt changes).
+
+    Args:
+        author_id: Author whose prompt was updated
+    """
+    _author_cache.pop(author_id, None)
+
+
+@dataclass
+class GenerationResult:
+    """Outcome of one token's image generation, buffered for the batch write.
+
+    Attributes:
+        token: Token that was processed (detached, as locked by process_batch)
+        image_url: Generated image URL on success (status -> uploading)
+        error: Error message on failure (status -> detected for retry)
+        attempts_used: Amount to add to generation_attempts
+    """
+
+    token: Token
+    image_url: str | None = None
+    error: str | None = None
+    attempts_used: int = 0
+
+    def to_row(self) -> dict:
+        """Build the bulk UPDATE parameters for this token."""
+        token = self.token
+        if self.image_url:
+            return {
+                "id": token.id,
+                "status": TokenStatus.UPLOADING,
+                "image_url": self.image_url,
+                "generation_attempts": token.generation_attempts + self.attempts_used,
+                "generation_error": token.generation_error,
+            }
+        return {
+            "id": token.id,
+            "status": TokenStatus.DETECTED,
+            "image_url": token.image_url,
+            "generation_attempts": token.generation_attempts + self.attempts_used,
+            "generation_error": (self.error or "")[:1000],
+        }
+
+
+def resolve_author_prompts(
+    authors: dict[UUID, tuple[str | None, str]],
+    settings: Settings,
+) -> tuple[dict[UUID, str], dict[UUID, str]]:
+    """Pick and validate the prompt once per author of a batch.
+
+    Authors without prompt_text get the default prompt (already validated
+    when Settings was loaded). Prompts that fail validation are returned as
+    errors so their tokens can be recorded without calling Replicate.
+
+    Args:
+        authors: Preloaded (prompt_text, wallet_address) per author ID
+        settings: Application settings (default prompt)
+
+    Returns:
+        Tuple of (prompt per author ID, validation error per author ID)
+    """
+    prompts: dict[UUID, str] = {}
+    errors: dict[UUID, str] = {}
+
+    for author_id, (author_prompt, author_wallet) in authors.items():
+        if not author_prompt:
+            logger.info("author_prompt_not_set_using_default", author_wallet=author_wallet)
+            prompts[author_id] = settings.default_prompt
+            continue
+        try:
+            prompts[author_id] = validate_prompt(author_prompt)
+        except ValueError as e:
+            errors[author_id] = f"Prompt validation failed: {short_error(e)}"
+
+    return prompts, errors
+
 
 async def process_single_token(
     token: Token,
-    session_factory: Callable,
+    prompt: str,
     settings: Settings,
-) -> None:
-    """Process a single token for image generation with retry logic.
+) -> GenerationResult:
+    """Generate the image for a single token, without writing to the database.
 
-    Creates its own database session to ensure transaction isolation from
-    concurrent token processing. This prevents one token's failure from
-    affecting other tokens in the batch.
+    The token has already been moved to 'generating' and its prompt resolved
+    by process_batch. This function only holds Python state (no database
+    access); the outcome is returned and written with the rest of the batch.
 
     Workflow:
-    1. Create dedicated session for this token
-    2. Fetch token by ID (with fresh session)
-    3. Update status: detected → generating
-    4. Fetch author's prompt text
-    5. Validate prompt
-    6. Call Replicate API to generate image
-    7. Handle errors:
+    1. Call Replicate API to generate image
+    2. Handle errors:
        - TransientError: Increment attempts, reset to detected for retry
-       - ContentPolicyError: Retry with fallback prompt
-       - PermanentError: Mark as failed
-       - Max retries (3): Mark as failed
-    8. Update token with image URL and status: generating → uploading
+       - ContentPolicyError: Retry with fallback prompt (skipped for
+         FALLBACK_FAILURE_WINDOW_SECONDS after the fallback itself failed)
+       - PermanentError: Increment attempts, reset to detected
+    3. Return image URL (status: generating → uploading) or error
 
     Args:
         token: Token entity to process (detached from session)
-        session_factory: Factory function to create new database sessions
+        prompt: Validated prompt for the token's author (see resolve_author_prompts)
         settings: Application settings (API tokens, config)
 
+    Returns:
+        GenerationResult for the batch write
+
     Raises:
-        Exception: Any error during processing (caller should handle)
+        Exception: Any unexpected error (caller should handle)
     """
-    start_time = time.time()
-
-    # Create dedicated session for this token's processing
-    async with session_factory() as session:
-        token_repo = TokenRepository(session)
-        author_repo = AuthorRepository(session)
-
-        # Step 1: Fetch token by ID (attach to this session)
-        token_id_to_fetch = token.token_id
-        attached_token = await token_repo.get_by_token_id(token_id_to_fetch)
-        if not attached_token:
-            raise ValueError(f"Token {token_id_to_fetch} not found")
-
-        attempt_number = attached_token.generation_attempts + 1
-
-        # Log start of processing
-        logger.info(
-            "token.generation.started",
-            token_id=attached_token.token_id,
-            attempt_number=attempt_number,
-        )
+    global _fallback_failure_until
 
-        # Step 2: Mark token as generating
-        attached_token.mark_generating()
-        session.add(attached_token)
-        await session.commit()
-        await session.refresh(attached_token)
+    start_ns = time.monotonic_ns()
+    # Reported on the outcome log (no separate "started" event)
+    attempt_number = token.generation_attempts + 1
+    # Bind per-token context once instead of passing it to every log call
+    log = logger.bind(token_id=token.token_id, attempt_number=attempt_number)
 
-        try:
-            # Step 3: Fetch author's prompt text
-            author = await author_repo.get_by_id(attached_token.author_id)
-
-            if not author:
-                raise ValueError(
-                    f"Author {attached_token.author_id} not found for token "
-                    f"{attached_token.token_id}. "
-                    "This should not happen - all tokens must have valid authors."
-                )
+    try:
+        image_url = await generate_image(
+            prompt=prompt,
+            api_token=settings.replicate_api_token,
+            model_version=settings.replicate_model_version,
+        )
 
-            # Use author's prompt if set, otherwise use default prompt from config
-            if author.prompt_text:
-                prompt_text = author.prompt_text
-            else:
-                logger.info(
-                    "author_prompt_not_set_using_default",
-                    author_wallet=author.wallet_address,
-                    token_id=attached_token.token_id,
-                )
-                prompt_text = settings.default_prompt
+        # Log successful completion with duration and image URL
+        duration = (time.monotonic_ns() - start_ns) / 1e9
+        log.info(
+            "token.generation.succeeded",
+            image_url=image_url,
+            duration_seconds=duration,
+        )
+        return GenerationResult(token, image_url=image_url)
+
+    except TransientError as e:
+        # Transient error (network timeout, rate limit, service unavailable)
+        # Retry infinitely via natural poll loop - no retry limits
+        message = short_error(e)
+        log.warning(
+            "token.generation.retry",
+            error_type="TransientError",
+            error_message=message,
+        )
+        # Increment attempts (monitoring only) - next poll will retry
+        return GenerationResult(token, error=message, attempts_used=1)
+
+    except ContentPolicyError as e:
+        # Log censorship event
+        log.warning(
+            "token.censored",
+            original_prompt="[redacted]",
+            reason="content_policy_violation",
+        )
 
-            # Step 4: Validate prompt
-            prompt = validate_prompt(prompt_text)
+        # Fallback failed recently - don't spend another Replicate call on it
+        if time.monotonic() < _fallback_failure_until:
+            log.error(
+                "token.generation.failed",
+                error_type="ContentPolicyError",
+                error_message=short_error(e),
+                fallback_skipped=True,
+                note="Token will be retried on next poll (infinite retries)",
+            )
+            return GenerationResult(
+                token,
+                error="Content policy violation; fallback prompt skipped after recent failure",
+                attempts_used=1,
+            )
 
-            # Step 5: Generate image via Replicate
+        # Retry with fallback prompt
+        try:
             image_url = await generate_image(
-                prompt=prompt,
+                prompt=settings.fallback_censored_prompt,
                 api_token=settings.replicate_api_token,
                 model_version=settings.replicate_model_version,
             )
-
-            # Step 6: Update token with image URL and mark as uploading
-            await token_repo.update_image_url(attached_token, image_url)
-            await session.commit()
-
-            # Log successful completion with duration and image URL
-            duration = time.time() - start_time
-            logger.info(
-                "token.generation.succeeded",
-                token_id=attached_token.token_id,
-                image_url=image_url,
-                duration_seconds=duration,
-                attempt_number=attempt_number,
+        except Exception as fallback_error:
+            # Fallback also failed
+            # Don't mark as failed - retry infinitely via polling loop
+            _fallback_failure_until = time.monotonic() + FALLBACK_FAILURE_WINDOW_SECONDS
+            fallback_message = short_error(fallback_error)
+            log.error(
+                "token.generation.failed",
+                error_type="ContentPolicyError",
+                error_message=f"Original: {short_error(e)}, Fallback: {fallback_message}",
+                note="Token will be retried on next poll (infinite retries)",
+            )
+            return GenerationResult(
+                token,
+                error=f"Fallback prompt failed: {fallback_message}",
+                attempts_used=1,
             )
 
-        except TransientError as e:
-            # Transient error (network timeout, rate limit, service unavailable)
-            # Retry infinitely via natural poll loop - no retry limits
-            await session.rollback()
-
-            # Increment attempts (monitoring only, not used for business logic)
-            await token_repo.increment_attempts(attached_token, str(e))
-            await session.commit()
+        _fallback_failure_until = 0.0
+        duration = (time.monotonic_ns() - start_ns) / 1e9
+        log.info(
+            "token.generation.succeeded",
+            image_url=image_url,
+            duration_seconds=duration,
+            fallback_used=True,
+        )
+        # Increment attempts to track censorship
+        return GenerationResult(token, image_url=image_url, attempts_used=1)
+
+    except PermanentError as e:
+        # Permanent error (invalid API token, validation error)
+        # Don't mark as failed - retry infinitely via polling loop
+        message = short_error(e)
+        log.error(
+            "token.generation.failed",
+            error_type="PermanentError",
+            error_message=message,
+            note="Token will be retried on next poll (infinite retries)",
+        )
+        return GenerationResult(token, error=message, attempts_used=1)
 
-            logger.warning(
-                "token.generation.retry",
-                token_id=attached_token.token_id,
-                error_type="TransientError",
-                error_message=str(e),
-                attempt_number=attempt_number,
-            )
-            # Return immediately - next poll will retry
-
-        except ContentPolicyError as e:
-            # Content policy violation - retry with fallback prompt
-            await session.rollback()
-
-            # Log censorship event
-            logger.warning(
-                "token.censored",
-                token_id=attached_token.token_id,
-                original_prompt="[redacted]",
-                reason="content_policy_violation",
-            )
 
-            # Retry with fallback prompt
-            try:
-                image_url = await generate_image(
-                    prompt=settings.fallback_censored_prompt,
-                    api_token=settings.replicate_api_token,
-                    model_version=settings.replicate_model_version,
-                )
+async def write_generation_results(
+    session_factory: Callable,
+    rows: asyncio.Queue[dict | None],
+) -> None:
+    """Write generation outcomes as they arrive, in small bulk UPDATEs.
 
-                # Update token with fallback image
-                await token_repo.update_image_url(attached_token, image_url)
-                # Increment attempts to track censorship
-                attached_token.generation_attempts += 1
-                session.add(attached_token)
-                await session.commit()
+    Collects rows until RESULT_FLUSH_SIZE are buffered or
+    RESULT_FLUSH_WINDOW_SECONDS have passed since the first one, then writes
+    them in one transaction. Stops after the ``None`` sentinel.
 
-                duration = time.time() - start_time
-                logger.info(
-                    "token.generation.succeeded",
-                    token_id=attached_token.token_id,
-                    image_url=image_url,
-                    duration_seconds=duration,
-                    attempt_number=attempt_number,
-                    fallback_used=True,
-                )
-            except Exception as fallback_error:
-                # Fallback also failed
-                # Don't mark as failed - retry infinitely via polling loop
-                await session.rollback()
-
-                # Increment attempts for monitoring and keep status='detected' for retry
-                attached_token.generation_attempts += 1
-                attached_token.generation_error = f"Fallback prompt failed: {str(fallback_error)}"[
-                    :1000
-                ]
-                session.add(attached_token)
-                await session.commit()
+    A failed flush never stops the writer: the flush's tokens are reset from
+    'generating' to 'detected' (retried on a later poll) and draining
+    continues, so the rest of the batch is still written.
 
-                logger.error(
-                    "token.generation.failed",
-                    token_id=attached_token.token_id,
-                    error_type="ContentPolicyError",
-                    error_message=f"Original: {str(e)}, Fallback: {str(fallback_error)}",
-                    attempt_number=attempt_number,
-                    note="Token will be retried on next poll (infinite retries)",
-                )
+    Args:
+        session_factory: Factory function to create new database sessions
+        rows: Queue of GenerationResult.to_row() dicts, terminated by None
+    """
+    loop = asyncio.get_running_loop()
+    finished = False
 
-        except PermanentError as e:
-            # Permanent error (invalid API token, validation error)
-            # Don't mark as failed - retry infinitely via polling loop
-            await session.rollback()
+    while not finished:
+        row = await rows.get()
+        if row is None:
+            return
+        buffer = [row]
+        deadline = loop.time() + RESULT_FLUSH_WINDOW_SECONDS
 
-            # Increment attempts for monitoring and keep status='detected' for retry
-            attached_token.generation_attempts += 1
-            attached_token.generation_error = str(e)[:1000]
-            session.add(attached_token)
-            await session.commit()
+        while len(buffer) < RESULT_FLUSH_SIZE:
+            try:
+                row = await asyncio.wait_for(rows.get(), timeout=deadline - loop.time())
+            except TimeoutError:
+                break
+            if row is None:
+                finished = True
+                break
+            buffer.append(row)
 
+        try:
+            async with session_factory() as session:
+                token_repo = TokenRepository(session)
+                await token_repo.bulk_update_generation_results(buffer)
+                # Wake the IPFS upload worker if any image is ready
+                if any(row["status"] == TokenStatus.UPLOADING for row in buffer):
+                    await token_repo.notify_token_uploading()
+                await session.commit()
+        except Exception as e:
             logger.error(
-                "token.generation.failed",
-                token_id=attached_token.token_id,
-                error_type="PermanentError",
-                error_message=str(e),
-                attempt_number=attempt_number,
-                note="Token will be retried on next poll (infinite retries)",
+                "token.generation.flush_failed",
+                count=len(buffer),
+                error_type=type(e).__name__,
+                error_message=short_error(e),
             )
+            await reset_unwritten_tokens(session_factory, [row["id"] for row in buffer])
 
-        except ValueError as e:
-            # Prompt validation error (e.g., empty prompt, invalid characters)
-            # Don't mark as failed - retry infinitely via polling loop
-            await session.rollback()
 
-            # Increment attempts for monitoring and keep status='detected' for retry
-            attached_token.generation_attempts += 1
-            attached_token.generation_error = f"Prompt validation failed: {str(e)}"[:1000]
-            session.add(attached_token)
-            await session.commit()
+async def reset_unwritten_tokens(session_factory: Callable, token_ids: list[UUID]) -> None:
+    """Reset tokens whose outcome flush failed back to 'detected'.
 
-            logger.error(
-                "token.generation.failed",
-                token_id=attached_token.token_id,
-                error_type="ValueError",
-                error_message=f"Prompt validation failed: {str(e)}",
-                attempt_number=attempt_number,
-                note="Token will be retried on next poll (infinite retries)",
-            )
+    If the reset fails too (e.g. the database is unreachable), the tokens stay
+    in 'generating' until recover_orphaned_tokens runs on the next start.
 
-        except Exception as e:
-            # Unexpected error - rollback and re-raise for batch error handling
-            await session.rollback()
-            logger.error(
-                "token.generation.failed",
-                token_id=attached_token.token_id,
-                error_type=type(e).__name__,
-                error_message=str(e),
-                attempt_number=attempt_number,
-            )
-            raise
+    Args:
+        session_factory: Factory function to create new database sessions
+        token_ids: Primary keys of the tokens in the failed flush
+    """
+    try:
+        async with session_factory() as session:
+            await TokenRepository(session).reset_generating(token_ids)
+            await session.commit()
+    except Exception as e:
+        logger.error(
+            "token.generation.reset_failed",
+            count=len(token_ids),
+            error_type=type(e).__name__,
+            error_message=short_error(e),
+        )
 
 
 async def process_batch(
     session_factory: Callable,
     settings: Settings,
-) -> None:
+) -> bool:
     """Process a batch of tokens concurrently for image generation.
 
-    Uses a temporary session to lock tokens via FOR UPDATE SKIP LOCKED,
-    then creates separate sessions for each token to ensure transaction isolation.
+    No transaction is held open while Replicate is called. At most
+    REPLICATE_MAX_CONCURRENCY calls run at once, and each outcome is handed to
+    a writer task as soon as it is known (see write_generation_results).
 
     Workflow:
-    1. Create temporary session for locking
-    2. Lock tokens via get_pending_for_generation() (FOR UPDATE SKIP LOCKED)
-    3. Close locking session (tokens are detached from session)
-    4. Process tokens concurrently with separate sessions per token
-    5. Log successes and failures
+    1. Claim tokens via claim_batch_for_generation() (one UPDATE ... RETURNING
+       over a FOR UPDATE SKIP LOCKED selection: detected → generating)
+    2. Preload their authors in one SELECT and commit (releases locks and connection)
+    3. Resolve each author's prompt once; tokens without a usable prompt are
+       recorded as failures without calling Replicate
+    4. Generate images concurrently, bounded by a semaphore (no session held)
+    5. Stream outcomes to the writer, which flushes small bulk UPDATEs
+
+    Unexpected errors are recorded like other failures (status back to
+    'detected', attempts incremented), and outcomes whose write fails are
+    reset to 'detected' by the writer, so no token is left in 'generating'
+    while the database is reachable.
+    If the batch is cancelled, outcomes already known are still written before
+    the cancellation propagates; tokens cut off mid-call stay 'generating'
+    until recover_orphaned_tokens runs on the next start.
 
     Args:
         session_factory: Factory function to create new database sessions
         settings: Application settings (batch size, API tokens)
+
+    Returns:
+        True if any tokens were processed, False if the queue was empty
     """
-    # Step 1-2: Lock tokens with temporary session
+    # Step 1-2: Claim tokens and preload authors in one short transaction
     async with session_factory() as lock_session:
         token_repo = TokenRepository(lock_session)
-        tokens = await token_repo.get_pending_for_generation(limit=settings.worker_batch_size)
+        tokens = await token_repo.claim_batch_for_generation(limit=settings.worker_batch_size)
 
-    # Step 3: Session closed, tokens are now detached
+        if not tokens:
+            # No tokens to process
+            return False
 
-    if not tokens:
-        # No tokens to process
-        return
+        authors = await load_author_prompts(
+            AuthorRepository(lock_session), {token.author_id for token in tokens}
+        )
+        await lock_session.commit()
+
+    # Step 3: Resolve prompts per author, then split tokens so generation never branches
+    prompts, prompt_errors = resolve_author_prompts(authors, settings)
+    ready: list[tuple[Token, str]] = []
+    rejected: list[GenerationResult] = []
+    # Failures outside process_single_token, logged as one event per kind
+    failures: list[dict] = []
+    for token in tokens:
+        prompt = prompts.get(token.author_id)
+        if prompt is not None:
+            ready.append((token, prompt))
+            continue
+        error = prompt_errors.get(token.author_id) or (
+            f"Prompt validation failed: Author {token.author_id} not found for token "
+            f"{token.token_id}. "
+            "This should not happen - all tokens must have valid authors."
+        )
+        failures.append({"token_id": token.token_id, "error_type": "ValueError", "error": error})
+        rejected.append(GenerationResult(token, error=error, attempts_used=1))
+
+    if failures:
+        logger.error(
+            "token.generation.batch_failed",
+            count=len(failures),
+            failures=failures,
+            note="Tokens will be retried on next poll (infinite retries)",
+        )
+        failures = []
 
-    # Step 4: Process tokens concurrently (each gets its own session)
-    tasks = [process_single_token(token, session_factory, settings) for token in tokens]
+    # Step 4-5: Generate images with bounded concurrency; write outcomes as they finish
+    semaphore = asyncio.Semaphore(settings.replicate_max_concurrency)
+    write_queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    writer = asyncio.create_task(write_generation_results(session_factory, write_queue))
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in rejected:
+        write_queue.put_nowait(result.to_row())
 
-    # Step 5: Log errors (successes are logged in process_single_token)
-    for token, result in zip(tokens, results):
-        if isinstance(result, Exception):
-            logger.error(
-                "token.generation.failed",
-                token_id=token.token_id,
-                error=str(result),
-                error_type=type(result).__name__,
+    async def generate(token: Token, prompt: str) -> None:
+        try:
+            async with semaphore:
+                result = await process_single_token(token, prompt, settings)
+        except Exception as e:
+            # Successes/handled failures are logged in process_single_token
+            message = short_error(e)
+            failures.append(
+                {"token_id": token.token_id, "error_type": type(e).__name__, "error": message}
             )
+            result = GenerationResult(token, error=message, attempts_used=1)
+        write_queue.put_nowait(result.to_row())
+
+    try:
+        await asyncio.gather(*(generate(token, prompt) for token, prompt in ready))
+    finally:
+        # Let the writer flush what it has and stop - also on cancellation
+        # (shutdown), so finished outcomes are not left in 'generating'
+        write_queue.put_nowait(None)
+        await writer
+
+    if failures:
+        logger.error("token.generation.batch_failed", count=len(failures), failures=failures)
+
+    return True
 
 
 async def recover_orphaned_tokens(session: AsyncSession) -> None:
@@ -359,7 +549,9 @@ async def recover_orphaned_tokens(session: AsyncSession) -> None:
     Worker crashes or restarts leave tokens in 'generating' status.
     All orphaned tokens are reset regardless of attempt count.
 
-    Query:
+    Query (only if an indexed probe finds any orphan - the usual clean restart
+    skips the UPDATE and its commit entirely):
+        SELECT 1 FROM tokens_s0 WHERE status = 'generating' LIMIT 1
         UPDATE tokens_s0
         SET status = 'detected'
         WHERE status = 'generating'
@@ -367,6 +559,12 @@ async def recover_orphaned_tokens(session: AsyncSession) -> None:
     Args:
         session: Database session for recovery query
     """
+    orphan = await session.execute(
+        select(Token.id).where(Token.status == TokenStatus.GENERATING).limit(1)  # type: ignore[arg-type]
+    )
+    if orphan.first() is None:
+        return
+
     result = await session.execute(
         update(Token)
         .where(Token.status == TokenStatus.GENERATING)  # type: ignore[arg-type]
@@ -379,18 +577,46 @@ async def recover_orphaned_tokens(session: AsyncSession) -> None:
         logger.info("worker.recovery", orphaned_tokens_reset=recovered_count)
 
 
+def check_session_pool(session_factory: Callable) -> None:
+    """Warn if the session factory's engine pool is not a sized async queue pool.
+
+    NullPool or a sync QueuePool would churn connections (or block the loop)
+    on every claim and flush.
+
+    Args:
+        session_factory: async_sessionmaker bound to the shared AsyncEngine
+    """
+    engine = getattr(session_factory, "kw", {}).get("bind")
+    if engine is None:
+        return
+
+    pool = engine.pool
+    pool_size = pool.size() if isinstance(pool, AsyncAdaptedQueuePool) else 0
+    if pool_size < WORKER_DB_CONNECTIONS:
+        logger.warning(
+            "worker.pool_misconfigured",
+            pool_class=type(pool).__name__,
+            pool_size=pool_size,
+            required_connections=WORKER_DB_CONNECTIONS,
+        )
+
+
 async def run_image_generation_worker(
     session_factory: Callable,
     settings: Settings,
 ) -> None:
     """Main worker loop for image generation.
 
-    Polls at POLL_INTERVAL_SECONDS, processes batches, and handles graceful shutdown.
+    Wakes immediately on NOTIFY mint_detected (see listen_for_notifications) and
+    otherwise polls as a fallback: every POLL_INTERVAL_SECONDS after a
+    non-empty batch, doubling per empty batch up to MAX_POLL_INTERVAL_SECONDS.
+    Unexpected errors back off the same way from ERROR_BACKOFF_BASE_SECONDS.
+    All waits carry up to 50% random jitter.
 
     Workflow:
     1. Run startup recovery (reset orphaned tokens)
-    2. Poll at configured interval
-    3. Call process_batch() with new session
+    2. Start the LISTEN task
+    3. Call process_batch(), then wait for a notification or the poll timeout
     4. Handle CancelledError for graceful shutdown
     5. Log worker start/stop events
 
@@ -398,6 +624,8 @@ async def run_image_generation_worker(
         session_factory: Factory function that creates database sessions
         settings: Application settings (poll interval, batch size, API tokens)
     """
+    check_session_pool(session_factory)
+
     # Startup recovery: reset orphaned tokens
     async with session_factory() as session:
         await recover_orphaned_tokens(session)
@@ -408,14 +636,30 @@ async def run_image_generation_worker(
         batch_size=settings.worker_batch_size,
     )
 
+    wake = asyncio.Event()
+    listener_task = asyncio.create_task(
+        listen_for_notifications(settings.database_url, MINT_DETECTED_CHANNEL, wake)
+    )
+    idle_count = 0
+    error_count = 0
+
     try:
         while True:
             try:
-                # Process batch (creates sessions internally per token)
-                await process_batch(session_factory, settings)
+                # Notifications arriving during the batch trigger the next one
+                wake.clear()
+                did_work = await process_batch(session_factory, settings)
+                error_count = 0
+
+                # Back off on an empty queue; reset as soon as there is work
+                idle_count = 0 if did_work else idle_count + 1
+                poll_interval = backoff_delay(
+                    settings.poll_interval_seconds, idle_count, MAX_POLL_INTERVAL_SECONDS
+                )
 
-                # Wait for next polling interval
-                await asyncio.sleep(settings.poll_interval_seconds)
+                # Wait for a mint notification or the poll timeout
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wake.wait(), timeout=poll_interval)
 
             except asyncio.CancelledError:
                 # Propagate cancellation for graceful shutdown
@@ -426,13 +670,20 @@ async def run_image_generation_worker(
                 logger.error(
                     "worker.error",
                     error_type=type(e).__name__,
-                    error_message=str(e),
-                    exc_info=True,
+                    error_message=short_error(e),
+                    # Traceback only for the first error of a streak
+                    exc_info=error_count == 0,
+                )
+                # Back off exponentially while the error persists
+                error_delay = backoff_delay(
+                    ERROR_BACKOFF_BASE_SECONDS, error_count, ERROR_BACKOFF_MAX_SECONDS
                 )
-                # Back off 5 seconds before retrying
-                await asyncio.sleep(5)
+                error_count += 1
+                await asyncio.sleep(error_delay)
 
     except asyncio.CancelledError:
         # Graceful shutdown
         logger.info("worker.stopped")
         raise
+    finally:
+        listener_task.cancel()
@@ -3,25 +3,35 @@
 Polls for tokens with status='uploading', uploads images and metadata to IPFS via Pinata,
 and updates token status to 'ready' for batch reveal.
 
-This worker follows the same session-per-token pattern as image_generation_worker.py.
-See that file for detailed justification of bypassing UoW pattern.
+Like image_generation_worker.py, no session is held during network calls:
+tokens are locked and their authors' handles loaded in one short session,
+uploads run without database access, and the batch's outcomes are written
+together in one transaction. See that file for why the UoW pattern is
+bypassed.
 """
 
 import asyncio
+import contextlib
 import time
+from dataclasses import dataclass
 from typing import Callable
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
 from glisk.core.config import Settings
-from glisk.models.author import Author
-from glisk.models.token import Token
+from glisk.models.token import Token, TokenStatus
+from glisk.repositories.author import AuthorRepository
 from glisk.repositories.ipfs_record import IPFSUploadRecordRepository
-from glisk.repositories.token import TokenRepository
+from glisk.repositories.token import TOKEN_UPLOADING_CHANNEL, TokenRepository
 from glisk.services.exceptions import PermanentError, TransientError
 from glisk.services.ipfs.pinata_client import PinataClient
+from glisk.workers.common import (
+    MAX_POLL_INTERVAL_SECONDS,
+    backoff_delay,
+    listen_for_notifications,
+    short_error,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -69,244 +79,281 @@ def build_metadata(
     return metadata
 
 
+@dataclass
+class UploadResult:
+    """Outcome of one token's IPFS upload, buffered for the batch write.
+
+    Attributes:
+        token: Token that was processed (detached, as locked by process_batch)
+        image_cid: IPFS CID of the uploaded image (set on success)
+        metadata_cid: IPFS CID of the uploaded metadata (set on success, status -> ready)
+        error: Error message on failure (status stays uploading for retry)
+    """
+
+    token: Token
+    image_cid: str | None = None
+    metadata_cid: str | None = None
+    error: str | None = None
+
+    def to_row(self) -> dict:
+        """Build the bulk UPDATE parameters for this token."""
+        token = self.token
+        if self.metadata_cid:
+            return {
+                "id": token.id,
+                "status": TokenStatus.READY,
+                "image_cid": self.image_cid,
+                "metadata_cid": self.metadata_cid,
+                "generation_attempts": token.generation_attempts,
+                "generation_error": token.generation_error,
+            }
+        # Increment attempts for monitoring and keep status='uploading' for retry
+        return {
+            "id": token.id,
+            "status": TokenStatus.UPLOADING,
+            "image_cid": token.image_cid,
+            "metadata_cid": token.metadata_cid,
+            "generation_attempts": token.generation_attempts + 1,
+            "generation_error": (self.error or "")[:1000],
+        }
+
+    def audit_records(self) -> list[dict]:
+        """Build the IPFSUploadRecord rows for a successful upload (none on failure)."""
+        if not self.metadata_cid:
+            return []
+        return [
+            {
+                "token_id": self.token.id,
+                "record_type": record_type,
+                "cid": cid,
+                "status": "completed",
+                "retry_count": self.token.generation_attempts,
+            }
+            for record_type, cid in (("image", self.image_cid), ("metadata", self.metadata_cid))
+        ]
+
+
 async def process_single_token(
     token: Token,
-    session_factory: Callable,
     settings: Settings,
-) -> None:
-    """Process a single token for IPFS upload with retry logic.
+    pinata: PinataClient,
+    social_handles: tuple[str | None, str | None] = (None, None),
+) -> UploadResult:
+    """Upload a single token's image and metadata, without writing to the database.
 
-    Creates its own database session to ensure transaction isolation.
+    The outcome is returned and written by process_batch together with the
+    rest of the batch.
 
     Workflow:
-    1. Create dedicated session for this token
-    2. Fetch token by ID (attach to session)
-    3. Create Pinata client
-    4. Upload image to IPFS → get image CID
-    5. Fetch author by wallet address → get twitter_handle and farcaster_handle (if exist)
-    6. Build metadata with image CID and social handles (if available)
-    7. Upload metadata to IPFS → get metadata CID
-    8. Update token with CIDs and status: uploading → ready
-    9. Create audit records for both uploads
-    10. Handle errors:
-       - TransientError: Increment attempts, keep status='uploading' for retry
-       - PermanentError: Mark as failed
-       - Max retries (3): Mark as failed
+    1. Upload image to IPFS → get image CID
+    2. Build metadata with image CID and social handles (preloaded by process_batch)
+    3. Upload metadata to IPFS → get metadata CID
+    4. Return both CIDs (status: uploading → ready) or the error
+    5. Handle errors (token stays 'uploading', retried on next poll):
+       - TransientError: Increment attempts
+       - PermanentError / ValueError: Increment attempts
 
     Args:
         token: Token entity to process (detached from session)
-        session_factory: Factory function to create new database sessions
         settings: Application settings (Pinata JWT, config)
-    """
-    start_time = time.time()
+        pinata: Shared Pinata client (connection pool, upload semaphore, retries)
+        social_handles: (twitter_handle, farcaster_handle) of the token's author
 
-    # Create dedicated session for this token's processing
-    async with session_factory() as session:
-        token_repo = TokenRepository(session)
-        ipfs_repo = IPFSUploadRecordRepository(session)
+    Returns:
+        UploadResult for the batch write
 
-        # Step 1: Fetch token by ID (attach to this session)
-        attached_token = await token_repo.get_by_token_id(token.token_id)
-        if not attached_token:
-            raise ValueError(f"Token {token.token_id} not found")
+    Raises:
+        Exception: Any unexpected error (token is left untouched; caller logs it)
+    """
+    start_ns = time.monotonic_ns()
+    attempt_number = token.generation_attempts + 1
+
+    # Log start of processing
+    logger.info(
+        "ipfs.upload.started",
+        token_id=token.token_id,
+        attempt_number=attempt_number,
+    )
 
-        attempt_number = attached_token.generation_attempts + 1
+    try:
+        # Step 1: Upload image to IPFS
+        if not token.image_url:
+            raise ValueError(f"Token {token.token_id} has no image_url")
 
-        # Log start of processing
+        image_cid = await pinata.upload_image(token.image_url, token.token_id)
         logger.info(
-            "ipfs.upload.started",
-            token_id=attached_token.token_id,
+            "ipfs.image_uploaded",
+            token_id=token.token_id,
+            cid=image_cid,
             attempt_number=attempt_number,
         )
 
-        # Create Pinata client
-        pinata = PinataClient(
-            jwt_token=settings.pinata_jwt,
-            gateway_domain=settings.pinata_gateway,
+        # Step 2: Build metadata with author's social handles (if available)
+        twitter_handle, farcaster_handle = social_handles
+        metadata = build_metadata(
+            token,
+            image_cid,
+            twitter_handle=twitter_handle,
+            farcaster_handle=farcaster_handle,
         )
 
-        try:
-            # Step 2: Upload image to IPFS
-            if not attached_token.image_url:
-                raise ValueError(f"Token {attached_token.token_id} has no image_url")
-
-            image_cid = await pinata.upload_image(attached_token.image_url, attached_token.token_id)
-            logger.info(
-                "ipfs.image_uploaded",
-                token_id=attached_token.token_id,
-                cid=image_cid,
-                attempt_number=attempt_number,
-            )
-
-            # Create audit record for image upload
-            await ipfs_repo.create(
-                token_id=attached_token.id,
-                record_type="image",
-                cid=image_cid,
-                status="completed",
-                retry_count=attempt_number - 1,
-            )
-
-            # Step 3: Fetch author to get twitter_handle and farcaster_handle
-            author = await session.scalar(
-                select(Author).where(Author.id == attached_token.author_id)
-            )
-            twitter_handle = author.twitter_handle if author else None
-            farcaster_handle = author.farcaster_handle if author else None
-
-            # Step 4: Build metadata with author's social handles (if available)
-            metadata = build_metadata(
-                attached_token,
-                image_cid,
-                twitter_handle=twitter_handle,
-                farcaster_handle=farcaster_handle,
-            )
-
-            # Step 5: Upload metadata to IPFS
-            metadata_cid = await pinata.upload_metadata(metadata, attached_token.token_id)
-            logger.info(
-                "ipfs.metadata_uploaded",
-                token_id=attached_token.token_id,
-                cid=metadata_cid,
-                attempt_number=attempt_number,
-            )
-
-            # Create audit record for metadata upload
-            await ipfs_repo.create(
-                token_id=attached_token.id,
-                record_type="metadata",
-                cid=metadata_cid,
-                status="completed",
-                retry_count=attempt_number - 1,
-            )
-
-            # Step 6: Update token with CIDs and mark as ready
-            await token_repo.update_ipfs_cids(attached_token, image_cid, metadata_cid)
-            await session.commit()
-
-            # Log successful completion
-            duration = time.time() - start_time
-            logger.info(
-                "ipfs.upload.succeeded",
-                token_id=attached_token.token_id,
-                image_cid=image_cid,
-                metadata_cid=metadata_cid,
-                duration_seconds=duration,
-                attempt_number=attempt_number,
-            )
-
-        except TransientError as e:
-            # Transient error (network timeout, rate limit, service unavailable)
-            # Retry infinitely via natural poll loop - no retry limits
-            await session.rollback()
-
-            # Increment attempts and keep status='uploading' for retry
-            # (monitoring only, not used for business logic)
-            attached_token.generation_attempts += 1
-            attached_token.generation_error = str(e)[:1000]
-            session.add(attached_token)
-            await session.commit()
-
-            logger.warning(
-                "ipfs.transient_error",
-                token_id=attached_token.token_id,
-                error_type="TransientError",
-                error_message=str(e),
-                attempt_number=attempt_number,
-            )
-            # Return immediately - next poll will retry
-
-        except PermanentError as e:
-            # Permanent error (authentication, validation)
-            # Don't mark as failed - retry infinitely via polling loop
-            await session.rollback()
-
-            # Increment attempts for monitoring and keep status='uploading' for retry
-            attached_token.generation_attempts += 1
-            attached_token.generation_error = f"IPFS upload failed: {str(e)}"[:1000]
-            session.add(attached_token)
-            await session.commit()
-
-            logger.error(
-                "ipfs.permanent_error",
-                token_id=attached_token.token_id,
-                error_type="PermanentError",
-                error_message=str(e),
-                attempt_number=attempt_number,
-                note="Token will be retried on next poll (infinite retries)",
-            )
-
-        except ValueError as e:
-            # Missing data (e.g., no image_url)
-            # Don't mark as failed - retry infinitely via polling loop
-            await session.rollback()
-
-            # Increment attempts for monitoring and keep status='uploading' for retry
-            attached_token.generation_attempts += 1
-            attached_token.generation_error = f"IPFS upload failed: {str(e)}"[:1000]
-            session.add(attached_token)
-            await session.commit()
+        # Step 3: Upload metadata to IPFS
+        metadata_cid = await pinata.upload_metadata(metadata, token.token_id)
+        logger.info(
+            "ipfs.metadata_uploaded",
+            token_id=token.token_id,
+            cid=metadata_cid,
+            attempt_number=attempt_number,
+        )
 
-            logger.error(
-                "ipfs.upload.failed",
-                token_id=attached_token.token_id,
-                error_type="ValueError",
-                error_message=str(e),
-                attempt_number=attempt_number,
-                note="Token will be retried on next poll (infinite retries)",
-            )
+        if not image_cid or not metadata_cid:
+            raise ValueError("Both image_cid and metadata_cid are required")
 
-        except Exception as e:
-            # Unexpected error - rollback and re-raise
-            await session.rollback()
-            logger.error(
-                "ipfs.upload.failed",
-                token_id=attached_token.token_id,
-                error_type=type(e).__name__,
-                error_message=str(e),
-                attempt_number=attempt_number,
-            )
-            raise
+        # Log successful completion
+        duration = (time.monotonic_ns() - start_ns) / 1e9
+        logger.info(
+            "ipfs.upload.succeeded",
+            token_id=token.token_id,
+            image_cid=image_cid,
+            metadata_cid=metadata_cid,
+            duration_seconds=duration,
+            attempt_number=attempt_number,
+        )
+        return UploadResult(token, image_cid=image_cid, metadata_cid=metadata_cid)
+
+    except TransientError as e:
+        # Transient error (network timeout, rate limit, service unavailable)
+        # Retry infinitely via natural poll loop - no retry limits
+        message = short_error(e)
+        logger.warning(
+            "ipfs.transient_error",
+            token_id=token.token_id,
+            error_type="TransientError",
+            error_message=message,
+            attempt_number=attempt_number,
+        )
+        # Next poll will retry
+        return UploadResult(token, error=message)
+
+    except PermanentError as e:
+        # Permanent error (authentication, validation)
+        # Don't mark as failed - retry infinitely via polling loop
+        message = short_error(e)
+        logger.error(
+            "ipfs.permanent_error",
+            token_id=token.token_id,
+            error_type="PermanentError",
+            error_message=message,
+            attempt_number=attempt_number,
+            note="Token will be retried on next poll (infinite retries)",
+        )
+        return UploadResult(token, error=f"IPFS upload failed: {message}")
+
+    except ValueError as e:
+        # Missing data (e.g., no image_url)
+        # Don't mark as failed - retry infinitely via polling loop
+        message = short_error(e)
+        logger.error(
+            "ipfs.upload.failed",
+            token_id=token.token_id,
+            error_type="ValueError",
+            error_message=message,
+            attempt_number=attempt_number,
+            note="Token will be retried on next poll (infinite retries)",
+        )
+        return UploadResult(token, error=f"IPFS upload failed: {message}")
 
 
 async def process_batch(
     session_factory: Callable,
     settings: Settings,
-) -> None:
+    pinata: PinataClient,
+) -> bool:
     """Process a batch of tokens concurrently for IPFS upload.
 
-    Uses a temporary session to lock tokens via FOR UPDATE SKIP LOCKED,
-    then creates separate sessions for each token to ensure transaction isolation.
+    Uses a temporary session to lock tokens via FOR UPDATE SKIP LOCKED and
+    load their authors' social handles in one query. No session is held
+    during uploads; all outcomes are written afterwards in one transaction.
+
+    Tokens are handed out from a queue to PINATA_MAX_CONCURRENT_UPLOADS
+    consumers, so a large batch never runs more uploads at once than Pinata
+    is allowed to take.
+
+    Workflow:
+    1. Lock tokens and preload author handles (short read-only session)
+    2. Upload concurrently via the bounded consumer pool
+    3. Write all outcomes in one session: one executemany UPDATE for tokens,
+       one INSERT for audit records, one commit
+
+    If the batch is interrupted before step 3, its tokens stay 'uploading'
+    and are uploaded again on the next poll (re-pinning is idempotent).
 
     Args:
         session_factory: Factory function to create new database sessions
-        settings: Application settings (batch size, Pinata JWT)
+        settings: Application settings (batch size, Pinata JWT, upload concurrency)
+        pinata: Shared Pinata client used for every token in the batch
+
+    Returns:
+        True if any tokens were processed, False if the queue was empty
     """
-    # Lock tokens with temporary session
+    # Step 1: Lock tokens with temporary session
     async with session_factory() as lock_session:
         token_repo = TokenRepository(lock_session)
         tokens = await token_repo.get_pending_for_upload(limit=settings.worker_batch_size)
 
+        if not tokens:
+            # No tokens to process
+            return False
+
+        handles = await AuthorRepository(lock_session).get_social_handles_by_ids(
+            {token.author_id for token in tokens}
+        )
+
     # Session closed, tokens are now detached
 
-    if not tokens:
-        # No tokens to process
-        return
+    # Step 2: Process tokens with a bounded pool: at most this many tokens are
+    # in flight, whatever the batch size
+    pending: asyncio.Queue[Token] = asyncio.Queue()
+    for token in tokens:
+        pending.put_nowait(token)
+    results: list[UploadResult] = []
 
-    # Process tokens concurrently (each gets its own session)
-    tasks = [process_single_token(token, session_factory, settings) for token in tokens]
+    async def upload_worker() -> None:
+        while not pending.empty():
+            token = pending.get_nowait()
+            try:
+                results.append(
+                    await process_single_token(
+                        token,
+                        settings,
+                        pinata,
+                        handles.get(token.author_id, (None, None)),
+                    )
+                )
+            except Exception as e:
+                # Successes/handled failures are logged in process_single_token
+                logger.error(
+                    "ipfs.upload.failed",
+                    token_id=token.token_id,
+                    error=short_error(e),
+                    error_type=type(e).__name__,
+                )
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    pool_size = min(settings.pinata_max_concurrent_uploads, len(tokens))
+    await asyncio.gather(*(upload_worker() for _ in range(pool_size)))
 
-    # Log errors (successes are logged in process_single_token)
-    for token, result in zip(tokens, results):
-        if isinstance(result, Exception):
-            logger.error(
-                "ipfs.upload.failed",
-                token_id=token.token_id,
-                error=str(result),
-                error_type=type(result).__name__,
+    # Step 3: Write every outcome in one transaction
+    if results:
+        async with session_factory() as session:
+            await TokenRepository(session).bulk_update_upload_results(
+                [result.to_row() for result in results]
+            )
+            await IPFSUploadRecordRepository(session).create_many(
+                [record for result in results for record in result.audit_records()]
             )
+            await session.commit()
+
+    return True
 
 
 async def recover_orphaned_tokens(session: AsyncSession) -> None:
@@ -329,14 +376,20 @@ async def recover_orphaned_tokens(session: AsyncSession) -> None:
 async def run_ipfs_upload_worker(
     session_factory: Callable,
     settings: Settings,
+    pinata: PinataClient | None = None,
 ) -> None:
     """Main worker loop for IPFS upload.
 
-    Polls at POLL_INTERVAL_SECONDS, processes batches, and handles graceful shutdown.
+    Wakes immediately on NOTIFY token_uploading (sent by the image generation
+    worker when it commits generated images) and otherwise polls as a safety
+    net: every POLL_INTERVAL_SECONDS after a non-empty batch, doubling per
+    empty batch up to MAX_POLL_INTERVAL_SECONDS. Handles graceful shutdown.
 
     Args:
         session_factory: Factory function that creates database sessions
         settings: Application settings (poll interval, batch size, Pinata JWT)
+        pinata: Application-scoped Pinata client (from the app lifespan). If None,
+            the worker creates its own and closes it when it stops.
     """
     # Startup recovery (no-op for IPFS upload)
     async with session_factory() as session:
@@ -349,14 +402,37 @@ async def run_ipfs_upload_worker(
         batch_size=settings.worker_batch_size,
     )
 
+    owns_pinata = pinata is None
+    if pinata is None:
+        pinata = PinataClient(
+            jwt_token=settings.pinata_jwt,
+            gateway_domain=settings.pinata_gateway,
+            max_concurrent_uploads=settings.pinata_max_concurrent_uploads,
+            requests_per_minute=settings.pinata_requests_per_minute,
+        )
+
+    wake = asyncio.Event()
+    listener_task = asyncio.create_task(
+        listen_for_notifications(settings.database_url, TOKEN_UPLOADING_CHANNEL, wake)
+    )
+    idle_count = 0
+
     try:
         while True:
             try:
-                # Process batch (creates sessions internally per token)
-                await process_batch(session_factory, settings)
+                # Notifications arriving during the batch trigger the next one
+                wake.clear()
+                did_work = await process_batch(session_factory, settings, pinata)
+
+                # Back off on an empty queue; reset as soon as there is work
+                idle_count = 0 if did_work else idle_count + 1
+                poll_interval = backoff_delay(
+                    settings.poll_interval_seconds, idle_count, MAX_POLL_INTERVAL_SECONDS
+                )
 
-                # Wait for next polling interval
-                await asyncio.sleep(settings.poll_interval_seconds)
+                # Wait for an upload notification or the poll timeout
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wake.wait(), timeout=poll_interval)
 
             except asyncio.CancelledError:
                 # Propagate cancellation for graceful shutdown
@@ -368,7 +444,7 @@ async def run_ipfs_upload_worker(
                     "worker.error",
                     worker_type="ipfs_upload",
                     error_type=type(e).__name__,
-                    error_message=str(e),
+                    error_message=short_error(e),
                     exc_info=True,
                 )
                 # Back off 5 seconds before retrying
@@ -378,3 +454,8 @@ async def run_ipfs_upload_worker(
         # Graceful shutdown
         logger.info("worker.stopped", worker_type="ipfs_upload")
         raise
+
+    finally:
+        listener_task.cancel()
+        if owns_pinata:
+            await pinata.aclose()
@@ -17,6 +17,7 @@ from glisk.models.token import Token, TokenStatus
 from glisk.repositories.reveal_tx import RevealTransactionRepository
 from glisk.repositories.token import TokenRepository
 from glisk.services.blockchain.keeper import KeeperService
+from glisk.services.blockchain.provider import create_web3, get_rpc_url
 from glisk.services.exceptions import GasEstimationError, PermanentError, TransientError
 
 logger = structlog.get_logger()
@@ -330,12 +331,12 @@ async def run_reveal_worker(
     batch_wait_time = settings.batch_reveal_wait_seconds
 
     # Initialize Web3 and keeper service
-    network_url_mapping = {
-        "BASE_SEPOLIA": f"https://base-sepolia.g.alchemy.com/v2/{settings.alchemy_api_key}",
-        "BASE_MAINNET": f"https://base-mainnet.g.alchemy.com/v2/{settings.alchemy_api_key}",
-    }
-    alchemy_rpc_url = network_url_mapping[settings.network]
-    w3 = Web3(Web3.HTTPProvider(alchemy_rpc_url))
+    alchemy_rpc_url = get_rpc_url(settings)
+    if alchemy_rpc_url is None:
+        raise ValueError(f"Unsupported network: {settings.network}")
+    w3 = create_web3(alchemy_rpc_url)
+    # Same Alchemy endpoint over websocket, used for newHeads-driven receipt detection
+    alchemy_ws_url = alchemy_rpc_url.replace("https://", "wss://", 1)
 
     keeper = KeeperService(
         w3=w3,
@@ -344,6 +345,7 @@ async def run_reveal_worker(
         gas_buffer_percentage=settings.reveal_gas_buffer - 1.0,  # Convert 1.2 -> 0.2
         transaction_timeout=settings.transaction_timeout_seconds,
         max_gas_price_gwei=settings.reveal_max_gas_price_gwei,
+        ws_url=alchemy_ws_url,
     )
 
     # Startup recovery: check for orphaned pending transactions
@@ -340,11 +340,11 @@ class TestQuickstartValidation:
         test_block = 12345678
 
         # Write checkpoint
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             await uow.system_state.set_state("last_processed_block", test_block)
 
         # Read checkpoint in new transaction
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             value = await uow.system_state.get_state("last_processed_block")
 
         assert value is not None
@@ -4,6 +4,8 @@ Tests focus on complex logic per constitution:
 - Case-insensitive wallet lookup
 - Mint event duplicate detection
 - System state UPSERT behavior
+- Bulk token insert conflict handling
+- Bulk image generation status/result updates
 
 Simple CRUD operations are not tested (trust SQLAlchemy/PostgreSQL).
 
@@ -18,9 +20,12 @@ import pytest
 
 from glisk.models.author import Author
 from glisk.models.mint_event import MintEvent
+from glisk.models.token import Token, TokenStatus
 from glisk.repositories.author import AuthorRepository
+from glisk.repositories.ipfs_record import IPFSUploadRecordRepository
 from glisk.repositories.mint_event import MintEventRepository
 from glisk.repositories.system_state import SystemStateRepository
+from glisk.repositories.token import TokenRepository
 
 
 @pytest.mark.asyncio
@@ -53,6 +58,38 @@ async def test_case_insensitive_wallet_lookup(session):
     assert found.wallet_address == author.wallet_address
 
 
+@pytest.mark.asyncio
+async def test_bulk_wallet_lookup(session):
+    """Test AuthorRepository.get_by_wallets resolves many wallets case-insensitively.
+
+    Scenario:
+    1. Create two authors with mixed-case wallets
+    2. Query with one lowercase, one uppercase and one unknown wallet
+    3. Assert both authors found, keyed by lowercase wallet; unknown omitted
+    """
+    author1 = Author(wallet_address="0xABCdef1234567890123456789012345678901234")
+    author2 = Author(wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0")
+    session.add_all([author1, author2])
+    await session.commit()
+
+    author_repo = AuthorRepository(session)
+    found = await author_repo.get_by_wallets(
+        {
+            "0xabcdef1234567890123456789012345678901234",
+            "0x742D35CC6634C0532925A3B844BC9E7595F0BEB0",
+            "0x2222222222222222222222222222222222222222",
+        }
+    )
+
+    # Assertions
+    assert set(found) == {
+        "0xabcdef1234567890123456789012345678901234",
+        "0x742d35cc6634c0532925a3b844bc9e7595f0beb0",
+    }
+    assert found["0xabcdef1234567890123456789012345678901234"].id == author1.id
+    assert found["0x742d35cc6634c0532925a3b844bc9e7595f0beb0"].id == author2.id
+
+
 @pytest.mark.asyncio
 async def test_mint_event_duplicate_detection(session):
     """Test MintEventRepository.exists detects duplicate events.
@@ -132,3 +169,222 @@ async def test_system_state_upsert(session):
     all_keys = await state_repo.list_all_keys()
     assert "test_key" in all_keys
     assert len([k for k in all_keys if k == "test_key"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bulk_insert_skips_existing(session):
+    """Test TokenRepository.bulk_insert_missing ignores existing token IDs.
+
+    Scenario:
+    1. Create token with token_id=1 (e.g. inserted by webhook)
+    2. Bulk insert tokens [1, 2, 3]
+    3. Assert only {2, 3} reported as inserted
+    4. Assert existing token 1 was not overwritten
+
+    This lets recovery insert all gaps in one statement without failing on
+    tokens created concurrently.
+    """
+    author = Author(
+        wallet_address="0x1111111111111111111111111111111111111111",
+        prompt_text="Test prompt",
+    )
+    session.add(author)
+    await session.flush()
+
+    existing = Token(token_id=1, author_id=author.id, status=TokenStatus.UPLOADING)
+    session.add(existing)
+    await session.commit()
+
+    token_repo = TokenRepository(session)
+    inserted = await token_repo.bulk_insert_missing(
+        [
+            (1, author.id, TokenStatus.DETECTED, None),
+            (2, author.id, TokenStatus.DETECTED, None),
+            (3, author.id, TokenStatus.REVEALED, "QmTest3"),
+        ]
+    )
+    await session.commit()
+
+    # Assertions
+    assert inserted == {2, 3}
+    token1 = await token_repo.get_by_token_id(1)
+    assert token1 is not None
+    assert token1.status == TokenStatus.UPLOADING, "Existing token should be untouched"
+    token3 = await token_repo.get_by_token_id(3)
+    assert token3 is not None
+    assert token3.status == TokenStatus.REVEALED
+    assert token3.metadata_cid == "QmTest3"
+
+
+@pytest.mark.asyncio
+async def test_token_bulk_generation_updates(session):
+    """Test TokenRepository bulk claim + bulk result write used by the image worker.
+
+    Scenario:
+    1. Create two detected tokens
+    2. claim_batch_for_generation claims both (detected → generating), not the
+       uploading one
+    3. bulk_update_generation_results writes a success and a retry in one call
+    4. Assert per-row values were applied
+    """
+    author = Author(
+        wallet_address="0x2222222222222222222222222222222222222222",
+        prompt_text="Test prompt",
+    )
+    session.add(author)
+    await session.flush()
+
+    ok = Token(token_id=10, author_id=author.id, status=TokenStatus.DETECTED)
+    retry = Token(token_id=11, author_id=author.id, status=TokenStatus.DETECTED)
+    other = Token(token_id=12, author_id=author.id, status=TokenStatus.UPLOADING)
+    session.add_all([ok, retry, other])
+    await session.commit()
+
+    token_repo = TokenRepository(session)
+    claimed = await token_repo.claim_batch_for_generation(limit=10)
+    await session.commit()
+
+    assert {token.token_id for token in claimed} == {10, 11}
+    assert all(token.status == TokenStatus.GENERATING for token in claimed)
+
+    await token_repo.bulk_update_generation_results(
+        [
+            {
+                "id": ok.id,
+                "status": TokenStatus.UPLOADING,
+                "image_url": "https://replicate.delivery/test.png",
+                "generation_attempts": 0,
+                "generation_error": None,
+            },
+            {
+                "id": retry.id,
+                "status": TokenStatus.DETECTED,
+                "image_url": None,
+                "generation_attempts": 1,
+                "generation_error": "Replicate timeout",
+            },
+        ]
+    )
+    await session.commit()
+    session.expire_all()
+
+    # Assertions
+    token10 = await token_repo.get_by_token_id(10)
+    assert token10 is not None
+    assert token10.status == TokenStatus.UPLOADING
+    assert token10.image_url == "https://replicate.delivery/test.png"
+    token11 = await token_repo.get_by_token_id(11)
+    assert token11 is not None
+    assert token11.status == TokenStatus.DETECTED
+    assert token11.generation_attempts == 1
+    assert token11.generation_error == "Replicate timeout"
+
+
+@pytest.mark.asyncio
+async def test_token_bulk_upload_updates(session):
+    """Test the batch write used by the IPFS upload worker.
+
+    Scenario:
+    1. Create two uploading tokens
+    2. bulk_update_upload_results writes a success and a retry in one call
+    3. create_many inserts both audit records of the success in one call
+    4. Assert per-row values and audit records were applied
+    """
+    author = Author(
+        wallet_address="0x3333333333333333333333333333333333333333",
+        prompt_text="Test prompt",
+    )
+    session.add(author)
+    await session.flush()
+
+    ok = Token(token_id=20, author_id=author.id, status=TokenStatus.UPLOADING)
+    retry = Token(token_id=21, author_id=author.id, status=TokenStatus.UPLOADING)
+    session.add_all([ok, retry])
+    await session.commit()
+
+    token_repo = TokenRepository(session)
+    ipfs_repo = IPFSUploadRecordRepository(session)
+    await token_repo.bulk_update_upload_results(
+        [
+            {
+                "id": ok.id,
+                "status": TokenStatus.READY,
+                "image_cid": "bafkreiimage",
+                "metadata_cid": "bafkreimetadata",
+                "generation_attempts": 0,
+                "generation_error": None,
+            },
+            {
+                "id": retry.id,
+                "status": TokenStatus.UPLOADING,
+                "image_cid": None,
+                "metadata_cid": None,
+                "generation_attempts": 1,
+                "generation_error": "Rate limit exceeded",
+            },
+        ]
+    )
+    await ipfs_repo.create_many(
+        [
+            {
+                "token_id": ok.id,
+                "record_type": record_type,
+                "cid": cid,
+                "status": "completed",
+                "retry_count": 0,
+            }
+            for record_type, cid in (("image", "bafkreiimage"), ("metadata", "bafkreimetadata"))
+        ]
+    )
+    await session.commit()
+    session.expire_all()
+
+    # Assertions
+    token20 = await token_repo.get_by_token_id(20)
+    assert token20 is not None
+    assert token20.status == TokenStatus.READY
+    assert token20.metadata_cid == "bafkreimetadata"
+    token21 = await token_repo.get_by_token_id(21)
+    assert token21 is not None
+    assert token21.status == TokenStatus.UPLOADING
+    assert token21.generation_attempts == 1
+    records = await ipfs_repo.get_by_token(ok.id)
+    assert {(record.record_type, record.cid) for record in records} == {
+        ("image", "bafkreiimage"),
+        ("metadata", "bafkreimetadata"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_token_reset_generating(session):
+    """Test TokenRepository.reset_generating() used after a failed outcome flush.
+
+    Scenario:
+    1. Create a generating token and an uploading token
+    2. reset_generating is called with both ids
+    3. Only the generating token goes back to detected
+    """
+    author = Author(
+        wallet_address="0x4444444444444444444444444444444444444444",
+        prompt_text="Test prompt",
+    )
+    session.add(author)
+    await session.flush()
+
+    stuck = Token(token_id=30, author_id=author.id, status=TokenStatus.GENERATING)
+    written = Token(token_id=31, author_id=author.id, status=TokenStatus.UPLOADING)
+    session.add_all([stuck, written])
+    await session.commit()
+
+    token_repo = TokenRepository(session)
+    await token_repo.reset_generating([stuck.id, written.id])
+    await session.commit()
+    session.expire_all()
+
+    # Assertions
+    token30 = await token_repo.get_by_token_id(30)
+    assert token30 is not None
+    assert token30.status == TokenStatus.DETECTED
+    token31 = await token_repo.get_by_token_id(31)
+    assert token31 is not None
+    assert token31.status == TokenStatus.UPLOADING
@@ -9,6 +9,7 @@ Tests cover:
 from unittest.mock import Mock, patch
 
 import pytest
+from eth_abi import encode
 from web3 import Web3
 from web3.exceptions import BadFunctionCallOutput
 
@@ -336,6 +337,46 @@ async def test_get_next_token_id_retry_exhausted(mock_settings):
         assert mock_contract.functions.nextTokenId.return_value.call.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_read_view_calls_falls_back_without_multicall(mock_settings):
+    """Test _read_view_calls() fallback when Multicall3 is not deployed.
+
+    Scenario:
+    1. Mock _aggregate3_chunk to raise BadFunctionCallOutput (no code at address)
+    2. Reads should fall back to _batch_request_chunk and return its results
+    3. multicall_available stays False: the next read skips Multicall3 entirely
+    """
+    mock_w3 = Mock()
+    mock_w3.is_connected.return_value = True
+
+    with patch("glisk.services.blockchain.token_recovery.Web3") as MockWeb3:
+        MockWeb3.to_checksum_address.return_value = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+        service = TokenRecoveryService(
+            w3=mock_w3,
+            contract_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
+            settings=mock_settings,
+        )
+        assert service.multicall_available is True
+
+        calls = [("isRevealed", 1), ("isRevealed", 2)]
+        with (
+            patch.object(
+                service,
+                "_aggregate3_chunk",
+                side_effect=BadFunctionCallOutput("No code at Multicall3 address"),
+            ) as aggregate3,
+            patch.object(service, "_batch_request_chunk", return_value=[True, False]) as batch,
+        ):
+            assert await service._read_view_calls(calls, 100) == [True, False]
+            assert service.multicall_available is False
+
+            assert await service._read_view_calls(calls, 101) == [True, False]
+
+        assert aggregate3.call_count == 1
+        assert batch.call_count == 2
+
+
 # ====================
 # T017: Integration test for full recovery flow
 # ====================
@@ -348,16 +389,16 @@ async def test_full_recovery_flow_integration(uow_factory, mock_settings):
     Scenario:
     1. Seed database with tokens [1, 2, 3, 6, 7, 8] and authors
     2. Mock contract.nextTokenId() to return 11 (tokens 1-10 should exist)
-    3. Mock contract.tokenPromptAuthor() to return author addresses
-    4. Mock isRevealed() - tokens 4, 5 are revealed, 9, 10 are not
-    5. Mock tokenURI() for revealed tokens
+    3. Mock Multicall3.aggregate3() answering tokenPromptAuthor() with author addresses
+    4. ...isRevealed() - tokens 4, 5 are revealed, 9, 10 are not
+    5. ...tokenURI() - real URI for revealed tokens, placeholder for the rest
     6. Run recovery
     7. Verify tokens [4, 5, 9, 10] created with correct status (REVEALED or DETECTED)
     8. Verify metadata_cid extracted for revealed tokens
     9. Verify all tokens have correct author_id from contract
     """
     # Create authors
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         author1 = Author(
             wallet_address="0x1111111111111111111111111111111111111111",
             prompt_text="Test prompt for author 1",
@@ -383,42 +424,50 @@ async def test_full_recovery_flow_integration(uow_factory, mock_settings):
     # Mock Web3 and contract
     mock_w3 = Mock()
     mock_w3.is_connected.return_value = True
+    mock_w3.eth.block_number = 12345
 
     mock_contract = Mock()
     # Mock nextTokenId() to return 11 (tokens 1-10 should exist)
     mock_contract.functions.nextTokenId.return_value.call.return_value = 11
 
-    # Mock tokenPromptAuthor() to return different authors for missing tokens
+    # Mock tokenPromptAuthor() - tokens 4, 5 by author1, tokens 9, 10 by author2
     def mock_token_prompt_author(token_id):
-        mock_call = Mock()
         if token_id in [4, 5]:
-            mock_call.call.return_value = "0x1111111111111111111111111111111111111111"
-        else:  # tokens 9, 10
-            mock_call.call.return_value = "0x2222222222222222222222222222222222222222"
-        return mock_call
-
-    mock_contract.functions.tokenPromptAuthor.side_effect = mock_token_prompt_author
+            return "0x1111111111111111111111111111111111111111"
+        return "0x2222222222222222222222222222222222222222"
 
     # Mock isRevealed() - tokens 4, 5 are revealed, 9, 10 are not
     def mock_is_revealed(token_id):
-        mock_call = Mock()
-        mock_call.call.return_value = token_id in [4, 5]
-        return mock_call
-
-    mock_contract.functions.isRevealed.side_effect = mock_is_revealed
+        return token_id in [4, 5]
 
-    # Mock tokenURI() for revealed tokens
+    # Mock tokenURI() - unrevealed tokens return the shared placeholder URI
     def mock_token_uri(token_id):
-        mock_call = Mock()
         if token_id in [4, 5]:
-            mock_call.call.return_value = (
-                f"ipfs://QmTest{token_id}xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
-            )
-        else:
-            mock_call.call.return_value = ""  # Unrevealed tokens shouldn't call this
+            return f"ipfs://QmTest{token_id}xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+        return "ipfs://QmPlaceholderxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+
+    view_functions = {
+        "tokenPromptAuthor": ("address", mock_token_prompt_author),
+        "isRevealed": ("bool", mock_is_revealed),
+        "tokenURI": ("string", mock_token_uri),
+    }
+
+    selectors = {Web3.keccak(text=f"{fn_name}(uint256)")[:4]: fn_name for fn_name in view_functions}
+
+    # Mock Multicall3.aggregate3() - decode calldata and ABI-encode results like the real contract
+    def mock_aggregate3(calls):
+        results = []
+        for _target, _allow_failure, call_data in calls:
+            fn_name = selectors[call_data[:4]]
+            token_id = int.from_bytes(call_data[4:36], "big")
+            abi_type, fn = view_functions[fn_name]
+            results.append((True, encode([abi_type], [fn(token_id)])))
+        mock_call = Mock()
+        mock_call.call.return_value = results
         return mock_call
 
-    mock_contract.functions.tokenURI.side_effect = mock_token_uri
+    mock_multicall = Mock()
+    mock_multicall.functions.aggregate3.side_effect = mock_aggregate3
 
     # Initialize recovery service with mocked contract
     with patch("glisk.services.blockchain.token_recovery.Web3") as MockWeb3:
@@ -431,11 +480,17 @@ async def test_full_recovery_flow_integration(uow_factory, mock_settings):
             settings=mock_settings,
         )
         service.contract = mock_contract
+        service.multicall = mock_multicall
 
         # Run recovery
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             result = await service.recover_missing_tokens(uow=uow)
 
+        # Verify reads were pinned to the snapshot block
+        mock_contract.functions.nextTokenId.return_value.call.assert_called_once_with(
+            block_identifier=12345
+        )
+
         # Verify result
         assert result.total_on_chain == 10
         assert result.missing_count == 4
@@ -444,7 +499,7 @@ async def test_full_recovery_flow_integration(uow_factory, mock_settings):
         assert len(result.errors) == 0
 
         # Verify tokens were created
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             token4 = await uow.tokens.get_by_token_id(4)
             token5 = await uow.tokens.get_by_token_id(5)
             token9 = await uow.tokens.get_by_token_id(9)
@@ -485,7 +540,7 @@ async def test_recovery_with_no_gaps(uow_factory, mock_settings):
     4. Verify no tokens recovered (no gaps detected)
     """
     # Create author
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         author = Author(
             wallet_address="0x1111111111111111111111111111111111111111",
             prompt_text="Test prompt for no gaps test",
@@ -524,7 +579,7 @@ async def test_recovery_with_no_gaps(uow_factory, mock_settings):
         service.contract = mock_contract
 
         # Run recovery - should detect no gaps
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             result = await service.recover_missing_tokens(uow=uow)
 
         # Verify result shows no missing tokens
@@ -31,7 +31,7 @@ async def test_uow_commits_on_successful_exit(session):
     author_id = None
 
     # Make changes within UoW context
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         author = Author(
             wallet_address="0x1234567890123456789012345678901234567890",
             prompt_text="Test prompt",
@@ -43,7 +43,7 @@ async def test_uow_commits_on_successful_exit(session):
         # Context exits successfully - should commit
 
     # Verify changes persisted in a new UoW context
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         found_author = await uow.authors.get_by_id(author_id)
         assert found_author is not None
         assert found_author.wallet_address == "0x1234567890123456789012345678901234567890"
@@ -71,7 +71,7 @@ async def test_uow_rollback_on_exception(session):
     # Attempt to make changes but raise exception
     # Use pytest.raises to verify exception propagates correctly
     with pytest.raises(ValueError, match="Simulated error"):
-        async with await uow_factory() as uow:
+        async with uow_factory() as uow:
             author = Author(
                 wallet_address=author_wallet,
                 prompt_text="Test prompt",
@@ -84,7 +84,7 @@ async def test_uow_rollback_on_exception(session):
             raise ValueError("Simulated error")
 
     # Verify author does not exist (rollback occurred)
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         found_author = await uow.authors.get_by_wallet(author_wallet)
         assert found_author is None, "Author should not exist after rollback"
 
@@ -104,7 +104,7 @@ async def test_uow_provides_all_repositories(session):
     )
     uow_factory = create_uow_factory(session_factory)
 
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         # Verify all repositories are accessible
         assert hasattr(uow, "authors")
         assert hasattr(uow, "tokens")
@@ -143,7 +143,7 @@ async def test_uow_atomic_multi_repository_operation(session):
     token_id = None
 
     # Create author and token in same transaction
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         # Create author
         author = Author(
             wallet_address="0x1234567890123456789012345678901234567890",
@@ -164,7 +164,7 @@ async def test_uow_atomic_multi_repository_operation(session):
         # Both should commit together
 
     # Verify both exist in new context
-    async with await uow_factory() as uow:
+    async with uow_factory() as uow:
         found_author = await uow.authors.get_by_id(author_id)
         found_token = await uow.tokens.get_by_id(token_id)
 
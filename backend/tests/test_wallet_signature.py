@@ -3,11 +3,18 @@
 Tests EIP-191 signature verification using eth-account for wallet ownership validation.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_account.messages import _hash_eip191_message, encode_defunct
 
-from glisk.services.wallet_signature import verify_wallet_signature
+from glisk.services.wallet_signature import (
+    ERC1271_MAGIC_VALUE,
+    check_keccak_backend,
+    verify_wallet_signature,
+)
 
 
 class TestWalletSignatureVerification:
@@ -36,7 +43,8 @@ class TestWalletSignatureVerification:
             "account": account,
         }
 
-    def test_valid_signature_verification_succeeds(self, test_wallet):
+    @pytest.mark.asyncio
+    async def test_valid_signature_verification_succeeds(self, test_wallet):
         """Test that valid signature from correct wallet verifies successfully."""
         # Arrange
         message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -44,7 +52,7 @@ class TestWalletSignatureVerification:
         signed_message = test_wallet["account"].sign_message(message_hash)
 
         # Act
-        is_valid = verify_wallet_signature(
+        is_valid = await verify_wallet_signature(
             wallet_address=test_wallet["address"],
             message=message,
             signature=signed_message.signature.hex(),
@@ -53,7 +61,8 @@ class TestWalletSignatureVerification:
         # Assert
         assert is_valid is True
 
-    def test_invalid_signature_wrong_wallet_fails(self, test_wallet, different_wallet):
+    @pytest.mark.asyncio
+    async def test_invalid_signature_wrong_wallet_fails(self, test_wallet, different_wallet):
         """Test that signature from different wallet fails verification."""
         # Arrange: Sign message with different wallet
         message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -61,7 +70,7 @@ class TestWalletSignatureVerification:
         signed_message = different_wallet["account"].sign_message(message_hash)
 
         # Act: Try to verify with test_wallet address (should fail)
-        is_valid = verify_wallet_signature(
+        is_valid = await verify_wallet_signature(
             wallet_address=test_wallet["address"],
             message=message,
             signature=signed_message.signature.hex(),
@@ -70,7 +79,8 @@ class TestWalletSignatureVerification:
         # Assert
         assert is_valid is False
 
-    def test_malformed_signature_raises_value_error(self, test_wallet):
+    @pytest.mark.asyncio
+    async def test_malformed_signature_raises_value_error(self, test_wallet):
         """Test that malformed signature raises ValueError."""
         # Arrange
         message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -78,13 +88,14 @@ class TestWalletSignatureVerification:
 
         # Act & Assert
         with pytest.raises(ValueError, match="Invalid signature hex format"):
-            verify_wallet_signature(
+            await verify_wallet_signature(
                 wallet_address=test_wallet["address"],
                 message=message,
                 signature=malformed_signature,
             )
 
-    def test_checksummed_address_comparison(self, test_wallet):
+    @pytest.mark.asyncio
+    async def test_checksummed_address_comparison(self, test_wallet):
         """Test that signature verification works with checksummed addresses."""
         # Arrange
         message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -97,7 +108,7 @@ class TestWalletSignatureVerification:
 
         # Act & Assert - checksummed address should work
         assert (
-            verify_wallet_signature(
+            await verify_wallet_signature(
                 wallet_address=checksummed_address,
                 message=message,
                 signature=signed_message.signature.hex(),
@@ -107,7 +118,7 @@ class TestWalletSignatureVerification:
 
         # Act & Assert - lowercase address should also work (normalized to checksum)
         assert (
-            verify_wallet_signature(
+            await verify_wallet_signature(
                 wallet_address=lowercase_address,
                 message=message,
                 signature=signed_message.signature.hex(),
@@ -115,7 +126,8 @@ class TestWalletSignatureVerification:
             is True
         )
 
-    def test_wrong_message_fails_verification(self, test_wallet):
+    @pytest.mark.asyncio
+    async def test_wrong_message_fails_verification(self, test_wallet):
         """Test that signature for different message fails verification."""
         # Arrange: Sign one message
         original_message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -124,7 +136,7 @@ class TestWalletSignatureVerification:
 
         # Act: Try to verify with different message
         different_message = "Different message content"
-        is_valid = verify_wallet_signature(
+        is_valid = await verify_wallet_signature(
             wallet_address=test_wallet["address"],
             message=different_message,
             signature=signed_message.signature.hex(),
@@ -133,7 +145,8 @@ class TestWalletSignatureVerification:
         # Assert
         assert is_valid is False
 
-    def test_empty_signature_raises_value_error(self, test_wallet):
+    @pytest.mark.asyncio
+    async def test_empty_signature_raises_value_error(self, test_wallet):
         """Test that empty signature raises ValueError."""
         # Arrange
         message = "Update GLISK prompt for wallet: " + test_wallet["address"]
@@ -141,8 +154,91 @@ class TestWalletSignatureVerification:
 
         # Act & Assert
         with pytest.raises(ValueError):
-            verify_wallet_signature(
+            await verify_wallet_signature(
                 wallet_address=test_wallet["address"],
                 message=message,
                 signature=empty_signature,
             )
+
+    @pytest.mark.asyncio
+    async def test_malformed_wallet_address_rejected_without_recovery(self, test_wallet):
+        """Test that a malformed wallet address fails fast instead of raising."""
+        message = "Update GLISK prompt for wallet: " + test_wallet["address"]
+        signed_message = test_wallet["account"].sign_message(encode_defunct(text=message))
+
+        is_valid = await verify_wallet_signature(
+            wallet_address=test_wallet["address"][:-1] + "z",
+            message=message,
+            signature=signed_message.signature.hex(),
+        )
+
+        assert is_valid is False
+
+
+def test_keccak_backend_self_check():
+    """Test that a native eth-hash backend is active and passes the known-answer check."""
+    assert check_keccak_backend().startswith("eth_hash.backends.")
+
+
+class TestERC1271Verification:
+    """Test suite for ERC-1271 smart wallet signature verification."""
+
+    SMART_WALLET = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+    # Longer than 65 bytes -> routed to ERC-1271
+    SIGNATURE = "0x" + "ab" * 100
+
+    @pytest.fixture
+    def mock_w3(self):
+        """Mock Web3 whose wallet contract accepts every signature."""
+        w3 = MagicMock()
+        w3.eth.get_code.return_value = b"\x60\x80"
+        w3.eth.call.return_value = ERC1271_MAGIC_VALUE + b"\x00" * 28
+        return w3
+
+    @pytest.mark.asyncio
+    async def test_deployed_wallet_code_lookup_is_cached(self, mock_w3):
+        """Test that get_code is only called once per deployed wallet."""
+        for _ in range(3):
+            assert await verify_wallet_signature(
+                wallet_address=self.SMART_WALLET,
+                message="Sign in to GLISK",
+                signature=self.SIGNATURE,
+                w3=mock_w3,
+            )
+
+        assert mock_w3.eth.get_code.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_is_valid_signature_calldata_matches_abi_encoding(self, mock_w3):
+        """Test that hand-built calldata equals the ABI-encoded isValidSignature call."""
+        message = "Sign in to GLISK"
+        await verify_wallet_signature(
+            wallet_address=self.SMART_WALLET,
+            message=message,
+            signature=self.SIGNATURE,
+            w3=mock_w3,
+        )
+
+        message_hash = _hash_eip191_message(encode_defunct(text=message))
+        signature_bytes = bytes.fromhex(self.SIGNATURE.removeprefix("0x"))
+        expected = ERC1271_MAGIC_VALUE + abi_encode(
+            ["bytes32", "bytes"], [message_hash, signature_bytes]
+        )
+        call_args = mock_w3.eth.call.call_args.args[0]
+        assert call_args["data"] == expected
+
+    @pytest.mark.asyncio
+    async def test_undeployed_wallet_is_not_cached(self, mock_w3):
+        """Test that undeployed wallets are re-checked (they may deploy later)."""
+        mock_w3.eth.get_code.return_value = b""
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not deployed"):
+                await verify_wallet_signature(
+                    wallet_address=self.SMART_WALLET,
+                    message="Sign in to GLISK",
+                    signature=self.SIGNATURE,
+                    w3=mock_w3,
+                )
+
+        assert mock_w3.eth.get_code.call_count == 2